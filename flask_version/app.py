@@ -4,13 +4,23 @@ Converts the tkinter-based GUI to a web interface while preserving all backend f
 """
 
 import os
+import re
+import gzip
+import sys
 import json
 import uuid
 import shutil
+import threading
+import traceback
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_file, session, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, send_file, session, redirect, url_for
+from flask.json.provider import JSONProvider
 
+import orjson
 import pandas as pd
 import numpy as np
 from openpyxl.styles import PatternFill, Font
@@ -25,9 +35,20 @@ from parsers import (
 )
 from excel_charts import create_tolerance_charts, apply_channel_colors_to_results, create_deviation_charts
 from html_report import create_html_report
-from utils import get_versioned_filename
+from utils import get_versioned_filename, CHANNEL_COLORS_HEX
+
+class OrJSONProvider(JSONProvider):
+    """Serve jsonify() responses and parse request.json with orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', os.urandom(24))
 
 # Configuration
@@ -40,6 +61,141 @@ app.config['UPLOAD_FOLDER'] = str(UPLOAD_FOLDER)
 app.config['OUTPUT_FOLDER'] = str(OUTPUT_FOLDER)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max upload
 app.config['SESSION_COOKIE_SECURE'] = os.environ.get('RENDER', False)  # Secure cookies on Render
+# Let a fronting nginx/apache stream report files (X-Sendfile) when deployed behind one
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+# Opt-in: estimate StdDev on a decimated view for very large CSV captures
+app.config['FAST_STATS'] = os.environ.get('FAST_STATS', '').lower() in ('1', 'true', 'yes')
+# Opt-in: store HTML reports gzip-compressed (*.html.gz) and serve them pre-compressed
+app.config['GZIP_REPORTS'] = os.environ.get('GZIP_REPORTS', '').lower() in ('1', 'true', 'yes')
+
+# Compress JSON/HTML responses when Flask-Compress is installed
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+except ImportError:
+    pass
+
+UPLOAD_COPY_BUFSIZE = 1024 * 1024  # 1 MiB chunks when streaming uploads to disk
+PARALLEL_CLEANUP_THRESHOLD = 32  # Delete old uploads in parallel above this many files
+MAX_CONFIG_BYTES = 5 * 1024 * 1024  # Reject uploaded configs larger than 5 MiB
+FAST_STATS_MAX_SAMPLES = 50_000  # Decimate StdDev input above this many samples (FAST_STATS only)
+
+# Static layout shared by every PDF chart; only title/axes/shapes change per chart.
+# The plotly_white template is spliced in pre-serialized by figure_spec(), so figures carry an empty one.
+_PDF_BASE_LAYOUT = dict(
+    showlegend=True,
+    legend=dict(font=dict(size=9)),
+    width=900,
+    height=500,
+    template='none',
+    margin=dict(l=60, r=150, t=50, b=80)  # Extra bottom margin for footer
+)
+
+# Results sheet PASS/FAIL styles
+_PASS_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+_PASS_FONT = Font(color='006100', bold=True)
+_FAIL_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+_FAIL_FONT = Font(color='9C0006', bold=True)
+
+# Column headers that identify the measurement column in CSV exports
+_MEASUREMENT_RE = re.compile(r'voltage|vdc|resistance|ohm|current|adc|measurement', re.IGNORECASE)
+
+
+_plotly_go = None
+_kaleido_scope = None
+_kaleido_lock = threading.Lock()
+
+# Single background worker for deleting discarded session folders
+_cleanup_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def get_plotly_go():
+    """Import plotly.graph_objects on first use and reuse the module afterwards."""
+    global _plotly_go
+    if _plotly_go is None:
+        import plotly.graph_objects as go
+        _plotly_go = go
+    return _plotly_go
+
+
+def get_kaleido_scope():
+    """Return the process-wide Kaleido scope, configured once for PDF export."""
+    global _kaleido_scope
+    if _kaleido_scope is None:
+        import plotly.io as pio
+        scope = pio.kaleido.scope
+        if scope is None:
+            raise ImportError('kaleido is not installed')
+        scope.mathjax = None  # Charts use no LaTeX; also avoids the "Loading [MathJax]" stamp in PDFs
+        scope.default_format = 'pdf'
+        _kaleido_scope = scope
+    return _kaleido_scope
+
+
+@lru_cache(maxsize=None)
+def pdf_template_fragment():
+    """The plotly_white template, serialized once per process for embedding in PDF figure specs."""
+    import plotly.io as pio
+    return orjson.Fragment(orjson.dumps(pio.templates['plotly_white'].to_plotly_json()))
+
+
+def figure_spec(fig):
+    """
+    Serialize a figure to its Plotly JSON spec with orjson.
+    Numpy arrays are encoded natively, skipping plotly's per-value JSON cleanup pass.
+    """
+    spec = fig.to_plotly_json()
+    spec['layout']['template'] = pdf_template_fragment()
+    return orjson.dumps(spec, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=256)
+def render_pdf_bytes(fig_json):
+    """Render a figure, given as its Plotly JSON, to PDF bytes. Identical charts are served from cache."""
+    figure = orjson.loads(fig_json)
+    scope = get_kaleido_scope()
+    # One persistent Kaleido subprocess serves every request; it handles one figure at a time
+    with _kaleido_lock:
+        return scope.transform(figure, format='pdf')
+
+
+def error_response(message):
+    """
+    Build the JSON 500 response for an unexpected exception.
+    The traceback is logged, and only included in the payload in debug mode.
+    """
+    app.logger.exception(message)
+    payload = {'error': message}
+    if app.debug:
+        payload['traceback'] = traceback.format_exc()
+    return jsonify(payload), 500
+
+
+def send_gzipped_file(gz_path, filename, as_attachment=False):
+    """
+    Serve a file stored gzip-compressed under its uncompressed name.
+    Clients that accept gzip get the stored bytes as-is; others get it decompressed on the fly.
+    """
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if 'gzip' in request.accept_encodings:
+        response = send_file(gz_path, mimetype=mimetype, as_attachment=as_attachment,
+                             download_name=filename, conditional=True)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    def generate():
+        with gzip.open(gz_path, 'rb') as f:
+            while chunk := f.read(UPLOAD_COPY_BUFSIZE):
+                yield chunk
+
+    response = Response(generate(), mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    if as_attachment:
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+    return response
 
 
 def get_session_folder():
@@ -62,6 +218,30 @@ def get_output_folder():
     return output_folder
 
 
+def save_upload(file, file_path):
+    """Stream an uploaded file to disk with a single unbuffered file handle."""
+    with open(file_path, 'wb', buffering=0) as out:
+        shutil.copyfileobj(file.stream, out, length=UPLOAD_COPY_BUFSIZE)
+
+
+def discard_folder(folder):
+    """Rename a folder out of the way and delete it in the background."""
+    discarded = f'{folder}.gc-{uuid.uuid4().hex}'
+    os.rename(folder, discarded)
+    _cleanup_executor.submit(shutil.rmtree, discarded, ignore_errors=True)
+
+
+def clear_folder(folder):
+    """Delete previous uploads, in parallel when the folder holds many files."""
+    old_files = list(folder.iterdir())
+    if len(old_files) > PARALLEL_CLEANUP_THRESHOLD:
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(Path.unlink, old_files))
+    else:
+        for old_file in old_files:
+            old_file.unlink()
+
+
 @app.route('/')
 def index():
     """Landing page with mode selection."""
@@ -423,8 +603,7 @@ def process_comparison():
         })
         
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return error_response(str(e))
 
 
 def create_comparison_html_report(df, unit, output_folder, selected_channels, files_info, group_by='sample', equipment_type=None):
@@ -440,8 +619,6 @@ def create_comparison_html_report(df, unit, output_folder, selected_channels, fi
     - group_by: 'sample' (group by equipment sample) or 'channel' (group by channel number)
     - equipment_type: Equipment type/model for report title
     """
-    from utils import CHANNEL_COLORS_HEX
-    
     # Use equipment type for filename if available
     report_name = equipment_type if equipment_type else 'comparison'
     
@@ -469,11 +646,9 @@ def create_comparison_html_report(df, unit, output_folder, selected_channels, fi
     
     # Build chart data for each combination
     charts_data = []
+    item_cols = ['Sample ID', 'Channel', 'Error', 'Error-2σ', 'Error+2σ', 'Mean Check', 'Mean±2σ Check']
     
-    for _, combo_row in unique_combinations.iterrows():
-        test_value = combo_row[f'Test Value [{unit}]']
-        range_setting = combo_row['Range Setting']
-        io_type = combo_row['I/O Type']
+    for test_value, range_setting, io_type, _count in unique_combinations.itertuples(index=False, name=None):
         
         mask = (
             (df[f'Test Value [{unit}]'] == test_value) &
@@ -510,16 +685,16 @@ def create_comparison_html_report(df, unit, output_folder, selected_channels, fi
                     continue
                 
                 items_data = []
-                for _, row in sample_data.iterrows():
+                for _, channel, error, err_lo, err_hi, mean_check, sigma_check in sample_data[item_cols].itertuples(index=False, name=None):
                     items_data.append({
-                        'label': f"CH{int(row['Channel'])}",
-                        'channel': int(row['Channel']),
+                        'label': f"CH{int(channel)}",
+                        'channel': int(channel),
                         'sample_id': sample_id,
-                        'error': row['Error'],
-                        'error_minus_2sigma': row['Error-2σ'],
-                        'error_plus_2sigma': row['Error+2σ'],
-                        'mean_check': row['Mean Check'],
-                        'sigma_check': row['Mean±2σ Check']
+                        'error': error,
+                        'error_minus_2sigma': err_lo,
+                        'error_plus_2sigma': err_hi,
+                        'mean_check': mean_check,
+                        'sigma_check': sigma_check
                     })
                 
                 chart_info['groups'].append({
@@ -536,16 +711,16 @@ def create_comparison_html_report(df, unit, output_folder, selected_channels, fi
                     continue
                 
                 items_data = []
-                for _, row in channel_data.iterrows():
+                for sample_id, channel, error, err_lo, err_hi, mean_check, sigma_check in channel_data[item_cols].itertuples(index=False, name=None):
                     items_data.append({
-                        'label': row['Sample ID'],
-                        'channel': int(row['Channel']),
-                        'sample_id': row['Sample ID'],
-                        'error': row['Error'],
-                        'error_minus_2sigma': row['Error-2σ'],
-                        'error_plus_2sigma': row['Error+2σ'],
-                        'mean_check': row['Mean Check'],
-                        'sigma_check': row['Mean±2σ Check']
+                        'label': sample_id,
+                        'channel': int(channel),
+                        'sample_id': sample_id,
+                        'error': error,
+                        'error_minus_2sigma': err_lo,
+                        'error_plus_2sigma': err_hi,
+                        'mean_check': mean_check,
+                        'sigma_check': sigma_check
                     })
                 
                 chart_info['groups'].append({
@@ -586,19 +761,19 @@ def generate_comparison_html(charts_data, unit, legend_items, group_colors, file
             for ch in channel_ids
         ])
     
-    # Build charts HTML using Plotly
-    charts_html = ""
-    charts_js = ""
+    # Build charts HTML using Plotly (fragments are joined once at the end)
+    charts_html_parts = []
+    charts_js_parts = []
     
     for idx, chart in enumerate(charts_data):
         chart_id = f"chart_{idx}"
         
-        charts_html += f'''
+        charts_html_parts.append(f'''
         <div class="chart-container">
             <div class="chart-title {chart['io_type'].lower()}">{chart['title']}</div>
             <div class="chart-wrapper" id="{chart_id}"></div>
         </div>
-        '''
+        ''')
         
         # Build Plotly traces
         traces = []
@@ -736,12 +911,11 @@ def generate_comparison_html(charts_data, unit, legend_items, group_colors, file
             x_axis_title = 'Equipment Sample'
         
         # Convert to JSON for JavaScript
-        import json
         traces_json = json.dumps(traces)
         shapes_json = json.dumps(shapes)
         
         if group_by == 'sample':
-            charts_js += f'''
+            charts_js_parts.append(f'''
             Plotly.newPlot('{chart_id}', {traces_json}, {{
                 title: null,
                 xaxis: {{
@@ -762,9 +936,9 @@ def generate_comparison_html(charts_data, unit, legend_items, group_colors, file
                 margin: {{l: 60, r: 20, t: 30, b: 80}},
                 autosize: true
             }}, {{responsive: true}});
-            '''
+            ''')
         else:
-            charts_js += f'''
+            charts_js_parts.append(f'''
             Plotly.newPlot('{chart_id}', {traces_json}, {{
                 title: null,
                 xaxis: {{
@@ -787,7 +961,10 @@ def generate_comparison_html(charts_data, unit, legend_items, group_colors, file
                 margin: {{l: 60, r: 20, t: 30, b: 80}},
                 autosize: true
             }}, {{responsive: true}});
-            '''
+            ''')
+    
+    charts_html = ''.join(charts_html_parts)
+    charts_js = ''.join(charts_js_parts)
     
     # Grouping mode description
     if group_by == 'sample':
@@ -1052,8 +1229,7 @@ def upload_files():
     session_folder = get_session_folder()
     
     # Clear previous uploads
-    for old_file in session_folder.iterdir():
-        old_file.unlink()
+    clear_folder(session_folder)
     
     uploaded_files = []
     csv_count = 0
@@ -1074,7 +1250,7 @@ def upload_files():
                 continue  # Skip non-csv/txt files
             
             file_path = session_folder / filename
-            file.save(str(file_path))
+            save_upload(file, file_path)
             uploaded_files.append(filename)
             
             # Store original timestamp if provided (convert from ms to seconds)
@@ -1091,13 +1267,13 @@ def upload_files():
     unit = get_unit_from_files(str(session_folder))
     
     # Scan for measurement types in text files
-    txt_files = list(session_folder.glob('*.txt'))
+    txt_files = [Path(entry.path) for entry in scan_data_files(session_folder)[1]]
     file_measurement_types = {}
     
     for txt_file in txt_files:
         types = scan_text_file_for_measurement_types(txt_file)
         if types and len(types) > 1:
-            file_measurement_types[txt_file.name] = sorted(list(types))
+            file_measurement_types[txt_file.name] = sorted(types)
     
     # Extract test value configurations
     test_configs = extract_test_configs(session_folder, unit)
@@ -1127,10 +1303,29 @@ def upload_files():
     })
 
 
+def scan_data_files(input_dir):
+    """
+    List CSV and TXT files with a single directory scan.
+    Suffixes are matched case-insensitively, like the upload filter that saved the files.
+    Returns: (csv_entries, txt_entries) as lists of os.DirEntry
+    """
+    csv_entries = []
+    txt_entries = []
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if name.endswith('.csv'):
+                csv_entries.append(entry)
+            elif name.endswith('.txt'):
+                txt_entries.append(entry)
+    return csv_entries, txt_entries
+
+
 def extract_test_configs(input_dir, unit):
     """Extract unique (test_value, range_setting, io_type) tuples from filenames."""
-    csv_files = list(Path(input_dir).glob('*.csv'))
-    txt_files = list(Path(input_dir).glob('*.txt'))
+    csv_entries, txt_entries = scan_data_files(input_dir)
+    csv_files = [Path(entry.path) for entry in csv_entries]
+    txt_files = [Path(entry.path) for entry in txt_entries]
     
     test_configs = []
     seen = set()
@@ -1139,6 +1334,9 @@ def extract_test_configs(input_dir, unit):
     for csv_file in csv_files:
         value, _, channel, range_setting = parse_filename(csv_file.name)
         if value is not None and channel is not None:
+            # Interned range strings make repeat keys hash/compare by identity
+            if range_setting is not None:
+                range_setting = sys.intern(range_setting)
             key = (value, range_setting, 'Output')
             if key not in seen:
                 seen.add(key)
@@ -1154,6 +1352,8 @@ def extract_test_configs(input_dir, unit):
     for txt_file in txt_files:
         value, _, _, range_setting = parse_filename(txt_file.name)
         if value is not None:
+            if range_setting is not None:
+                range_setting = sys.intern(range_setting)
             key = (value, range_setting, 'Input')
             if key not in seen:
                 seen.add(key)
@@ -1238,7 +1438,8 @@ def process_files():
         # Store output file paths in session
         session['output_files'] = {
             'excel': os.path.basename(output_file) if output_file else None,
-            'html': os.path.basename(html_file) if html_file else None,
+            # A compressed report is still linked by its .html name; the view/download routes find the .gz
+            'html': os.path.basename(html_file).removesuffix('.gz') if html_file else None,
             'equipment_name': equipment_name
         }
         
@@ -1249,8 +1450,17 @@ def process_files():
         })
         
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return error_response(str(e))
+
+
+def fast_measurement_stats(values):
+    """
+    Summary statistics for very large sample arrays.
+    Mean, min and max are exact; StdDev is computed on a uniformly decimated view.
+    Returns: (mean, std, min, max)
+    """
+    step = values.size // FAST_STATS_MAX_SAMPLES
+    return values.mean(), values[::step].std(ddof=1), values.min(), values.max()
 
 
 def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurement_type_selections=None, equipment_model=None, equipment_number=None, original_timestamps=None):
@@ -1269,8 +1479,9 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
     
     results = []
     
-    csv_files = list(Path(input_dir).glob('*.csv'))
-    txt_files = list(Path(input_dir).glob('*.txt'))
+    csv_entries, txt_entries = scan_data_files(input_dir)
+    csv_files = [Path(entry.path) for entry in csv_entries]
+    txt_files = [Path(entry.path) for entry in txt_entries]
     
     total_files = len(csv_files) + len(txt_files)
     if total_files == 0:
@@ -1320,9 +1531,10 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
                 data_file_timestamp = datetime.fromtimestamp(earliest_timestamp)
         
         # Fall back to file modification time if no original timestamps available
+        # (DirEntry.stat() reuses the metadata cached by the directory scan)
         if data_file_timestamp is None:
-            first_file = min(all_data_files, key=lambda f: f.stat().st_mtime)
-            data_file_timestamp = datetime.fromtimestamp(first_file.stat().st_mtime)
+            earliest_mtime = min(entry.stat().st_mtime for entry in csv_entries + txt_entries)
+            data_file_timestamp = datetime.fromtimestamp(earliest_mtime)
     
     # Process CSV files (output data)
     for csv_file in csv_files:
@@ -1334,12 +1546,7 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
         try:
             df = pd.read_csv(csv_file)
             
-            measurement_col = None
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                if any(keyword in col_lower for keyword in ['voltage', 'vdc', 'resistance', 'ohm', 'current', 'adc', 'measurement']):
-                    measurement_col = col
-                    break
+            measurement_col = next((col for col in df.columns if _MEASUREMENT_RE.search(col)), None)
             
             if measurement_col is None:
                 numeric_cols = df.select_dtypes(include=[np.number]).columns
@@ -1352,15 +1559,21 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
             if len(measurements) == 0:
                 continue
             
+            if app.config['FAST_STATS'] and len(measurements) > FAST_STATS_MAX_SAMPLES:
+                mean_val, std_val, min_val, max_val = fast_measurement_stats(measurements.to_numpy())
+            else:
+                mean_val, std_val = measurements.mean(), measurements.std()
+                min_val, max_val = measurements.min(), measurements.max()
+            
             result = {
                 'Channel': channel,
                 'I/O Type': 'Output',
                 'Range Setting': range_setting if range_setting else 'N/A',
                 f'Test Value [{unit}]': value,
-                f'Mean [{unit}]': measurements.mean(),
-                f'StdDev [{unit}]': measurements.std(),
-                f'Min [{unit}]': measurements.min(),
-                f'Max [{unit}]': measurements.max(),
+                f'Mean [{unit}]': mean_val,
+                f'StdDev [{unit}]': std_val,
+                f'Min [{unit}]': min_val,
+                f'Max [{unit}]': max_val,
                 'Samples': len(measurements),
                 '_range_key': range_setting
             }
@@ -1427,27 +1640,26 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
     
     # Add reference value, tolerance, and limits columns
     if user_inputs:
-        def get_user_config(row):
-            test_val = row[f'Test Value [{unit}]']
-            range_key = row['_range_key']
-            io_type = row['I/O Type']
-            key = (test_val, range_key, io_type)
-            return user_inputs.get(key, {})
-        
-        df_results['_config'] = df_results.apply(get_user_config, axis=1)
-        
-        df_results[f'Reference Value [{unit}]'] = df_results['_config'].apply(
-            lambda x: x.get('reference', np.nan) if x else np.nan
-        )
-        df_results[f'Tolerance [{unit}]'] = df_results['_config'].apply(
-            lambda x: x.get('tolerance', np.nan) if x else np.nan
-        )
-        
-        df_results['Range Setting'] = df_results.apply(
-            lambda row: row['_config'].get('range', row['Range Setting'])
-                        if row['_config'] and row['_config'].get('range') is not None
-                        else row['Range Setting'] if row['Range Setting'] != 'N/A' else 'N/A',
-            axis=1
+        # Look up every row's user config in one pass into plain arrays. Missing range keys
+        # come back from the DataFrame as NaN and are turned back into None for the lookup.
+        n_rows = len(df_results)
+        reference = np.full(n_rows, np.nan)
+        tolerance = np.full(n_rows, np.nan)
+        range_override = np.full(n_rows, None, dtype=object)
+        range_keys = df_results['_range_key'].astype(object)
+        range_keys = range_keys.where(range_keys.notna(), None)
+        keys = zip(df_results[f'Test Value [{unit}]'], range_keys, df_results['I/O Type'])
+        for row, key in enumerate(keys):
+            cfg = user_inputs.get(key)
+            if cfg:
+                reference[row] = cfg['reference']
+                tolerance[row] = cfg['tolerance']
+                range_override[row] = cfg['range']
+        
+        df_results[f'Reference Value [{unit}]'] = reference
+        df_results[f'Tolerance [{unit}]'] = tolerance
+        df_results['Range Setting'] = np.where(
+            np.equal(range_override, None), df_results['Range Setting'], range_override
         )
         
         # Calculate limits using reference value
@@ -1467,7 +1679,7 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
             axis=1
         )
         
-        df_results = df_results.drop(columns=['_config', '_range_key'])
+        df_results = df_results.drop(columns=['_range_key'])
         
         column_order = [
             'Channel', 'I/O Type', 'Range Setting', f'Test Value [{unit}]',
@@ -1496,19 +1708,20 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
             samples_col = 9
             pass_fail_cols = []
         
-        for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-            for cell in row:
-                if cell.column in numeric_cols:
-                    cell.number_format = '0.000000'
-                elif cell.column == samples_col:
-                    cell.number_format = '0'
-                elif cell.column in pass_fail_cols:
-                    if cell.value == 'PASS':
-                        cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                        cell.font = Font(color='006100', bold=True)
-                    elif cell.value == 'FAIL':
-                        cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                        cell.font = Font(color='9C0006', bold=True)
+        # Style only the columns that need it, one column at a time. Excel ignores a column's
+        # default format for cells that exist, so each written cell still gets its own.
+        for col_idx in numeric_cols + [samples_col]:
+            number_format = '0' if col_idx == samples_col else '0.000000'
+            for (cell,) in worksheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
+                cell.number_format = number_format
+        for col_idx in pass_fail_cols:
+            for (cell,) in worksheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
+                if cell.value == 'PASS':
+                    cell.fill = _PASS_FILL
+                    cell.font = _PASS_FONT
+                elif cell.value == 'FAIL':
+                    cell.fill = _FAIL_FILL
+                    cell.font = _FAIL_FONT
         
         for column in worksheet.columns:
             max_length = 0
@@ -1534,7 +1747,8 @@ def process_measurement_files(input_dir, output_dir, user_inputs, unit, measurem
         create_deviation_charts(output_file, df_results, unit)
         
         # Generate interactive HTML report
-        html_file = create_html_report(output_file, df_results, unit, data_file_timestamp, equipment_name)
+        html_file = create_html_report(output_file, df_results, unit, data_file_timestamp, equipment_name,
+                                       compress=app.config['GZIP_REPORTS'])
     
     return output_file, html_file, equipment_name
 
@@ -1552,13 +1766,14 @@ def results():
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download generated files."""
-    output_folder = get_output_folder()
-    file_path = output_folder / filename
+    file_path = os.path.join(os.fspath(get_output_folder()), filename)
     
-    if not file_path.exists():
+    if not os.path.isfile(file_path):
+        if os.path.isfile(file_path + '.gz'):
+            return send_gzipped_file(file_path + '.gz', filename, as_attachment=True)
         return jsonify({'error': 'File not found'}), 404
     
-    return send_file(str(file_path), as_attachment=True)
+    return send_file(file_path, as_attachment=True, conditional=True)
 
 
 @app.route('/generate-pdf/<html_filename>')
@@ -1567,12 +1782,11 @@ def generate_pdf(html_filename):
     output_folder = get_output_folder()
     html_path = output_folder / html_filename
     
-    if not html_path.exists():
+    if not html_path.exists() and not html_path.with_name(html_filename + '.gz').exists():
         return jsonify({'error': 'HTML file not found'}), 404
     
     try:
-        import plotly.graph_objects as go
-        import plotly.io as pio
+        go = get_plotly_go()
         
         # Generate PDF filename
         pdf_filename = html_filename.replace('.html', '.pdf')
@@ -1634,16 +1848,11 @@ def generate_pdf(html_filename):
         # Get unique test value + range + I/O type combinations
         unique_combos = df.groupby([f'Test Value [{unit}]', 'Range Setting', 'I/O Type']).size().reset_index()
         
-        from utils import CHANNEL_COLORS_HEX
-        
         # Create figures for each chart, tracking pass/fail status
         figs = []
         chart_results = []  # List of (fig, pass_status) tuples
         
-        for _, combo in unique_combos.iterrows():
-            test_value = combo[f'Test Value [{unit}]']
-            range_setting = combo['Range Setting']
-            io_type = combo['I/O Type']
+        for test_value, range_setting, io_type, _count in unique_combos.itertuples(index=False, name=None):
             
             mask = (
                 (df[f'Test Value [{unit}]'] == test_value) &
@@ -1655,7 +1864,7 @@ def generate_pdf(html_filename):
             if len(chart_data) == 0:
                 continue
             
-            fig = go.Figure()
+            fig = go.Figure(layout=_PDF_BASE_LAYOUT)
             
             # Get limits
             reference = chart_data[f'Reference Value [{unit}]'].iloc[0]
@@ -1667,80 +1876,66 @@ def generate_pdf(html_filename):
             x_range = [-0.5, len(channels) - 0.5]
             
             # Check if all data points are within tolerance
-            chart_pass = True
-            for _, row in chart_data.iterrows():
-                mean_val = row[f'Mean [{unit}]']
-                if mean_val < lower_limit or mean_val > upper_limit:
-                    chart_pass = False
-                    break
+            chart_means = chart_data[f'Mean [{unit}]']
+            chart_pass = bool(not ((chart_means < lower_limit) | (chart_means > upper_limit)).any())
             
-            # Upper limit
-            fig.add_trace(go.Scatter(
-                x=x_range, y=[upper_limit, upper_limit],
-                mode='lines', name=f'Upper Limit ({upper_limit:.4f})',
-                line=dict(color='#8B0000', width=2, dash='dash')
-            ))
+            # Limit and reference lines are drawn as layout shapes (labelled in the
+            # right margin) instead of full traces
+            shapes = []
+            annotations = []
+            for y_val, label, line in (
+                (upper_limit, f'Upper Limit ({upper_limit:.4f})', dict(color='#8B0000', width=2, dash='dash')),
+                (reference, f'Reference ({reference:.4f})', dict(color='#2E7D32', width=2)),
+                (lower_limit, f'Lower Limit ({lower_limit:.4f})', dict(color='#8B0000', width=2, dash='dash')),
+            ):
+                shapes.append(dict(type='line', xref='x', yref='y',
+                                   x0=x_range[0], x1=x_range[1], y0=y_val, y1=y_val, line=line))
+                annotations.append(dict(xref='paper', yref='y', x=1.01, y=y_val, xanchor='left',
+                                        text=label, showarrow=False, font=dict(size=9, color=line['color'])))
+            
+            # Collect channel data so each series is a single trace
+            x_labels = []
+            colors = []
+            means = []
+            lower_2sigma = []
+            upper_2sigma = []
+            point_rows = chart_data[['Channel', f'Mean [{unit}]', f'StdDev [{unit}]']].itertuples(index=False, name=None)
+            for i, (ch, mean_val, std_val) in enumerate(point_rows):
+                color = CHANNEL_COLORS_HEX[i % len(CHANNEL_COLORS_HEX)]
+                x_labels.append(f'CH{int(ch)}')
+                colors.append(color)
+                
+                means.append(mean_val)
+                lower_2sigma.append(mean_val - 2 * std_val)
+                upper_2sigma.append(mean_val + 2 * std_val)
+                
+                # Error bar (-2σ to +2σ)
+                shapes.append(dict(type='line', xref='x', yref='y', x0=i, x1=i,
+                                   y0=lower_2sigma[-1], y1=upper_2sigma[-1],
+                                   line=dict(color=color, width=2)))
             
-            # Reference line
+            x_positions = np.arange(len(x_labels))
+            
+            # Mean markers (diamond)
             fig.add_trace(go.Scatter(
-                x=x_range, y=[reference, reference],
-                mode='lines', name=f'Reference ({reference:.4f})',
-                line=dict(color='#2E7D32', width=2)
+                x=x_positions, y=means,
+                mode='markers',
+                name='Mean',
+                marker=dict(symbol='diamond', size=12, color=colors),
+                customdata=x_labels,
+                hovertemplate='%{customdata}<br>Mean: %{y:.6f}<extra></extra>'
             ))
             
-            # Lower limit
+            # Error bar endpoints
             fig.add_trace(go.Scatter(
-                x=x_range, y=[lower_limit, lower_limit],
-                mode='lines', name=f'Lower Limit ({lower_limit:.4f})',
-                line=dict(color='#8B0000', width=2, dash='dash')
+                x=np.tile(x_positions, 2), y=lower_2sigma + upper_2sigma,
+                mode='markers',
+                name='Mean ± 2σ',
+                marker=dict(symbol='line-ew', size=8, color=colors + colors, line=dict(width=2, color=colors + colors)),
+                customdata=[[label, 'Mean-2σ'] for label in x_labels] + [[label, 'Mean+2σ'] for label in x_labels],
+                hovertemplate='%{customdata[0]}<br>%{customdata[1]}: %{y:.6f}<extra></extra>'
             ))
             
-            # Add channel data
-            x_labels = []
-            for i, (_, row) in enumerate(chart_data.iterrows()):
-                color = CHANNEL_COLORS_HEX[i % len(CHANNEL_COLORS_HEX)]
-                ch = int(row['Channel'])
-                x_labels.append(f'CH{ch}')
-                
-                mean_val = row[f'Mean [{unit}]']
-                std_val = row[f'StdDev [{unit}]']
-                mean_minus_2sigma = mean_val - 2 * std_val
-                mean_plus_2sigma = mean_val + 2 * std_val
-                
-                # Mean marker (diamond)
-                fig.add_trace(go.Scatter(
-                    x=[i], y=[mean_val],
-                    mode='markers',
-                    name=f'CH{ch}',
-                    marker=dict(symbol='diamond', size=12, color=color),
-                    hovertemplate=f'CH{ch}<br>Mean: {mean_val:.6f}<extra></extra>'
-                ))
-                
-                # Error bars (-2σ to +2σ)
-                fig.add_trace(go.Scatter(
-                    x=[i, i], y=[mean_minus_2sigma, mean_plus_2sigma],
-                    mode='lines',
-                    line=dict(color=color, width=2),
-                    showlegend=False,
-                    hoverinfo='skip'
-                ))
-                
-                # Endpoints
-                fig.add_trace(go.Scatter(
-                    x=[i], y=[mean_minus_2sigma],
-                    mode='markers',
-                    marker=dict(symbol='line-ew', size=8, color=color, line=dict(width=2, color=color)),
-                    showlegend=False,
-                    hovertemplate=f'CH{ch}<br>Mean-2σ: {mean_minus_2sigma:.6f}<extra></extra>'
-                ))
-                fig.add_trace(go.Scatter(
-                    x=[i], y=[mean_plus_2sigma],
-                    mode='markers',
-                    marker=dict(symbol='line-ew', size=8, color=color, line=dict(width=2, color=color)),
-                    showlegend=False,
-                    hovertemplate=f'CH{ch}<br>Mean+2σ: {mean_plus_2sigma:.6f}<extra></extra>'
-                ))
-            
             # Chart title
             range_display = f", Range: {range_setting}" if range_setting != 'N/A' else ""
             title = f"Test: {test_value} {unit}{range_display} ({io_type})"
@@ -1750,16 +1945,13 @@ def generate_pdf(html_filename):
                 xaxis=dict(
                     title='Channel',
                     tickmode='array',
-                    tickvals=list(range(len(x_labels))),
-                    ticktext=x_labels
+                    tickvals=x_positions,
+                    ticktext=x_labels,
+                    range=x_range
                 ),
                 yaxis=dict(title=f'Value [{unit}]'),
-                showlegend=True,
-                legend=dict(font=dict(size=9)),
-                width=900,
-                height=500,
-                template='plotly_white',
-                margin=dict(l=60, r=150, t=50, b=80)  # Extra bottom margin for footer
+                shapes=shapes,
+                annotations=annotations
             )
             
             chart_results.append((fig, chart_pass))
@@ -1773,9 +1965,7 @@ def generate_pdf(html_filename):
         io_range_combos = df.groupby(['I/O Type', 'Range Setting']).size().reset_index()
         io_range_combos = io_range_combos.sort_values(['I/O Type', 'Range Setting'])
         
-        for _, combo in io_range_combos.iterrows():
-            io_type = combo['I/O Type']
-            range_setting = combo['Range Setting']
+        for io_type, range_setting, _count in io_range_combos.itertuples(index=False, name=None):
             
             mask = (df['I/O Type'] == io_type) & (df['Range Setting'] == range_setting)
             combo_data = df[mask].copy()
@@ -1785,7 +1975,7 @@ def generate_pdf(html_filename):
             
             channels = sorted(combo_data['Channel'].unique())
             
-            fig = go.Figure()
+            fig = go.Figure(layout=_PDF_BASE_LAYOUT)
             
             # Check pass/fail for deviation chart (all deviations within tolerance)
             chart_pass = True
@@ -1848,13 +2038,7 @@ def generate_pdf(html_filename):
             fig.update_layout(
                 title=dict(text=title, font=dict(size=14)),
                 xaxis=dict(title=f'Test Value [{unit}]'),
-                yaxis=dict(title=f'Deviation [{unit}]'),
-                showlegend=True,
-                legend=dict(font=dict(size=9)),
-                width=900,
-                height=500,
-                template='plotly_white',
-                margin=dict(l=60, r=150, t=50, b=80)  # Extra bottom margin for footer
+                yaxis=dict(title=f'Deviation [{unit}]')
             )
             
             chart_results.append((fig, chart_pass))
@@ -1863,7 +2047,7 @@ def generate_pdf(html_filename):
             return jsonify({'error': 'No charts to generate'}), 400
         
         # Export to PDF with footers
-        import tempfile
+        from io import BytesIO
         try:
             from pypdf import PdfWriter, PdfReader
         except ImportError:
@@ -1873,24 +2057,22 @@ def generate_pdf(html_filename):
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
             from reportlab.lib.colors import green, red, black
-            from io import BytesIO
             REPORTLAB_AVAILABLE = True
         except ImportError:
             REPORTLAB_AVAILABLE = False
         
         writer = PdfWriter()
-        temp_files = []
         
-        for i, (fig, chart_pass) in enumerate(chart_results):
-            temp_pdf = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
-            temp_files.append(temp_pdf.name)
-            fig.write_image(temp_pdf.name, format='pdf')
-            temp_pdf.close()
+        # The shared Kaleido scope renders one figure at a time, so pages are rendered in turn.
+        # They are kept as in-memory PDF bytes; nothing is written to disk until the merged output.
+        rendered_pdfs = [render_pdf_bytes(figure_spec(fig)) for fig, _ in chart_results]
         
         # Merge all PDFs and add footers
-        for idx, temp_file in enumerate(temp_files):
-            reader = PdfReader(temp_file)
-            for page in reader.pages:
+        for idx, pdf_bytes in enumerate(rendered_pdfs):
+            first_page = len(writer.pages)
+            writer.append(BytesIO(pdf_bytes))
+            for page_num in range(first_page, len(writer.pages)):
+                page = writer.pages[page_num]
                 # Get pass/fail status for this chart
                 _, chart_pass = chart_results[idx]
                 result_text = "PASS" if chart_pass else "FAIL"
@@ -1934,47 +2116,40 @@ def generate_pdf(html_filename):
                     # Merge overlay with page
                     overlay_reader = PdfReader(packet)
                     page.merge_page(overlay_reader.pages[0])
-                
-                writer.add_page(page)
         
-        with open(pdf_path, 'wb') as output:
+        with open(pdf_path, 'wb', buffering=1 << 20) as output:
             writer.write(output)
         
-        # Cleanup temp files
-        for temp_file in temp_files:
-            os.unlink(temp_file)
-        
-        return send_file(str(pdf_path), as_attachment=True, download_name=pdf_filename)
+        return send_file(str(pdf_path), as_attachment=True, download_name=pdf_filename, conditional=True)
         
     except ImportError as e:
         return jsonify({'error': f'PDF generation requires additional packages (kaleido, pypdf). Install with: pip install kaleido pypdf reportlab. Error: {str(e)}'}), 500
     except Exception as e:
-        import traceback
-        return jsonify({'error': f'PDF generation failed: {str(e)}', 'traceback': traceback.format_exc()}), 500
+        return error_response(f'PDF generation failed: {str(e)}')
 
 
 @app.route('/view/<filename>')
 def view_file(filename):
     """View HTML report in browser."""
-    output_folder = get_output_folder()
-    file_path = output_folder / filename
+    file_path = os.path.join(os.fspath(get_output_folder()), filename)
     
-    if not file_path.exists():
+    if not os.path.isfile(file_path):
+        if os.path.isfile(file_path + '.gz'):
+            return send_gzipped_file(file_path + '.gz', filename)
         return jsonify({'error': 'File not found'}), 404
     
-    return send_file(str(file_path))
+    return send_file(file_path, conditional=True)
 
 
 @app.route('/api/save-config', methods=['POST'])
 def save_config():
     """Save configuration to JSON file."""
     data = request.json
-    output_folder = get_output_folder()
+    config_file = os.path.join(os.fspath(get_output_folder()), 'test_config.json')
     
-    config_file = output_folder / 'test_config.json'
-    
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    with open(config_file, 'wb') as f:
+        # Sorted keys keep saved configs stable across saves (diff-friendly)
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
     
     return jsonify({
         'success': True,
@@ -1992,28 +2167,34 @@ def load_config():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
     
+    # Bounded read: one byte past the limit is enough to detect an oversized upload
+    content = file.stream.read(MAX_CONFIG_BYTES + 1)
+    if len(content) > MAX_CONFIG_BYTES:
+        return jsonify({'error': f'Config file exceeds {MAX_CONFIG_BYTES // (1024 * 1024)} MB limit'}), 413
+    
     try:
-        content = file.read().decode('utf-8')
-        config_data = json.loads(content)
-        return jsonify({
-            'success': True,
-            'config': config_data
-        })
-    except Exception as e:
+        # orjson parses the raw upload bytes; no intermediate decoded str copy
+        config_data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         return jsonify({'error': str(e)}), 400
+    
+    return jsonify({
+        'success': True,
+        'config': config_data
+    })
 
 
 @app.route('/api/reset')
 def reset_session():
     """Reset session and clean up files."""
     if 'session_id' in session:
-        session_folder = UPLOAD_FOLDER / session['session_id']
-        output_folder = OUTPUT_FOLDER / session['session_id']
+        session_folder = os.path.join(app.config['UPLOAD_FOLDER'], session['session_id'])
+        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session['session_id'])
         
-        if session_folder.exists():
-            shutil.rmtree(session_folder)
-        if output_folder.exists():
-            shutil.rmtree(output_folder)
+        if os.path.isdir(session_folder):
+            discard_folder(session_folder)
+        if os.path.isdir(output_folder):
+            discard_folder(output_folder)
     
     session.clear()
     return jsonify({'success': True})
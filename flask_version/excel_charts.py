@@ -4,35 +4,48 @@ from openpyxl.chart import ScatterChart, Reference, Series
 from openpyxl.chart.marker import Marker
 from openpyxl.chart.shapes import GraphicalProperties
 from openpyxl.drawing.line import LineProperties
+from functools import lru_cache
+
+import numpy as np
 from openpyxl.styles import Font, Alignment, PatternFill
 
 from utils import CHANNEL_COLORS  # Import shared constant
 
+# Shared cell styles: one object per style for the whole workbook instead of one per cell
+_HEADER_FONT = Font(bold=True, size=9)
+_PASS_FONT = Font(size=9, color='006100', bold=True)
+_FAIL_FONT = Font(size=9, color='9C0006', bold=True)
+_PASS_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+_FAIL_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+
+
+@lru_cache(maxsize=None)
+def _channel_font(color):
+    """Data-row font for one channel colour, created once per colour."""
+    return Font(size=9, color=color)
+
+
+@lru_cache(maxsize=None)
+def _recolored_font(name, size, bold, italic, color):
+    """A font with the given attributes, created once per distinct combination."""
+    return Font(name=name, size=size, bold=bold, italic=italic, color=color)
+
+
 def apply_channel_colors_to_results(excel_file, df_results, unit, color_assignments):
     """
     Apply channel colors to the Test Results sheet based on the color assignments
     from the tolerance charts.
     """
-    from openpyxl.styles import Font, PatternFill
-    
     wb = load_workbook(excel_file)
     ws = wb['Test Results']
     
     # Columns A to M (1 to 13)
     color_columns = list(range(1, 14))
     
-    # Iterate through data rows (skip header)
-    for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row), start=0):
-        if row_idx >= len(df_results):
-            break
-        
-        # Get the data for this row from the dataframe
-        row_data = df_results.iloc[row_idx]
-        channel = row_data['Channel']
-        io_type = row_data['I/O Type']
-        test_value = row_data[f'Test Value [{unit}]']
-        range_setting = row_data['Range Setting']
-        
+    # Iterate through data rows (skip header) alongside the matching dataframe rows;
+    # zip stops at whichever runs out first
+    key_rows = df_results[['Channel', 'I/O Type', f'Test Value [{unit}]', 'Range Setting']].itertuples(index=False, name=None)
+    for row, (channel, io_type, test_value, range_setting) in zip(ws.iter_rows(min_row=2, max_row=ws.max_row), key_rows):
         # Look up the color for this combination (range_setting is used as-is, including 'N/A')
         key = (channel, io_type, test_value, range_setting)
         color = color_assignments.get(key)
@@ -43,12 +56,12 @@ def apply_channel_colors_to_results(excel_file, df_results, unit, color_assignme
                 if cell.column in color_columns:
                     # Preserve existing formatting but change font color
                     current_font = cell.font
-                    cell.font = Font(
-                        name=current_font.name,
-                        size=current_font.size,
-                        bold=current_font.bold,
-                        italic=current_font.italic,
-                        color=color
+                    cell.font = _recolored_font(
+                        current_font.name,
+                        current_font.size,
+                        current_font.bold,
+                        current_font.italic,
+                        color
                     )
     
     wb.save(excel_file)
@@ -105,10 +118,7 @@ def create_tolerance_charts(excel_file, df_results, unit):
     
     from openpyxl.styles import Font, Alignment, PatternFill
     
-    for _, combo_row in unique_combinations.iterrows():
-        test_value = combo_row[f'Test Value [{unit}]']
-        range_setting = combo_row['Range Setting']
-        io_type = combo_row['I/O Type']
+    for test_value, range_setting, io_type, _count in unique_combinations.itertuples(index=False, name=None):
         
         mask = (
             (df_results[f'Test Value [{unit}]'] == test_value) &
@@ -128,8 +138,7 @@ def create_tolerance_charts(excel_file, df_results, unit):
         chart_title = f"Test: {test_value} {unit}{range_display} ({io_type})"
         
         title_row = row_offset + 1
-        chart_sheet.cell(title_row, col_offset + 1).value = chart_title
-        title_cell = chart_sheet.cell(title_row, col_offset + 1)
+        title_cell = chart_sheet.cell(title_row, col_offset + 1, chart_title)
         title_cell.font = Font(bold=True, size=11, color='1F4E78')
         title_cell.alignment = Alignment(horizontal='left')
         
@@ -139,8 +148,12 @@ def create_tolerance_charts(excel_file, df_results, unit):
         upper_limits = test_data[f'Upper Limit [{unit}]'].tolist()
         reference_values = test_data[f'Reference Value [{unit}]'].tolist()
         means = test_data[f'Mean [{unit}]'].tolist()
-        lower_2sigma = (test_data[f'Mean [{unit}]'] - 2*test_data[f'StdDev [{unit}]']).tolist()
-        upper_2sigma = (test_data[f'Mean [{unit}]'] + 2*test_data[f'StdDev [{unit}]']).tolist()
+        mean_arr = test_data[f'Mean [{unit}]'].to_numpy()
+        two_sigma = 2 * test_data[f'StdDev [{unit}]'].to_numpy()
+        lower_2sigma_arr = mean_arr - two_sigma
+        upper_2sigma_arr = mean_arr + two_sigma
+        lower_2sigma = lower_2sigma_arr.tolist()
+        upper_2sigma = upper_2sigma_arr.tolist()
         mean_checks = test_data['Mean Check'].tolist()
         mean_2sigma_checks = test_data['Mean±2σ Check'].tolist()
         
@@ -155,8 +168,7 @@ def create_tolerance_charts(excel_file, df_results, unit):
         # Write headers
         headers = ['Channel', 'Lower Limit', 'Reference', 'Upper Limit', 'Mean', 'Mean-2σ', 'Mean+2σ', 'Mean Check', 'Mean±2σ Check']
         for h_idx, header in enumerate(headers):
-            chart_sheet.cell(data_start_row, data_start_col + h_idx).value = header
-            chart_sheet.cell(data_start_row, data_start_col + h_idx).font = Font(bold=True, size=9)
+            chart_sheet.cell(data_start_row, data_start_col + h_idx, header).font = _HEADER_FONT
         
         # Write data with color-coded fonts
         for i, channel in enumerate(channels):
@@ -167,39 +179,34 @@ def create_tolerance_charts(excel_file, df_results, unit):
             color_assignments[(channel, io_type, test_value, range_setting)] = color
             
             # Apply color to all cells in this row
-            cell_font = Font(size=9, color=color)
+            cell_font = _channel_font(color)
             
             chart_sheet.cell(row, data_start_col, channel).font = cell_font
-            chart_sheet.cell(row, data_start_col + 1, lower_limits[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 1).number_format = '0.000000'
-            chart_sheet.cell(row, data_start_col + 2, reference_values[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 2).number_format = '0.000000'
-            chart_sheet.cell(row, data_start_col + 3, upper_limits[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 3).number_format = '0.000000'
-            chart_sheet.cell(row, data_start_col + 4, means[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 4).number_format = '0.000000'
-            chart_sheet.cell(row, data_start_col + 5, lower_2sigma[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 5).number_format = '0.000000'
-            chart_sheet.cell(row, data_start_col + 6, upper_2sigma[i]).font = cell_font
-            chart_sheet.cell(row, data_start_col + 6).number_format = '0.000000'
+            
+            # Numeric columns: one cell lookup each for value, font and number format
+            values = (lower_limits[i], reference_values[i], upper_limits[i], means[i], lower_2sigma[i], upper_2sigma[i])
+            for offset, value in enumerate(values, start=1):
+                cell = chart_sheet.cell(row, data_start_col + offset, value)
+                cell.font = cell_font
+                cell.number_format = '0.000000'
             
             # Mean Check column with PASS/FAIL formatting
             mean_check_cell = chart_sheet.cell(row, data_start_col + 7, mean_checks[i])
             if mean_checks[i] == 'PASS':
-                mean_check_cell.font = Font(size=9, color='006100', bold=True)
-                mean_check_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+                mean_check_cell.font = _PASS_FONT
+                mean_check_cell.fill = _PASS_FILL
             else:
-                mean_check_cell.font = Font(size=9, color='9C0006', bold=True)
-                mean_check_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+                mean_check_cell.font = _FAIL_FONT
+                mean_check_cell.fill = _FAIL_FILL
             
             # Mean±2σ Check column with PASS/FAIL formatting
             mean_2sigma_check_cell = chart_sheet.cell(row, data_start_col + 8, mean_2sigma_checks[i])
             if mean_2sigma_checks[i] == 'PASS':
-                mean_2sigma_check_cell.font = Font(size=9, color='006100', bold=True)
-                mean_2sigma_check_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+                mean_2sigma_check_cell.font = _PASS_FONT
+                mean_2sigma_check_cell.fill = _PASS_FILL
             else:
-                mean_2sigma_check_cell.font = Font(size=9, color='9C0006', bold=True)
-                mean_2sigma_check_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+                mean_2sigma_check_cell.font = _FAIL_FONT
+                mean_2sigma_check_cell.fill = _FAIL_FILL
         
         # Create scatter chart
         chart = ScatterChart()
@@ -222,9 +229,12 @@ def create_tolerance_charts(excel_file, df_results, unit):
         chart.x_axis.majorGridlines = None
         
         # Calculate Y-axis limits with padding
-        all_values = lower_limits + upper_limits + reference_values + means + lower_2sigma + upper_2sigma
-        y_min = min(all_values)
-        y_max = max(all_values)
+        limit_values = test_data[[f'Lower Limit [{unit}]', f'Upper Limit [{unit}]',
+                                  f'Reference Value [{unit}]', f'Mean [{unit}]']].to_numpy()
+        # A single-sample channel has a NaN StdDev; only its own ±2σ bounds drop out of the extent
+        y_values = np.concatenate([limit_values.ravel(), lower_2sigma_arr, upper_2sigma_arr])
+        y_min = float(np.nanmin(y_values))
+        y_max = float(np.nanmax(y_values))
         y_range = y_max - y_min if y_max != y_min else abs(y_max) * 0.1 or 0.1
         y_padding = y_range * 0.20  # 20% padding
         
@@ -337,9 +347,7 @@ def create_deviation_charts(excel_file, df_results, unit):
     
     chart_idx = 0
     
-    for _, combo in io_range_combos.iterrows():
-        io_type = combo['I/O Type']
-        range_setting = combo['Range Setting']
+    for io_type, range_setting, _count in io_range_combos.itertuples(index=False, name=None):
         
         mask = (df_results['I/O Type'] == io_type) & (df_results['Range Setting'] == range_setting)
         combo_data = df_results[mask].copy()
@@ -1,11 +1,26 @@
+import os
+import gzip
+import json
+import string
 from pathlib import Path
 from datetime import datetime
 
+import jinja2
+import numpy as np
+
 from utils import PLOTLY_AVAILABLE, CHANNEL_COLORS_HEX
 
 if PLOTLY_AVAILABLE:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
+    from plotly.utils import PlotlyJSONEncoder
+
+# Optional fast JSON encoder for chart data
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 '''
 def create_tolerance_charts(excel_file, df_results, unit):
@@ -263,7 +278,389 @@ def create_tolerance_charts(excel_file, df_results, unit):
     
     return color_assignments
 '''
-def create_html_report(output_file, df_results, unit, data_file_timestamp=None, equipment_name=None):
+# The report page is a Jinja2 template, compiled once at import and streamed straight to disk
+_REPORT_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).resolve().parent / 'templates'),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+_REPORT_TEMPLATE = _REPORT_ENV.get_template('report.html')
+
+# Tables longer than this many rows are sent to the browser a page at a time
+TABLE_PAGE_ROWS = 1000
+
+# One data-table row; its str.format fields are filled column-wise by _table_rows_html
+_ROW_TEMPLATE = '''
+                            <tr data-channel="{channel}" data-io="{io_type}" data-range="{range_setting}" data-tv="{test_value:.6f}" data-mean="{mean_check}" data-sigma="{sigma_check}" data-search="{search}">
+                                <td>{channel}</td>
+                                <td>{io_type}</td>
+                                <td>{range_setting}</td>
+                                <td>{test_value:.6f}</td>
+                                <td>{reference:.6f}</td>
+                                <td>{tolerance:.6f}</td>
+                                <td>{lower_limit:.6f}</td>
+                                <td>{upper_limit:.6f}</td>
+                                <td>{mean:.6f}</td>
+                                <td>{stddev:.6f}</td>
+                                <td>{min:.6f}</td>
+                                <td>{max:.6f}</td>
+                                <td>{samples}</td>
+                                <td class="{mean_class}">{mean_check}</td>
+                                <td class="{sigma_class}">{sigma_check}</td>
+                            </tr>
+'''
+
+_ROW_TEMPLATE_PIECES = list(string.Formatter().parse(_ROW_TEMPLATE))
+
+# Table cells the search box matches against, as (field, format spec) pairs of _ROW_TEMPLATE
+_SEARCH_CELLS = (
+    ('channel', ''), ('io_type', ''), ('range_setting', ''), ('test_value', '.6f'), ('reference', '.6f'),
+    ('tolerance', '.6f'), ('lower_limit', '.6f'), ('upper_limit', '.6f'), ('mean', '.6f'), ('stddev', '.6f'),
+    ('min', '.6f'), ('max', '.6f'), ('samples', ''), ('mean_check', ''), ('sigma_check', ''),
+)
+
+
+def _escape_html(values):
+    """HTML-escape a string array in a few whole-array passes (safe inside double-quoted attributes too)."""
+    for char, entity in (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;')):
+        values = np.char.replace(values, char, entity)
+    return values
+
+
+def _table_rows_html(fields):
+    """
+    Render every data-table row at once. `fields` maps each _ROW_TEMPLATE field (bar the derived
+    `search` text) to a column array; each column is formatted in one vectorized pass and the rows
+    are concatenated column by column.
+    Returns the markup of the first TABLE_PAGE_ROWS rows and a list of page markups for the rest.
+    """
+    # Format each (field, spec) column once, even where the template uses it twice
+    cells = {}
+    for _, field, spec, _ in _ROW_TEMPLATE_PIECES:
+        if field is not None and field != 'search' and (field, spec) not in cells:
+            values = np.asarray(fields[field])
+            formatted = np.char.mod(f'%{spec}', values.astype(float)) if spec else _escape_html(values.astype(str))
+            cells[field, spec] = formatted.astype(object)
+    
+    # Lower-cased text of the visible cells, tab-separated so a search cannot match across cells
+    search = cells[_SEARCH_CELLS[0]]
+    for key in _SEARCH_CELLS[1:]:
+        search = search + '\t' + cells[key]
+    cells['search', ''] = np.char.lower(search.astype(str)).astype(object)
+    
+    rows = None
+    for literal, field, spec, _ in _ROW_TEMPLATE_PIECES:
+        rows = literal if rows is None else rows + literal
+        if field is not None:
+            rows = rows + cells[field, spec]
+    rows = rows.tolist()
+    
+    # The first page goes straight into the table; the rest become pages of markup for the JSON island
+    first_page = ''.join(rows[:TABLE_PAGE_ROWS])
+    deferred_pages = [''.join(rows[start:start + TABLE_PAGE_ROWS])
+                      for start in range(TABLE_PAGE_ROWS, len(rows), TABLE_PAGE_ROWS)]
+    return first_page, deferred_pages
+
+
+# Shared channel palette (matching Excel charts) as an array, so a chart's colours are one gather
+_CHANNEL_COLOR_ARRAY = np.array(CHANNEL_COLORS_HEX, dtype=object)
+
+
+def _channel_palette(count):
+    """Colours for the first `count` channel slots, cycling through the shared palette."""
+    return _CHANNEL_COLOR_ARRAY[np.arange(count) % len(_CHANNEL_COLOR_ARRAY)].tolist()
+
+
+def _dumps(obj):
+    """Compact JSON text for the report's data islands, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _orjson_default(obj):
+    """Values orjson cannot encode natively (e.g. strided array views) go through Plotly's encoder rules."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return PlotlyJSONEncoder().default(obj)
+
+
+def _figure_json(fig):
+    """Compact JSON for a figure, with orjson when available and Plotly's encoder otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(fig.to_dict(), default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(fig.to_dict(), cls=PlotlyJSONEncoder, separators=(',', ':'))
+
+
+def _figure_html(fig, div_id):
+    """
+    Inline markup for one chart: an empty plotly-graph-div and the figure as a JSON island.
+    The report script draws every island with Plotly.react in one pass; plotly.js is loaded
+    once by the report head, never per figure.
+    """
+    # Escape "</" so tags inside hover templates cannot close the <script> element
+    fig_json = _figure_json(fig).replace('</', '<\\/')
+    return (
+        f'<div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+        f'<script type="application/json" class="chart-data" data-target="{div_id}">{fig_json}</script>'
+    )
+
+
+def _build_tolerance_chart(payload):
+    """
+    Build one tolerance chart from plain per-channel arrays.
+    DataFrame-free; it only sees the slices of its own chart.
+    """
+    (chart_idx, test_value, range_setting, io_type, unit, channels, lower_limits, upper_limits,
+     reference_values, means, stddevs, mean_checks, mean_2sigma_checks) = payload
+    lower_2sigma = means - 2.0 * stddevs
+    upper_2sigma = means + 2.0 * stddevs
+    
+    # Get limit values (same for all channels)
+    ref_val = reference_values[0]
+    ll_val = lower_limits[0]
+    ul_val = upper_limits[0]
+    
+    range_display = f", Range: {range_setting}" if range_setting != 'N/A' else ""
+    chart_title = f"Test: {test_value} {unit}{range_display} ({io_type})"
+    
+    # Create figure
+    fig = go.Figure()
+    
+    # Add limit lines (horizontal lines across all channels)
+    x_range = [min(channels) - 0.5, max(channels) + 0.5]
+    
+    # Lower limit line (dashed red)
+    fig.add_trace(go.Scatter(
+        x=x_range,
+        y=[ll_val, ll_val],
+        mode='lines',
+        name=f'Lower Limit ({ll_val:.6f})',
+        line=dict(color='#8B0000', width=2, dash='dash'),
+        hoverinfo='name+y'
+    ))
+    
+    # Reference line (solid green)
+    fig.add_trace(go.Scatter(
+        x=x_range,
+        y=[ref_val, ref_val],
+        mode='lines',
+        name=f'Reference ({ref_val:.6f})',
+        line=dict(color='#2E7D32', width=2),
+        hoverinfo='name+y'
+    ))
+    
+    # Upper limit line (dashed red)
+    fig.add_trace(go.Scatter(
+        x=x_range,
+        y=[ul_val, ul_val],
+        mode='lines',
+        name=f'Upper Limit ({ul_val:.6f})',
+        line=dict(color='#8B0000', width=2, dash='dash'),
+        hoverinfo='name+y'
+    ))
+    
+    # Channel data as one trace per series; per-channel colours ride on marker.color
+    colors = _channel_palette(len(channels))
+    labels = [f'CH{channel}' for channel in channels]
+    
+    # Mean points (diamond)
+    fig.add_trace(go.Scatter(
+        x=channels,
+        y=means,
+        mode='markers',
+        name='Mean',
+        marker=dict(symbol='diamond', size=12, color=colors, line=dict(color=colors, width=1)),
+        customdata=list(zip(labels, mean_checks)),
+        hovertemplate='%{customdata[0]}<br>Mean: %{y:.6f}<br>Check: %{customdata[1]}<extra></extra>'
+    ))
+    
+    # Mean-2σ / Mean+2σ points (line markers)
+    fig.add_trace(go.Scatter(
+        x=channels + channels,
+        y=np.concatenate([lower_2sigma, upper_2sigma]),
+        mode='markers',
+        name='Mean ± 2σ',
+        marker=dict(symbol='line-ew', size=10, color=colors + colors, line=dict(color=colors + colors, width=3)),
+        customdata=[[label, 'Mean-2σ', ''] for label in labels] +
+                   [[label, 'Mean+2σ', f'<br>±2σ Check: {check}'] for label, check in zip(labels, mean_2sigma_checks)],
+        hovertemplate='%{customdata[0]}<br>%{customdata[1]}: %{y:.6f}%{customdata[2]}<extra></extra>',
+        showlegend=False
+    ))
+    
+    # Vertical lines connecting -2σ to +2σ (layout shapes, not traces)
+    sigma_bars = [
+        dict(type='line', xref='x', yref='y', x0=channel, x1=channel, y0=lo, y1=hi,
+             line=dict(color=color, width=1))
+        for channel, lo, hi, color in zip(channels, lower_2sigma, upper_2sigma, colors)
+    ]
+    
+    # Calculate Y-axis range; a single-sample channel's NaN ±2σ bounds are left out
+    all_values = np.concatenate([lower_limits, upper_limits, reference_values, means, lower_2sigma, upper_2sigma])
+    y_min = np.nanmin(all_values)
+    y_max = np.nanmax(all_values)
+    y_range_val = y_max - y_min if y_max != y_min else abs(y_max) * 0.1 or 0.1
+    y_padding = y_range_val * 0.20
+    
+    # Update layout - title moved outside chart, legends hidden by default
+    fig.update_layout(
+        title=None,  # Title will be added as external HTML element
+        xaxis=dict(
+            title='Channel',
+            tickmode='linear',
+            tick0=min(channels),
+            dtick=1,
+            autorange=True  # Enable autoscale
+        ),
+        yaxis=dict(
+            title=f'Measurement [{unit}]',
+            autorange=True  # Enable autoscale
+        ),
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=1.0,
+            xanchor='center',
+            x=0.5,
+            font=dict(size=10),
+            bgcolor='rgba(255,255,255,0.9)',
+            bordercolor='#e9ecef',
+            borderwidth=1
+        ),
+        showlegend=False,  # Legends hidden by default
+        hovermode='closest',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin=dict(l=60, r=20, t=30, b=50),
+        autosize=True,
+        shapes=sigma_bars
+    )
+    
+    # Add gridlines
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
+    
+    return {
+        'title': chart_title,
+        'io_type': io_type,
+        'html': _figure_html(fig, f'tolerance-chart-{chart_idx}')
+    }
+
+
+def _build_deviation_chart(payload):
+    """
+    Build one deviation summary chart from per-channel (test value, deviation, mean, reference) arrays.
+    DataFrame-free; it only sees the slices of its own chart.
+    """
+    chart_idx, io_type, range_setting, unit, channel_series, tol_x_vals, tol_upper = payload
+    
+    # Create figure
+    fig = go.Figure()
+    
+    # Add a line for each channel
+    for channel, color, x_vals, deviations, means, refs in channel_series:
+        # Add line with markers
+        fig.add_trace(go.Scatter(
+            x=x_vals,
+            y=deviations,
+            mode='lines+markers',
+            name=f'CH{channel}',
+            line=dict(color=color, width=2),
+            marker=dict(color=color, size=8, symbol='diamond'),
+            hovertemplate=(
+                f'<b>Channel {channel}</b><br>'
+                f'Test Value: %{{x}} {unit}<br>'
+                f'Deviation: %{{y:.6f}} {unit}<br>'
+                f'Mean: %{{customdata[0]:.6f}} {unit}<br>'
+                f'Reference: %{{customdata[1]:.6f}} {unit}<extra></extra>'
+            ),
+            customdata=np.column_stack([means, refs])
+        ))
+    
+    tol_lower = [-t for t in tol_upper]
+    
+    # Add upper tolerance line
+    fig.add_trace(go.Scatter(
+        x=tol_x_vals,
+        y=tol_upper,
+        mode='lines',
+        name='+Tolerance',
+        line=dict(color='#8B0000', width=2, dash='dash'),
+        hovertemplate=f'Upper Tolerance: %{{y:.6f}} {unit}<extra></extra>',
+        showlegend=True
+    ))
+    
+    # Add lower tolerance line
+    fig.add_trace(go.Scatter(
+        x=tol_x_vals,
+        y=tol_lower,
+        mode='lines',
+        name='-Tolerance',
+        line=dict(color='#8B0000', width=2, dash='dash'),
+        hovertemplate=f'Lower Tolerance: %{{y:.6f}} {unit}<extra></extra>',
+        showlegend=True
+    ))
+    
+    # Add zero reference line
+    fig.add_hline(
+        y=0,
+        line=dict(color='#2E7D32', width=2),
+        annotation_text="Zero Deviation",
+        annotation_position="bottom right"
+    )
+    
+    # Update layout
+    io_label = "Input" if io_type == "Input" else "Output"
+    range_label = f" (Range: {range_setting})" if range_setting and range_setting != 'N/A' else ""
+    chart_title = f'Deviation Summary - {io_label}{range_label}'
+    
+    fig.update_layout(
+        title=None,
+        xaxis_title=f'Test Value [{unit}]',
+        yaxis_title=f'Deviation [{unit}]',
+        font=dict(family='Segoe UI', size=11),
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=1.02,
+            xanchor='center',
+            x=0.5,
+            bgcolor='rgba(255,255,255,0.9)',
+            bordercolor='#e9ecef',
+            borderwidth=1
+        ),
+        showlegend=True,
+        hovermode='closest',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin=dict(l=60, r=20, t=50, b=50),
+        autosize=True
+    )
+    
+    # Add gridlines
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0', zeroline=True, zerolinecolor='#2E7D32', zerolinewidth=2)
+    
+    return {
+        'title': chart_title,
+        'io_type': io_type,
+        'html': _figure_html(fig, f'deviation-chart-{chart_idx}')
+    }
+
+
+GZIP_COMPRESSLEVEL = 5  # Report markup is highly repetitive; level 5 gets most of the gain cheaply
+
+
+def _open_report(html_file):
+    """Open the report for writing, gzip-compressed when the filename ends in .gz."""
+    if html_file.endswith('.gz'):
+        return gzip.open(html_file, 'wt', encoding='utf-8', compresslevel=GZIP_COMPRESSLEVEL)
+    return open(html_file, 'w', encoding='utf-8', buffering=1 << 20)
+
+
+def create_html_report(output_file, df_results, unit, data_file_timestamp=None, equipment_name=None, compress=False):
     """
     Create an interactive HTML report using Plotly with tolerance charts and data tables.
     
@@ -273,381 +670,117 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None,
     - unit: Measurement unit
     - data_file_timestamp: Optional datetime of the first data file (for "Data collected on")
     - equipment_name: Optional equipment model name for report title
+    - compress: Write the report gzip-compressed as *_report.html.gz
     """
     if not PLOTLY_AVAILABLE:
         print("Warning: Plotly not available. Skipping HTML report generation.")
         print("  Install with: pip install plotly")
         return None
     
+    if df_results.empty:
+        print("No results to report. Skipping HTML report generation.")
+        return None
+    
     print("\nCreating interactive HTML report...")
     
+    # Column names, formatted once
+    test_value_col = f'Test Value [{unit}]'
+    ref_col = f'Reference Value [{unit}]'
+    tol_col = f'Tolerance [{unit}]'
+    lower_col = f'Lower Limit [{unit}]'
+    upper_col = f'Upper Limit [{unit}]'
+    mean_col = f'Mean [{unit}]'
+    std_col = f'StdDev [{unit}]'
+    min_col = f'Min [{unit}]'
+    max_col = f'Max [{unit}]'
+    
     # Use equipment name if provided, otherwise use file stem
     report_name = equipment_name if equipment_name else Path(output_file).stem
     
     # Generate HTML filename
     html_file = output_file.replace('.xlsx', '_report.html')
+    if compress:
+        html_file += '.gz'
     
-    # Pleasant, muted color palette for channels (matching Excel charts)
-    channel_colors = [
-        '#4472C4',  # Muted blue
-        '#C45B5B',  # Muted red
-        '#70AD47',  # Muted green
-        '#ED7D31',  # Muted orange
-        '#7B7B7B',  # Gray
-        '#9E5ECE',  # Muted purple
-        '#43A6A2',  # Muted teal
-        '#C4A24E',  # Muted gold
-        '#5B9BC4',  # Steel blue
-        '#A85B5B',  # Dusty rose
-        '#5BAF7B',  # Sea green
-        '#C47B4E',  # Terracotta
-        '#6B6BAF',  # Muted indigo
-        '#8B6BAF',  # Muted violet
-        '#4EAFAF',  # Turquoise
-        '#AF8B4E',  # Bronze
-    ]
-    
-    # Get unique combinations for charts
-    unique_combinations = df_results.groupby([f'Test Value [{unit}]', 'Range Setting', 'I/O Type']).size().reset_index()
-    unique_combinations = unique_combinations.sort_values([f'Test Value [{unit}]', 'Range Setting', 'I/O Type'])
-    
-    num_charts = len(unique_combinations)
-    
-    # Create figures list
-    figures_html = []
-    
-    for _, combo_row in unique_combinations.iterrows():
-        test_value = combo_row[f'Test Value [{unit}]']
-        range_setting = combo_row['Range Setting']
-        io_type = combo_row['I/O Type']
-        
-        mask = (
-            (df_results[f'Test Value [{unit}]'] == test_value) &
-            (df_results['Range Setting'] == range_setting) &
-            (df_results['I/O Type'] == io_type)
-        )
-        test_data = df_results[mask].copy()
-        test_data = test_data.sort_values('Channel')
-        
-        if len(test_data) == 0:
-            continue
-        
-        channels = test_data['Channel'].tolist()
-        lower_limits = test_data[f'Lower Limit [{unit}]'].tolist()
-        upper_limits = test_data[f'Upper Limit [{unit}]'].tolist()
-        reference_values = test_data[f'Reference Value [{unit}]'].tolist()
-        means = test_data[f'Mean [{unit}]'].tolist()
-        stddevs = test_data[f'StdDev [{unit}]'].tolist()
-        lower_2sigma = [m - 2*s for m, s in zip(means, stddevs)]
-        upper_2sigma = [m + 2*s for m, s in zip(means, stddevs)]
-        mean_checks = test_data['Mean Check'].tolist()
-        mean_2sigma_checks = test_data['Mean±2σ Check'].tolist()
-        
-        # Get limit values (same for all channels)
-        ref_val = reference_values[0]
-        ll_val = lower_limits[0]
-        ul_val = upper_limits[0]
-        
-        range_display = f", Range: {range_setting}" if range_setting != 'N/A' else ""
-        chart_title = f"Test: {test_value} {unit}{range_display} ({io_type})"
-        
-        # Create figure
-        fig = go.Figure()
-        
-        # Add limit lines (horizontal lines across all channels)
-        x_range = [min(channels) - 0.5, max(channels) + 0.5]
-        
-        # Lower limit line (dashed red)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ll_val, ll_val],
-            mode='lines',
-            name=f'Lower Limit ({ll_val:.6f})',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hoverinfo='name+y'
-        ))
-        
-        # Reference line (solid green)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ref_val, ref_val],
-            mode='lines',
-            name=f'Reference ({ref_val:.6f})',
-            line=dict(color='#2E7D32', width=2),
-            hoverinfo='name+y'
-        ))
-        
-        # Upper limit line (dashed red)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ul_val, ul_val],
-            mode='lines',
-            name=f'Upper Limit ({ul_val:.6f})',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hoverinfo='name+y'
+    # Deviation charts colour each channel consistently across the report;
+    # tolerance charts colour by position within the chart, matching the Excel charts
+    all_channels = sorted(df_results['Channel'].unique())
+    channel_color_map = dict(zip(all_channels, _channel_palette(len(all_channels))))
+    
+    # Chart data sorted once by channel and test value, so every group below comes out in plotting order.
+    # I/O type and range become categoricals for cheaper grouping.
+    chart_df = df_results.astype({'I/O Type': 'category', 'Range Setting': 'category'})
+    chart_df = chart_df.sort_values(['Channel', test_value_col], kind='stable')
+    # Deviation (Mean - Reference) for the deviation charts, in one column-wide subtraction
+    chart_df['_deviation'] = chart_df[mean_col].to_numpy() - chart_df[ref_col].to_numpy()
+    
+    # One chart per test value + range + I/O type combination (single groupby pass, sorted by key)
+    combination_groups = chart_df.groupby([test_value_col, 'Range Setting', 'I/O Type'], sort=True, observed=True)
+    
+    # The chart columns as one record array, reordered so each combination is a contiguous run of rows
+    group_ids = combination_groups.ngroup().to_numpy()
+    row_order = np.argsort(group_ids, kind='stable')
+    compact = chart_df[[test_value_col, 'Range Setting', 'I/O Type', 'Channel', lower_col, upper_col,
+                        ref_col, mean_col, std_col, 'Mean Check', 'Mean±2σ Check']].to_records(index=False)[row_order]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(group_ids))))
+    
+    # Send each chart only its own column slices
+    tolerance_payloads = []
+    for chart_idx, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        slc = compact[start:stop]
+        tolerance_payloads.append((
+            chart_idx, slc[test_value_col][0], slc['Range Setting'][0], slc['I/O Type'][0], unit,
+            slc['Channel'].tolist(), slc[lower_col], slc[upper_col], slc[ref_col], slc[mean_col], slc[std_col],
+            slc['Mean Check'].tolist(), slc['Mean±2σ Check'].tolist()
         ))
-        
-        # Add data points for each channel
-        for i, channel in enumerate(channels):
-            color = channel_colors[i % len(channel_colors)]
-            
-            # Mean point (diamond)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[means[i]],
-                mode='markers',
-                name=f'CH{channel} Mean',
-                marker=dict(
-                    symbol='diamond',
-                    size=12,
-                    color=color,
-                    line=dict(color=color, width=1)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean: %{{y:.6f}}<br>Check: {mean_checks[i]}<extra></extra>'
-            ))
-            
-            # Mean-2σ point (line marker)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[lower_2sigma[i]],
-                mode='markers',
-                name=f'CH{channel} -2σ',
-                marker=dict(
-                    symbol='line-ew',
-                    size=10,
-                    color=color,
-                    line=dict(color=color, width=3)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean-2σ: %{{y:.6f}}<extra></extra>',
-                showlegend=False
-            ))
-            
-            # Mean+2σ point (line marker)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[upper_2sigma[i]],
-                mode='markers',
-                name=f'CH{channel} +2σ',
-                marker=dict(
-                    symbol='line-ew',
-                    size=10,
-                    color=color,
-                    line=dict(color=color, width=3)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean+2σ: %{{y:.6f}}<br>±2σ Check: {mean_2sigma_checks[i]}<extra></extra>',
-                showlegend=False
-            ))
-            
-            # Add vertical line connecting -2σ to +2σ
-            fig.add_trace(go.Scatter(
-                x=[channel, channel],
-                y=[lower_2sigma[i], upper_2sigma[i]],
-                mode='lines',
-                line=dict(color=color, width=1),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
-        
-        # Calculate Y-axis range
-        all_values = lower_limits + upper_limits + reference_values + means + lower_2sigma + upper_2sigma
-        y_min = min(all_values)
-        y_max = max(all_values)
-        y_range_val = y_max - y_min if y_max != y_min else abs(y_max) * 0.1 or 0.1
-        y_padding = y_range_val * 0.20
-        
-        # Update layout - title moved outside chart, legends hidden by default
-        fig.update_layout(
-            title=None,  # Title will be added as external HTML element
-            xaxis=dict(
-                title='Channel',
-                tickmode='linear',
-                tick0=min(channels),
-                dtick=1,
-                autorange=True  # Enable autoscale
-            ),
-            yaxis=dict(
-                title=f'Measurement [{unit}]',
-                autorange=True  # Enable autoscale
-            ),
-            legend=dict(
-                orientation='h',
-                yanchor='bottom',
-                y=1.0,
-                xanchor='center',
-                x=0.5,
-                font=dict(size=10),
-                bgcolor='rgba(255,255,255,0.9)',
-                bordercolor='#e9ecef',
-                borderwidth=1
-            ),
-            showlegend=False,  # Legends hidden by default
-            hovermode='closest',
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            margin=dict(l=60, r=20, t=30, b=50),
-            autosize=True
-        )
-        
-        # Add gridlines
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
-        
-        # Store chart with its title and io_type
-        figures_html.append({
-            'title': chart_title,
-            'io_type': io_type,
-            'html': fig.to_html(full_html=False, include_plotlyjs=False, config={'responsive': True})
-        })
+    figures_html = [_build_tolerance_chart(payload) for payload in tolerance_payloads]
     
     # Create Deviation Summary Charts (all channels, all test values in one chart)
     # Group by I/O type AND Range Setting to create separate deviation charts
-    deviation_charts = []
     
-    # Get all unique channels for consistent color assignment across all charts
-    all_channels = sorted(df_results['Channel'].unique())
-    channel_color_map = {ch: channel_colors[i % len(channel_colors)] for i, ch in enumerate(all_channels)}
-    
-    # Get unique combinations of I/O type and Range Setting
-    io_range_combinations = df_results.groupby(['I/O Type', 'Range Setting']).size().reset_index()
-    io_range_combinations = io_range_combinations.sort_values(['I/O Type', 'Range Setting'])
+    # One chart per I/O type + Range Setting combination
+    io_range_groups = chart_df.groupby(['I/O Type', 'Range Setting'], sort=True, observed=True)
     
-    for _, combo in io_range_combinations.iterrows():
-        io_type = combo['I/O Type']
-        range_setting = combo['Range Setting']
-        
-        # Filter data for this combination
-        mask = (df_results['I/O Type'] == io_type) & (df_results['Range Setting'] == range_setting)
-        combo_data = df_results[mask].copy()
-        
-        if len(combo_data) == 0:
-            continue
-        
-        # Get unique channels and test values for this combination
-        channels = sorted(combo_data['Channel'].unique())
-        test_values = sorted(combo_data[f'Test Value [{unit}]'].unique())
-        
-        # Create figure
-        fig = go.Figure()
-        
-        # Add a line for each channel
-        for channel in channels:
-            ch_data = combo_data[combo_data['Channel'] == channel].copy()
-            ch_data = ch_data.sort_values(f'Test Value [{unit}]')
-            
-            x_vals = ch_data[f'Test Value [{unit}]'].tolist()
-            # Calculate deviation (Mean - Reference)
-            deviations = (ch_data[f'Mean [{unit}]'] - ch_data[f'Reference Value [{unit}]']).tolist()
-            means = ch_data[f'Mean [{unit}]'].tolist()
-            refs = ch_data[f'Reference Value [{unit}]'].tolist()
-            
-            color = channel_color_map[channel]
-            
-            # Add line with markers
-            fig.add_trace(go.Scatter(
-                x=x_vals,
-                y=deviations,
-                mode='lines+markers',
-                name=f'CH{channel}',
-                line=dict(color=color, width=2),
-                marker=dict(color=color, size=8, symbol='diamond'),
-                hovertemplate=(
-                    f'<b>Channel {channel}</b><br>'
-                    f'Test Value: %{{x}} {unit}<br>'
-                    f'Deviation: %{{y:.6f}} {unit}<br>'
-                    f'Mean: %{{customdata[0]:.6f}} {unit}<br>'
-                    f'Reference: %{{customdata[1]:.6f}} {unit}<extra></extra>'
-                ),
-                customdata=list(zip(means, refs))
-            ))
-        
-        # Get tolerance values for this combination (should be same for all channels at same test value)
-        # We'll plot tolerance lines at +/- tolerance for each test value
-        tolerance_data = combo_data.groupby(f'Test Value [{unit}]').first().reset_index()
-        tolerance_data = tolerance_data.sort_values(f'Test Value [{unit}]')
+    deviation_payloads = []
+    for chart_idx, ((io_type, range_setting), combo_data) in enumerate(io_range_groups):
+        channel_series = [
+            (channel, channel_color_map[channel],
+             ch_data[test_value_col].to_numpy(), ch_data['_deviation'].to_numpy(),
+             ch_data[mean_col].to_numpy(), ch_data[ref_col].to_numpy())
+            for channel, ch_data in combo_data.groupby('Channel', sort=True)
+        ]
         
-        tol_x_vals = tolerance_data[f'Test Value [{unit}]'].tolist()
-        tol_upper = tolerance_data[f'Tolerance [{unit}]'].tolist()
-        tol_lower = [-t for t in tol_upper]
+        # Tolerance is the same for all channels at one test value; take the first row of each
+        tolerance_data = combo_data.groupby(test_value_col).first().reset_index()
         
-        # Add upper tolerance line
-        fig.add_trace(go.Scatter(
-            x=tol_x_vals,
-            y=tol_upper,
-            mode='lines',
-            name='+Tolerance',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hovertemplate=f'Upper Tolerance: %{{y:.6f}} {unit}<extra></extra>',
-            showlegend=True
-        ))
-        
-        # Add lower tolerance line
-        fig.add_trace(go.Scatter(
-            x=tol_x_vals,
-            y=tol_lower,
-            mode='lines',
-            name='-Tolerance',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hovertemplate=f'Lower Tolerance: %{{y:.6f}} {unit}<extra></extra>',
-            showlegend=True
+        deviation_payloads.append((
+            chart_idx, io_type, range_setting, unit, channel_series,
+            tolerance_data[test_value_col].tolist(), tolerance_data[tol_col].tolist()
         ))
-        
-        # Add zero reference line
-        fig.add_hline(
-            y=0,
-            line=dict(color='#2E7D32', width=2),
-            annotation_text="Zero Deviation",
-            annotation_position="bottom right"
-        )
-        
-        # Update layout
-        io_label = "Input" if io_type == "Input" else "Output"
-        range_label = f" (Range: {range_setting})" if range_setting and range_setting != 'N/A' else ""
-        chart_title = f'Deviation Summary - {io_label}{range_label}'
-        
-        fig.update_layout(
-            title=None,
-            xaxis_title=f'Test Value [{unit}]',
-            yaxis_title=f'Deviation [{unit}]',
-            font=dict(family='Segoe UI', size=11),
-            legend=dict(
-                orientation='h',
-                yanchor='bottom',
-                y=1.02,
-                xanchor='center',
-                x=0.5,
-                bgcolor='rgba(255,255,255,0.9)',
-                bordercolor='#e9ecef',
-                borderwidth=1
-            ),
-            showlegend=True,
-            hovermode='closest',
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            margin=dict(l=60, r=20, t=50, b=50),
-            autosize=True
-        )
-        
-        # Add gridlines
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0', zeroline=True, zerolinecolor='#2E7D32', zerolinewidth=2)
-        
-        deviation_charts.append({
-            'title': chart_title,
-            'io_type': io_type,
-            'html': fig.to_html(full_html=False, include_plotlyjs=False, config={'responsive': True})
-        })
+    deviation_charts = [_build_deviation_chart(payload) for payload in deviation_payloads]
     
     # Create summary statistics table
-    summary_pass = (df_results['Mean Check'] == 'PASS').sum()
-    summary_fail = (df_results['Mean Check'] == 'FAIL').sum()
-    summary_2s_pass = (df_results['Mean±2σ Check'] == 'PASS').sum()
-    summary_2s_fail = (df_results['Mean±2σ Check'] == 'FAIL').sum()
+    mean_check_counts = df_results['Mean Check'].value_counts()
+    sigma_check_counts = df_results['Mean±2σ Check'].value_counts()
+    summary_pass = int(mean_check_counts.get('PASS', 0))
+    summary_fail = int(mean_check_counts.get('FAIL', 0))
+    summary_2s_pass = int(sigma_check_counts.get('PASS', 0))
+    summary_2s_fail = int(sigma_check_counts.get('FAIL', 0))
     
     # Get unique values for filters
-    unique_channels = sorted(df_results['Channel'].unique())
-    unique_ranges = sorted(df_results['Range Setting'].unique())
-    unique_test_values = sorted(df_results[f'Test Value [{unit}]'].unique())
-    unique_io_types = sorted(df_results['I/O Type'].unique())
+    # (the categorical columns of chart_df already hold their values sorted and de-duplicated)
+    unique_channels = all_channels
+    unique_ranges = chart_df['Range Setting'].cat.categories.tolist()
+    unique_test_values = np.sort(df_results[test_value_col].unique()).tolist()
+    unique_io_types = chart_df['I/O Type'].cat.categories.tolist()
+    # The page fills the dropdowns from this one JSON blob; values are sent as the same text
+    # the table rows carry, and "</" is escaped so no value can close the <script> element
+    filter_options = _dumps({
+        'channel': [str(ch) for ch in unique_channels],
+        'io': [str(io) for io in unique_io_types],
+        'range': [str(rng) for rng in unique_ranges],
+        'testvalue': [str(tv) for tv in unique_test_values],
+    }).replace('</', '<\\/')
     
     # Generate timestamp information
     report_generated_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -656,737 +789,48 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None,
     else:
         data_collected_str = "Unknown"
     
-    # Build HTML document
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Measurement Report - {report_name}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        * {{
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background-color: #f5f7fa;
-            color: #333;
-            line-height: 1.6;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #5C2D91 0%, #9B59B6 50%, #E8E0F0 100%);
-            color: white;
-            padding: 30px 40px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{
-            font-size: 28px;
-            margin-bottom: 10px;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-        }}
-        .header p {{
-            opacity: 0.9;
-            font-size: 14px;
-        }}
-        .container {{
-            width: 100%;
-            padding: 20px 30px;
-        }}
-        .summary-cards {{
-            display: grid;
-            grid-template-columns: repeat(5, 1fr);
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        @media (max-width: 1200px) {{
-            .summary-cards {{
-                grid-template-columns: repeat(3, 1fr);
-            }}
-        }}
-        @media (max-width: 768px) {{
-            .summary-cards {{
-                grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
-        .card {{
-            background: white;
-            border-radius: 8px;
-            padding: 12px 15px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            text-align: center;
-        }}
-        .card h3 {{
-            font-size: 11px;
-            color: #666;
-            margin-bottom: 6px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        .card .value {{
-            font-size: 24px;
-            font-weight: bold;
-        }}
-        .card.pass .value {{
-            color: #2E7D32;
-        }}
-        .card.fail .value {{
-            color: #C00000;
-        }}
-        .card.neutral .value {{
-            color: #1F4E78;
-        }}
-        .section {{
-            background: white;
-            border-radius: 10px;
-            margin: 20px 0;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            overflow: hidden;
-        }}
-        .section-header {{
-            background: #f8f9fa;
-            padding: 15px 20px;
-            border-bottom: 1px solid #e9ecef;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        .section-header:hover {{
-            background: #e9ecef;
-        }}
-        .section-header h2 {{
-            font-size: 18px;
-            color: #1F4E78;
-        }}
-        .section-header .toggle {{
-            font-size: 20px;
-            color: #666;
-        }}
-        .section-content {{
-            padding: 20px;
-        }}
-        .chart-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 25px;
-        }}
-        @media (max-width: 1400px) {{
-            .chart-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        .chart-container {{
-            background: #fafafa;
-            border-radius: 8px;
-            padding: 15px;
-            border: 1px solid #e9ecef;
-            min-height: 400px;
-        }}
-        .chart-title {{
-            font-size: 16px;
-            font-weight: 600;
-            margin-bottom: 10px;
-            padding: 8px 12px;
-            border-radius: 0 4px 4px 0;
-        }}
-        .chart-title.input {{
-            color: #2E7D32;
-            background: linear-gradient(90deg, #e8f5e9 0%, transparent 100%);
-            border-left: 4px solid #2E7D32;
-        }}
-        .chart-title.output {{
-            color: #1F4E78;
-            background: linear-gradient(90deg, #e0f0ff 0%, transparent 100%);
-            border-left: 4px solid #1F4E78;
-        }}
-        .chart-wrapper {{
-            width: 100%;
-            height: 380px;
-        }}
-        .chart-wrapper > div {{
-            width: 100% !important;
-            height: 100% !important;
-        }}
-        .deviation-chart-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 25px;
-        }}
-        @media (max-width: 1400px) {{
-            .deviation-chart-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        .deviation-chart-container {{
-            background: #fafafa;
-            border-radius: 8px;
-            padding: 15px;
-            border: 1px solid #e9ecef;
-            min-height: 450px;
-        }}
-        .deviation-chart {{
-            height: 400px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 13px;
-        }}
-        th, td {{
-            padding: 10px 12px;
-            text-align: left;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        th {{
-            background: #f8f9fa;
-            font-weight: 600;
-            color: #1F4E78;
-            position: sticky;
-            top: 0;
-            white-space: nowrap;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .pass {{
-            background-color: #C6EFCE;
-            color: #006100;
-            font-weight: bold;
-            text-align: center;
-            border-radius: 4px;
-        }}
-        .fail {{
-            background-color: #FFC7CE;
-            color: #9C0006;
-            font-weight: bold;
-            text-align: center;
-            border-radius: 4px;
-        }}
-        .table-wrapper {{
-            max-height: 500px;
-            overflow-y: auto;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-        }}
-        .chart-controls {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-        }}
-        .toggle-legend-btn {{
-            padding: 8px 16px;
-            background: #1F4E78;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 500;
-            transition: background 0.2s;
-            display: flex;
-            align-items: center;
-            gap: 6px;
-        }}
-        .toggle-legend-btn:hover {{
-            background: #2E7D32;
-        }}
-        .toggle-legend-btn.legends-hidden {{
-            background: #666;
-        }}
-        .filter-bar {{
-            display: flex;
-            gap: 10px;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            align-items: center;
-        }}
-        .filter-group {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            background: #f8f9fa;
-            padding: 6px 10px;
-            border-radius: 6px;
-        }}
-        .filter-bar label {{
-            font-weight: 500;
-            color: #666;
-            font-size: 13px;
-            white-space: nowrap;
-        }}
-        .filter-bar select, .filter-bar input {{
-            padding: 6px 10px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            font-size: 13px;
-            min-width: 100px;
-        }}
-        .filter-bar input {{
-            min-width: 150px;
-        }}
-        .filter-bar select:focus, .filter-bar input:focus {{
-            outline: none;
-            border-color: #1F4E78;
-        }}
-        .clear-filters-btn {{
-            padding: 6px 12px;
-            background: #e9ecef;
-            color: #666;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 13px;
-            transition: all 0.2s;
-        }}
-        .clear-filters-btn:hover {{
-            background: #ddd;
-            color: #333;
-        }}
-        .filter-count {{
-            font-size: 12px;
-            color: #666;
-            padding: 4px 8px;
-            background: #e9ecef;
-            border-radius: 4px;
-        }}
-        .legend-info {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            padding: 10px 15px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            font-size: 13px;
-        }}
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        .legend-line {{
-            width: 30px;
-            height: 3px;
-        }}
-        .legend-marker {{
-            width: 12px;
-            height: 12px;
-        }}
-        .collapsible {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.5s ease-out;
-        }}
-        .collapsible.active {{
-            max-height: none;
-            overflow: visible;
-        }}
-        @media (max-width: 768px) {{
-            .chart-grid {{
-                grid-template-columns: 1fr;
-            }}
-            .header {{
-                padding: 20px;
-            }}
-            .header h1 {{
-                font-size: 22px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📊 {report_name} - Measurement Analysis Report</h1>
-        <p>Report generated on: {report_generated_str} | Data collected on: {data_collected_str}</p>
-    </div>
-    
-    <div class="container">
-        <!-- Summary Cards -->
-        <div class="summary-cards">
-            <div class="card neutral">
-                <h3>Total Tests</h3>
-                <div class="value">{len(df_results)}</div>
-            </div>
-            <div class="card pass">
-                <h3>Mean Check Pass</h3>
-                <div class="value">{summary_pass}</div>
-            </div>
-            <div class="card fail">
-                <h3>Mean Check Fail</h3>
-                <div class="value">{summary_fail}</div>
-            </div>
-            <div class="card pass">
-                <h3>±2σ Check Pass</h3>
-                <div class="value">{summary_2s_pass}</div>
-            </div>
-            <div class="card fail">
-                <h3>±2σ Check Fail</h3>
-                <div class="value">{summary_2s_fail}</div>
-            </div>
-        </div>
-        
-        <!-- Charts Section -->
-        <div class="section">
-            <div class="section-header" onclick="toggleSection('charts-section')">
-                <h2>📈 Tolerance Charts</h2>
-                <span class="toggle" id="charts-section-toggle">▼</span>
-            </div>
-            <div class="section-content collapsible active" id="charts-section">
-                <div class="chart-controls">
-                    <button class="toggle-legend-btn legends-hidden" onclick="toggleAllLegends()">
-                        <span id="legend-btn-icon">👁️‍🗨️</span> Toggle Legends
-                    </button>
-                    <div class="legend-info">
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #8B0000; border-style: dashed;"></div>
-                            <span>Upper/Lower Limits</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #2E7D32;"></div>
-                            <span>Reference Value</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-marker" style="background: #4472C4; transform: rotate(45deg);"></div>
-                            <span>Mean</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #4472C4; height: 2px;"></div>
-                            <span>Mean ± 2σ</span>
-                        </div>
-                    </div>
-                </div>
-                <div class="chart-grid">
-'''
-    
-    # Add each chart with external title (color based on I/O type)
-    for i, chart_data in enumerate(figures_html):
-        io_class = 'input' if chart_data['io_type'] == 'Input' else 'output'
-        html_content += f'''
-                    <div class="chart-container">
-                        <div class="chart-title {io_class}">{chart_data['title']}</div>
-                        <div class="chart-wrapper">
-                            {chart_data['html']}
-                        </div>
-                    </div>
-'''
-    
-    html_content += '''
-                </div>
-            </div>
-        </div>
-        
-        <!-- Deviation Summary Section -->
-        <div class="section">
-            <div class="section-header" onclick="toggleSection('deviation-section')">
-                <h2>📉 Deviation Summary</h2>
-                <span class="toggle" id="deviation-section-toggle">▼</span>
-            </div>
-            <div class="section-content collapsible active" id="deviation-section">
-                <p style="color: #666; margin-bottom: 15px; font-size: 0.9rem;">
-                    Shows the deviation (Mean - Reference) for all channels across all test values. 
-                    The green line indicates zero deviation.
-                </p>
-                <div class="deviation-chart-grid">
-'''
-    
-    # Add deviation charts
-    for chart_data in deviation_charts:
-        io_class = 'input' if chart_data['io_type'] == 'Input' else 'output'
-        html_content += f'''
-                    <div class="deviation-chart-container">
-                        <div class="chart-title {io_class}">{chart_data['title']}</div>
-                        <div class="chart-wrapper deviation-chart">
-                            {chart_data['html']}
-                        </div>
-                    </div>
-'''
-    
-    html_content += '''
-                </div>
-            </div>
-        </div>
-        
-        <!-- Data Table Section -->
-        <div class="section">
-            <div class="section-header" onclick="toggleSection('data-section')">>
-                <h2>📋 Detailed Results</h2>
-                <span class="toggle" id="data-section-toggle">▼</span>
-            </div>
-            <div class="section-content collapsible active" id="data-section">
-                <div class="filter-bar">
-                    <div class="filter-group">
-                        <label>Channel:</label>
-                        <select id="channel-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add channel options
-    for ch in unique_channels:
-        html_content += f'                            <option value="{ch}">{ch}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>I/O Type:</label>
-                        <select id="io-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add I/O type options
-    for io in unique_io_types:
-        html_content += f'                            <option value="{io}">{io}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Range:</label>
-                        <select id="range-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add range options
-    for rng in unique_ranges:
-        html_content += f'                            <option value="{rng}">{rng}</option>\n'
-    
-    html_content += f'''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Test Value:</label>
-                        <select id="testvalue-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add test value options
-    for tv in unique_test_values:
-        html_content += f'                            <option value="{tv}">{tv} {unit}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Status:</label>
-                        <select id="status-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-                            <option value="pass">Pass Only</option>
-                            <option value="fail">Fail Only</option>
-                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Search:</label>
-                        <input type="text" id="search-input" placeholder="Search..." onkeyup="filterTable()">
-                    </div>
-                    <button class="clear-filters-btn" onclick="clearFilters()">Clear All</button>
-                    <span class="filter-count" id="filter-count"></span>
-                </div>
-                <div class="table-wrapper">
-                    <table id="results-table">
-                        <thead>
-                            <tr>
-                                <th>Channel</th>
-                                <th>I/O Type</th>
-                                <th>Range</th>
-'''
-    
-    html_content += f'''
-                                <th>Test Value [{unit}]</th>
-                                <th>Reference [{unit}]</th>
-                                <th>Tolerance [{unit}]</th>
-                                <th>Lower Limit [{unit}]</th>
-                                <th>Upper Limit [{unit}]</th>
-                                <th>Mean [{unit}]</th>
-                                <th>StdDev [{unit}]</th>
-                                <th>Min [{unit}]</th>
-                                <th>Max [{unit}]</th>
-                                <th>Samples</th>
-                                <th>Mean Check</th>
-                                <th>Mean±2σ Check</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-'''
-    
-    # Add table rows
-    for _, row in df_results.iterrows():
-        mean_class = 'pass' if row['Mean Check'] == 'PASS' else 'fail'
-        sigma_class = 'pass' if row['Mean±2σ Check'] == 'PASS' else 'fail'
-        
-        html_content += f'''
-                            <tr>
-                                <td>{row['Channel']}</td>
-                                <td>{row['I/O Type']}</td>
-                                <td>{row['Range Setting']}</td>
-                                <td>{row[f'Test Value [{unit}]']:.6f}</td>
-                                <td>{row[f'Reference Value [{unit}]']:.6f}</td>
-                                <td>{row[f'Tolerance [{unit}]']:.6f}</td>
-                                <td>{row[f'Lower Limit [{unit}]']:.6f}</td>
-                                <td>{row[f'Upper Limit [{unit}]']:.6f}</td>
-                                <td>{row[f'Mean [{unit}]']:.6f}</td>
-                                <td>{row[f'StdDev [{unit}]']:.6f}</td>
-                                <td>{row[f'Min [{unit}]']:.6f}</td>
-                                <td>{row[f'Max [{unit}]']:.6f}</td>
-                                <td>{row['Samples']}</td>
-                                <td class="{mean_class}">{row['Mean Check']}</td>
-                                <td class="{sigma_class}">{row['Mean±2σ Check']}</td>
-                            </tr>
-'''
-    
-    html_content += '''
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let legendsVisible = false;
-        
-        function toggleSection(sectionId) {
-            const section = document.getElementById(sectionId);
-            const toggle = document.getElementById(sectionId + '-toggle');
-            section.classList.toggle('active');
-            toggle.textContent = section.classList.contains('active') ? '▼' : '▶';
-        }
-        
-        function toggleAllLegends() {
-            legendsVisible = !legendsVisible;
-            const charts = document.querySelectorAll('.chart-wrapper .plotly-graph-div');
-            const btn = document.querySelector('.toggle-legend-btn');
-            const icon = document.getElementById('legend-btn-icon');
-            
-            charts.forEach(function(chart) {
-                Plotly.relayout(chart, { showlegend: legendsVisible });
-            });
-            
-            if (legendsVisible) {
-                btn.classList.remove('legends-hidden');
-                icon.textContent = '👁️';
-            } else {
-                btn.classList.add('legends-hidden');
-                icon.textContent = '👁️‍🗨️';
-            }
-        }
-        
-        function filterTable() {
-            const channelFilter = document.getElementById('channel-filter').value;
-            const ioFilter = document.getElementById('io-filter').value;
-            const rangeFilter = document.getElementById('range-filter').value;
-            const testValueFilter = document.getElementById('testvalue-filter').value;
-            const statusFilter = document.getElementById('status-filter').value;
-            const searchInput = document.getElementById('search-input').value.toLowerCase();
-            const table = document.getElementById('results-table');
-            const rows = table.getElementsByTagName('tr');
-            
-            let visibleCount = 0;
-            let totalCount = rows.length - 1; // Exclude header
-            
-            for (let i = 1; i < rows.length; i++) {
-                const row = rows[i];
-                const cells = row.getElementsByTagName('td');
-                
-                let showRow = true;
-                
-                // Channel filter (column 0)
-                if (channelFilter !== 'all' && showRow) {
-                    const channel = cells[0].textContent;
-                    if (channel !== channelFilter) showRow = false;
-                }
-                
-                // I/O Type filter (column 1)
-                if (ioFilter !== 'all' && showRow) {
-                    const ioType = cells[1].textContent;
-                    if (ioType !== ioFilter) showRow = false;
-                }
-                
-                // Range filter (column 2)
-                if (rangeFilter !== 'all' && showRow) {
-                    const range = cells[2].textContent;
-                    if (range !== rangeFilter) showRow = false;
-                }
-                
-                // Test Value filter (column 3)
-                if (testValueFilter !== 'all' && showRow) {
-                    const testValue = parseFloat(cells[3].textContent);
-                    const filterValue = parseFloat(testValueFilter);
-                    if (Math.abs(testValue - filterValue) > 0.000001) showRow = false;
-                }
-                
-                // Status filter (columns 13 and 14)
-                if (statusFilter !== 'all' && showRow) {
-                    const meanCheck = cells[13].textContent;
-                    const sigmaCheck = cells[14].textContent;
-                    if (statusFilter === 'pass') {
-                        if (meanCheck !== 'PASS' || sigmaCheck !== 'PASS') showRow = false;
-                    } else if (statusFilter === 'fail') {
-                        if (meanCheck !== 'FAIL' && sigmaCheck !== 'FAIL') showRow = false;
-                    }
-                }
-                
-                // Search filter
-                if (searchInput && showRow) {
-                    let found = false;
-                    for (let j = 0; j < cells.length; j++) {
-                        if (cells[j].textContent.toLowerCase().includes(searchInput)) {
-                            found = true;
-                            break;
-                        }
-                    }
-                    if (!found) showRow = false;
-                }
-                
-                row.style.display = showRow ? '' : 'none';
-                if (showRow) visibleCount++;
-            }
-            
-            // Update filter count
-            const countEl = document.getElementById('filter-count');
-            if (visibleCount === totalCount) {
-                countEl.textContent = `Showing all ${totalCount} rows`;
-            } else {
-                countEl.textContent = `Showing ${visibleCount} of ${totalCount} rows`;
-            }
-        }
-        
-        function clearFilters() {
-            document.getElementById('channel-filter').value = 'all';
-            document.getElementById('io-filter').value = 'all';
-            document.getElementById('range-filter').value = 'all';
-            document.getElementById('testvalue-filter').value = 'all';
-            document.getElementById('status-filter').value = 'all';
-            document.getElementById('search-input').value = '';
-            filterTable();
-        }
-        
-        // Resize all Plotly charts when window resizes
-        window.addEventListener('resize', function() {
-            const charts = document.querySelectorAll('.chart-wrapper .plotly-graph-div');
-            charts.forEach(function(chart) {
-                Plotly.Plots.resize(chart);
-            });
-        });
-        
-        // Initial setup after page load
-        window.addEventListener('load', function() {
-            setTimeout(function() {
-                const charts = document.querySelectorAll('.chart-wrapper .plotly-graph-div');
-                charts.forEach(function(chart) {
-                    Plotly.Plots.resize(chart);
-                });
-                // Initialize filter count
-                filterTable();
-            }, 100);
-        });
-    </script>
-</body>
-</html>
-'''
-    
-    # Write HTML file
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Table rows are rendered column-wise in Python and dropped into the template as one block
+    mean_checks = df_results['Mean Check'].to_numpy()
+    sigma_checks = df_results['Mean±2σ Check'].to_numpy()
+    table_rows, deferred_pages = _table_rows_html({
+        'channel': df_results['Channel'].to_numpy(),
+        'io_type': df_results['I/O Type'].to_numpy(),
+        'range_setting': df_results['Range Setting'].to_numpy(),
+        'test_value': df_results[test_value_col].to_numpy(),
+        'reference': df_results[ref_col].to_numpy(),
+        'tolerance': df_results[tol_col].to_numpy(),
+        'lower_limit': df_results[lower_col].to_numpy(),
+        'upper_limit': df_results[upper_col].to_numpy(),
+        'mean': df_results[mean_col].to_numpy(),
+        'stddev': df_results[std_col].to_numpy(),
+        'min': df_results[min_col].to_numpy(),
+        'max': df_results[max_col].to_numpy(),
+        'samples': df_results['Samples'].to_numpy(),
+        'mean_class': np.where(mean_checks == 'PASS', 'pass', 'fail'),
+        'mean_check': mean_checks,
+        'sigma_class': np.where(sigma_checks == 'PASS', 'pass', 'fail'),
+        'sigma_check': sigma_checks,
+    })
+    
+    # Render the page, streaming it through a large buffer (or the gzip stream)
+    with _open_report(html_file) as f:
+        _REPORT_TEMPLATE.stream(
+            report_name=report_name,
+            report_generated=report_generated_str,
+            data_collected=data_collected_str,
+            total_tests=len(df_results),
+            summary_pass=summary_pass,
+            summary_fail=summary_fail,
+            summary_2s_pass=summary_2s_pass,
+            summary_2s_fail=summary_2s_fail,
+            tolerance_charts=figures_html,
+            deviation_charts=deviation_charts,
+            filter_options=filter_options,
+            unit=unit,
+            table_rows=table_rows,
+            # Escape "</" so row markup cannot close the JSON <script> element
+            deferred_rows=_dumps(deferred_pages).replace('</', '<\\/') if deferred_pages else None,
+        ).dump(f)
     
     print(f"✓ Interactive HTML report saved to {html_file}")
     return html_file
\ No newline at end of file
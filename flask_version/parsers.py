@@ -1,3 +1,4 @@
+import os
 import re
 from pathlib import Path
 
@@ -132,10 +133,21 @@ def get_unit_from_files(input_dir):
     """
     Determine the measurement unit from filenames.
     """
-    all_files = list(Path(input_dir).glob('*.csv')) + list(Path(input_dir).glob('*.txt'))
-    
-    for file in all_files:
-        _, unit, _, _ = parse_filename(file.name)
+    # One directory scan; CSV filenames are checked as they come, TXT filenames afterwards.
+    # Suffixes are matched case-insensitively, like the upload filter that saved the files.
+    txt_names = []
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if name.endswith('.csv'):
+                _, unit, _, _ = parse_filename(entry.name)
+                if unit and unit != 'unknown':
+                    return unit
+            elif name.endswith('.txt'):
+                txt_names.append(entry.name)
+    
+    for name in txt_names:
+        _, unit, _, _ = parse_filename(name)
         if unit and unit != 'unknown':
             return unit
     
@@ -1,6 +1,7 @@
 # __init__.py
 from .parsers import (
     parse_filename,
+    scan_data_files,
     get_unit_from_files,
     scan_text_file_for_measurement_types,
     parse_text_file
@@ -13,6 +14,7 @@ from .main import process_files
 
 __all__ = [
     'parse_filename',
+    'scan_data_files',
     'get_unit_from_files',
     'scan_text_file_for_measurement_types',
     'parse_text_file',
@@ -1,9 +1,129 @@
 import os
 import json
+import threading
+from operator import itemgetter
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 
+# Optional fast JSON encoder for saving configurations
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Dialog fonts
+FONT_9 = ('Segoe UI', 9)
+FONT_9B = ('Segoe UI', 9, 'bold')
+FONT_9I = ('Segoe UI', 9, 'italic')
+FONT_10 = ('Segoe UI', 10)
+FONT_10B = ('Segoe UI', 10, 'bold')
+FONT_11 = ('Segoe UI', 11)
+FONT_11B = ('Segoe UI', 11, 'bold')
+FONT_14B = ('Segoe UI', 14, 'bold')
+FONT_16B = ('Segoe UI', 16, 'bold')
+
+CONFIG_ROW_HEIGHT = 28  # px per row in the configuration dialog's table
+
+# Configuration table columns, and the ones the user can edit
+_CONFIG_COLUMNS = ('test', 'io', 'range', 'reference', 'tolerance')
+_EDITABLE_COLUMNS = ('range', 'reference', 'tolerance')
+
+# Configuration row colours by (I/O type, row parity): (row background, text colour).
+# Input rows are green-tinted with dark green text, Output rows blue-tinted with dark blue text.
+_ROW_STYLE = {
+    ('Input', 0): ('#E8F4E8', '#006400'),
+    ('Input', 1): ('#F0FAF0', '#006400'),
+    ('Output', 0): ('#E8E8F4', '#00008B'),
+    ('Output', 1): ('#F0F0FA', '#00008B'),
+}
+
+_ROOT = None
+
+# Parsed config files by path, with the (mtime, size) they were read at
+_CONFIG_CACHE = {}
+
+
+def get_root():
+    """
+    The process-wide hidden Tk root, created (with the clam theme) on first use.
+    Dialogs open as Toplevels on it, so the Tcl interpreter and theme load only once.
+    """
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()
+        ttk.Style(_ROOT).theme_use('clam')
+    return _ROOT
+
+
+def _load_config_json(file_path):
+    """Read a config JSON file, reusing the parsed copy while its mtime and size are unchanged."""
+    st = os.stat(file_path)
+    fingerprint = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(file_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    with open(file_path, 'r', encoding='utf-8') as f:
+        config_data = json.load(f)
+    _CONFIG_CACHE[file_path] = (fingerprint, config_data)
+    return config_data
+
+
+def _write_config_json(file_path, config_data):
+    """Write a config file; runs on a worker thread, so it must not touch any Tk object."""
+    if ORJSON_AVAILABLE:
+        Path(file_path).write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        return
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(config_data, f, indent=2)
+
+
+def _show_centered(window, width, height):
+    """
+    Size and centre a dialog that was built withdrawn, then show it. The position comes
+    from the screen size, so the layout is computed once, when the window is mapped.
+    """
+    x = (window.winfo_screenwidth() - width) // 2
+    y = (window.winfo_screenheight() - height) // 2
+    window.geometry(f'{width}x{height}+{x}+{y}')
+    window.deiconify()
+
+
+def _inputs_from_config(config_data, needed, unit):
+    """
+    Build the get_user_inputs result from a saved config, or return None if the
+    config is for another unit, misses one of the needed keys or has a bad value.
+    """
+    if config_data.get('unit') != unit:
+        return None
+    
+    entries = {
+        (entry['test_value'], entry['range_setting'], entry['io_type']): entry
+        for entry in config_data.get('configurations', [])
+    }
+    if not needed <= entries.keys():
+        return None
+    
+    user_inputs = {}
+    try:
+        for key in needed:
+            entry = entries[key]
+            range_str = str(entry.get('range_input') or 'N/A').strip()
+            tolerance = float(str(entry.get('tolerance', '0.015')).strip().replace(',', '.'))
+            if tolerance < 0:
+                return None
+            user_inputs[key] = {
+                'range': None if range_str.upper() == 'N/A' or range_str == '' else range_str,
+                'reference': float(str(entry.get('reference', key[0])).strip().replace(',', '.')),
+                'tolerance': tolerance
+            }
+    except ValueError:
+        return None
+    return user_inputs
+
+
 def select_measurement_type(file_measurement_types):
     """
     Show a dialog to let user select which measurement type to process
@@ -20,30 +140,27 @@ def select_measurement_type(file_measurement_types):
     
     if not files_with_multiple:
         # No selection needed - return the single type for each file
-        return {f: list(types)[0] if types else None for f, types in file_measurement_types.items()}
+        return {f: next(iter(types), None) for f, types in file_measurement_types.items()}
     
     # Create selection dialog
-    root = tk.Tk()
+    root = tk.Toplevel(get_root())
+    root.withdraw()  # built hidden, then laid out and shown once by _show_centered
     root.title("Measurement Type Selection")
-    root.geometry("700x500")
     root.resizable(True, True)
     
-    style = ttk.Style()
-    style.theme_use('clam')
-    
     # Header
     header_frame = tk.Frame(root, bg='#1F4E78', height=80)
     header_frame.pack(fill='x')
     header_frame.pack_propagate(False)
     
     title_label = tk.Label(header_frame, text="Measurement Type Selection", 
-                          font=('Segoe UI', 14, 'bold'), 
+                          font=FONT_14B, 
                           bg='#1F4E78', fg='white')
     title_label.pack(pady=10)
     
     subtitle_label = tk.Label(header_frame, 
                              text="Some files have multiple measurement types per channel. Select which to process:", 
-                             font=('Segoe UI', 10), 
+                             font=FONT_10, 
                              bg='#1F4E78', fg='white')
     subtitle_label.pack()
     
@@ -70,23 +187,23 @@ def select_measurement_type(file_measurement_types):
         
         # File label
         file_label = tk.Label(frame, text=Path(filename).name, 
-                             font=('Segoe UI', 10, 'bold'), bg=bg_color, 
+                             font=FONT_10B, bg=bg_color, 
                              anchor='w', width=40)
-        file_label.pack(side='left', padx=10)
+        file_label.grid(row=0, column=0, padx=10, sticky='w')
         
         # Dropdown for measurement type
-        types_list = sorted(list(types))
+        types_list = sorted(types)
         var = tk.StringVar(value=types_list[0])
         selection_vars[filename] = var
         
         dropdown = ttk.Combobox(frame, textvariable=var, values=types_list, 
                                state='readonly', width=20)
-        dropdown.pack(side='left', padx=10)
+        dropdown.grid(row=0, column=1, padx=10, sticky='w')
         
         # Description of types
         desc_label = tk.Label(frame, text=f"Available: {', '.join(types_list)}", 
-                             font=('Segoe UI', 9), bg=bg_color, fg='gray')
-        desc_label.pack(side='left', padx=10)
+                             font=FONT_9, bg=bg_color, fg='gray')
+        desc_label.grid(row=0, column=2, padx=10, sticky='w')
     
     canvas.pack(side="left", fill="both", expand=True, padx=10, pady=(10, 90))
     scrollbar.pack(side="right", fill="y", pady=(10, 90))
@@ -101,31 +218,24 @@ def select_measurement_type(file_measurement_types):
     
     def on_submit():
         result['cancelled'] = False
-        root.quit()
         root.destroy()
     
     def on_cancel():
         result['cancelled'] = True
-        root.quit()
         root.destroy()
     
     submit_btn = tk.Button(button_frame, text="Continue", command=on_submit,
-                          font=('Segoe UI', 11, 'bold'), bg='#0070C0', fg='white',
+                          font=FONT_11B, bg='#0070C0', fg='white',
                           width=12, height=2, cursor='hand2', relief='raised', bd=2)
     submit_btn.pack(side='right', padx=20, pady=15)
     
     cancel_btn = tk.Button(button_frame, text="Cancel", command=on_cancel,
-                          font=('Segoe UI', 11), bg='#E0E0E0', fg='black',
+                          font=FONT_11, bg='#E0E0E0', fg='black',
                           width=12, height=2, cursor='hand2', relief='raised', bd=2)
     cancel_btn.pack(side='right', padx=5, pady=15)
     
-    # Center window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f'+{x}+{y}')
-    
-    root.mainloop()
+    _show_centered(root, 700, 500)
+    root.wait_window()
     
     if result['cancelled']:
         return None
@@ -136,7 +246,7 @@ def select_measurement_type(file_measurement_types):
         if filename in selection_vars:
             selections[filename] = selection_vars[filename].get()
         elif len(types) == 1:
-            selections[filename] = list(types)[0]
+            selections[filename] = next(iter(types))
         else:
             selections[filename] = None
     
@@ -156,127 +266,187 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
     Returns:
     - Dictionary mapping (test_value, range_setting, io_type) to config dict
     """
+    # A saved config that covers every combination needs no dialog at all
+    if input_dir:
+        default_config_path = os.path.join(input_dir, "test_config.json")
+        if os.path.exists(default_config_path):
+            try:
+                saved_inputs = _inputs_from_config(_load_config_json(default_config_path),
+                                                   set(test_value_range_io_tuples), unit)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                saved_inputs = None
+            if saved_inputs is not None:
+                print(f"Using saved configuration from {default_config_path}")
+                return saved_inputs
+    
     user_inputs = {}
     
-    root = tk.Tk()
+    root = tk.Toplevel(get_root())
+    root.withdraw()  # built hidden, then laid out and shown once by _show_centered
     root.title("Test Configuration Input")
-    root.geometry("950x750")
     root.resizable(True, True)
     
-    style = ttk.Style()
-    style.theme_use('clam')
-    
     # Header
     header_frame = tk.Frame(root, bg='#1F4E78', height=100)
     header_frame.pack(fill='x')
     header_frame.pack_propagate(False)
     
     title_label = tk.Label(header_frame, text="Test Configuration Input", 
-                          font=('Segoe UI', 16, 'bold'), 
+                          font=FONT_16B, 
                           bg='#1F4E78', fg='white')
     title_label.pack(pady=10)
     
     subtitle_label = tk.Label(header_frame, 
                              text=f"Configure range, reference value, and tolerance for each test ({unit})", 
-                             font=('Segoe UI', 10), 
+                             font=FONT_10, 
                              bg='#1F4E78', fg='white')
     subtitle_label.pack()
     
-    # Scrollable frame
-    canvas = tk.Canvas(root, bg='white')
-    scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg='white')
-    
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
+    # Configuration table: one native Treeview row per test. The range, reference and
+    # tolerance cells are edited through an Entry laid over the cell on double-click.
+    table_frame = tk.Frame(root, bg='white')
+    
+    style = ttk.Style(root)
+    style.configure('Config.Treeview', font=FONT_10, rowheight=CONFIG_ROW_HEIGHT)
+    style.configure('Config.Treeview.Heading', font=FONT_10B, background='#E8E8E8')
+    
+    tree = ttk.Treeview(table_frame, columns=_CONFIG_COLUMNS, show='headings',
+                        selectmode='browse', style='Config.Treeview')
+    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    
+    for column, heading, width in (
+        ('test', "Test Value", 130),
+        ('io', "I/O Type", 100),
+        ('range', "Range Setting", 130),
+        ('reference', f"Reference Value [{unit}]", 170),
+        ('tolerance', f"Tolerance (±) [{unit}]", 150),
+    ):
+        tree.heading(column, text=heading, anchor='w')
+        tree.column(column, width=width, anchor='w')
+    
+    # Input rows are green-tinted, Output rows blue-tinted, alternating by row
+    for (io_type, parity), (bg_color, io_color) in _ROW_STYLE.items():
+        tree.tag_configure(f'{io_type}-{parity}', background=bg_color, foreground=io_color)
     
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-    
-    # Column headers
-    header_row = tk.Frame(scrollable_frame, bg='#E8E8E8', pady=8)
-    header_row.pack(fill='x', padx=10, pady=(10, 5))
-    
-    tk.Label(header_row, text="Test Value", font=('Segoe UI', 10, 'bold'), 
-             bg='#E8E8E8', width=14, anchor='w').pack(side='left', padx=5)
-    tk.Label(header_row, text="I/O Type", font=('Segoe UI', 10, 'bold'), 
-             bg='#E8E8E8', width=10, anchor='w').pack(side='left', padx=5)
-    tk.Label(header_row, text="Range Setting", font=('Segoe UI', 10, 'bold'), 
-             bg='#E8E8E8', width=12, anchor='w').pack(side='left', padx=5)
-    tk.Label(header_row, text="Reference Value", font=('Segoe UI', 10, 'bold'), 
-             bg='#E8E8E8', width=14, anchor='w').pack(side='left', padx=5)
-    tk.Label(header_row, text="Tolerance (±)", font=('Segoe UI', 10, 'bold'), 
-             bg='#E8E8E8', width=12, anchor='w').pack(side='left', padx=5)
-    
-    # Entry fields
-    entry_widgets = {}
     # Sort by test value, then by I/O type (Input first, then Output), then by range
-    sorted_tuples = sorted(test_value_range_io_tuples, key=lambda x: (x[0], x[2], x[1] or ''))
-    
-    for i, (test_value, range_setting, io_type) in enumerate(sorted_tuples):
-        # Use different background colors for Input vs Output
-        if io_type == 'Input':
-            bg_color = '#E8F4E8' if i % 2 == 0 else '#F0FAF0'  # Light green tint
-        else:
-            bg_color = '#E8E8F4' if i % 2 == 0 else '#F0F0FA'  # Light blue tint
-        
-        frame = tk.Frame(scrollable_frame, bg=bg_color, pady=8)
-        frame.pack(fill='x', padx=10, pady=2)
-        
-        # Test value label
-        label = tk.Label(frame, text=f"{test_value:+.4g} {unit}", 
-                        font=('Segoe UI', 10), bg=bg_color, width=14, anchor='w')
-        label.pack(side='left', padx=5)
-        
-        # I/O Type label with color coding
-        io_color = '#006400' if io_type == 'Input' else '#00008B'  # Dark green for Input, Dark blue for Output
-        io_label = tk.Label(frame, text=io_type, 
-                           font=('Segoe UI', 10, 'bold'), bg=bg_color, fg=io_color, width=10, anchor='w')
-        io_label.pack(side='left', padx=5)
-        
-        # Range setting entry
-        range_entry = ttk.Entry(frame, font=('Segoe UI', 10), width=12)
-        range_entry.pack(side='left', padx=5)
-        range_entry.insert(0, range_setting if range_setting else "N/A")
-        
-        # Reference value entry
-        ref_entry = ttk.Entry(frame, font=('Segoe UI', 10), width=14)
-        ref_entry.pack(side='left', padx=5)
-        ref_entry.insert(0, f"{test_value:.6g}")
+    decorated = [((t[0], t[2], t[1] or ''), t) for t in test_value_range_io_tuples]
+    decorated.sort(key=itemgetter(0))
+    sorted_tuples = [t for _, t in decorated]
+    # Every row's entry text, keyed like user_inputs; the table shows these values
+    row_values = {
+        key: {
+            'range': key[1] if key[1] else "N/A",
+            'reference': f"{key[0]:.6g}",
+            'tolerance': "0.015"
+        }
+        for key in sorted_tuples
+    }
+    row_iids = {key: str(i) for i, key in enumerate(sorted_tuples)}
+    
+    def row_display(key):
+        test_value, _, io_type = key
+        values = row_values[key]
+        return (f"{test_value:+.4g} {unit}", io_type, values['range'], values['reference'], values['tolerance'])
+    
+    for i, key in enumerate(sorted_tuples):
+        tree.insert('', 'end', iid=row_iids[key], values=row_display(key), tags=(f'{key[2]}-{i & 1}',))
+    
+    # Rows are parsed when a cell edit is committed, never per keystroke;
+    # on_submit reads this cache and only parses rows that are missing from it
+    parsed_inputs = {}
+    
+    def parse_row(key):
+        """Parse one row's values into its config dict and cache it. Raises ValueError on bad numbers."""
+        values = row_values[key]
+        range_str = values['range'].strip()
+        final_range = None if range_str.upper() == 'N/A' or range_str == '' else range_str
         
-        # Tolerance entry
-        tol_entry = ttk.Entry(frame, font=('Segoe UI', 10), width=12)
-        tol_entry.pack(side='left', padx=5)
-        tol_entry.insert(0, "0.015")
+        ref_str = values['reference'].strip().replace(',', '.')
+        reference = float(ref_str)
         
-        # Unit label
-        unit_label = tk.Label(frame, text=unit, font=('Segoe UI', 10), bg=bg_color, width=5)
-        unit_label.pack(side='left')
+        tol_str = values['tolerance'].strip().replace(',', '.')
+        tolerance = float(tol_str)
         
-        entry_widgets[(test_value, range_setting, io_type)] = {
-            'range': range_entry,
-            'reference': ref_entry,
-            'tolerance': tol_entry
+        parsed_inputs[key] = {
+            'range': final_range,
+            'reference': reference,
+            'tolerance': tolerance
         }
+        return parsed_inputs[key]
     
-    canvas.pack(side="left", fill="both", expand=True, padx=10, pady=(10, 140))
-    scrollbar.pack(side="right", fill="y", pady=(10, 140))
+    def validate_entry(key):
+        """Refresh the row's cached values after an edit; errors are reported on submit."""
+        try:
+            parse_row(key)
+        except ValueError:
+            parsed_inputs.pop(key, None)
+    
+    # The open cell editor, as (entry, key, column)
+    editor = {}
+    
+    def commit_edit(event=None):
+        """Store the open editor's text in its row and close it."""
+        if 'open' not in editor:
+            return
+        entry, key, column = editor.pop('open')
+        row_values[key][column] = entry.get()
+        entry.destroy()
+        tree.set(row_iids[key], column, row_values[key][column])
+        validate_entry(key)
+    
+    def cancel_edit(event=None):
+        if 'open' in editor:
+            editor.pop('open')[0].destroy()
+    
+    def start_edit(event):
+        """Open an editor over the double-clicked range, reference or tolerance cell."""
+        iid = tree.identify_row(event.y)
+        column_id = tree.identify_column(event.x)
+        if not iid or not column_id:
+            return
+        column = _CONFIG_COLUMNS[int(column_id[1:]) - 1]
+        if column not in _EDITABLE_COLUMNS:
+            return
+        commit_edit()
+        
+        bbox = tree.bbox(iid, column_id)
+        if not bbox:
+            return
+        key = sorted_tuples[int(iid)]
+        x, y, width, height = bbox
+        entry = ttk.Entry(tree, font=FONT_10)
+        entry.insert(0, row_values[key][column])
+        entry.select_range(0, tk.END)
+        entry.place(x=x, y=y, width=width, height=height)
+        entry.focus_set()
+        entry.bind('<Return>', commit_edit)
+        entry.bind('<FocusOut>', commit_edit)
+        entry.bind('<Escape>', cancel_edit)
+        editor['open'] = (entry, key, column)
+    
+    tree.bind('<Double-1>', start_edit)
+    # The editor is placed over a cell, so scrolling closes it rather than leave it behind
+    tree.bind('<MouseWheel>', commit_edit, add='+')
+    scrollbar.bind('<ButtonPress-1>', commit_edit, add='+')
     
     # Legend frame
-    legend_frame = tk.Frame(scrollable_frame, bg='white', pady=10)
-    legend_frame.pack(fill='x', padx=10, pady=(20, 5))
+    legend_frame = tk.Frame(table_frame, bg='white', pady=10)
+    legend_frame.pack(side='bottom', fill='x', padx=10, pady=(10, 5))
     
-    tk.Label(legend_frame, text="Legend: ", font=('Segoe UI', 9, 'bold'), bg='white').pack(side='left', padx=5)
+    tk.Label(legend_frame, text="Legend: ", font=FONT_9B, bg='white').pack(side='left', padx=5)
     tk.Label(legend_frame, text="■ Input (TXT files - e.g., Voltmeter readings)", 
-             font=('Segoe UI', 9), bg='white', fg='#006400').pack(side='left', padx=10)
+             font=FONT_9, bg='white', fg='#006400').pack(side='left', padx=10)
     tk.Label(legend_frame, text="■ Output (CSV files - e.g., Power supply output)", 
-             font=('Segoe UI', 9), bg='white', fg='#00008B').pack(side='left', padx=10)
+             font=FONT_9, bg='white', fg='#00008B').pack(side='left', padx=10)
+    
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    table_frame.pack(fill="both", expand=True, padx=10, pady=(10, 140))
     
     # Button frame with two rows
     button_frame = tk.Frame(root, bg='#F0F0F0', height=130)
-    button_frame.pack(fill='x', side='bottom', pady=0, before=canvas)
+    button_frame.pack(fill='x', side='bottom', pady=0, before=table_frame)
     button_frame.pack_propagate(False)
     button_frame.lift()
     
@@ -287,25 +457,27 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
     # Status label for showing load/save messages
     status_var = tk.StringVar(value="")
     status_label = tk.Label(config_row, textvariable=status_var, 
-                           font=('Segoe UI', 9, 'italic'), bg='#F0F0F0', fg='#666666')
+                           font=FONT_9I, bg='#F0F0F0', fg='#666666')
     status_label.pack(side='left', padx=20)
     
     def save_config():
         """Save current configuration to a JSON file"""
+        commit_edit()
         try:
             config_data = {
                 'unit': unit,
                 'configurations': []
             }
             
-            for (test_value, range_setting, io_type), entries in entry_widgets.items():
+            for test_value, range_setting, io_type in sorted_tuples:
+                values = row_values[(test_value, range_setting, io_type)]
                 config_entry = {
                     'test_value': test_value,
                     'range_setting': range_setting,
                     'io_type': io_type,
-                    'range_input': entries['range'].get().strip(),
-                    'reference': entries['reference'].get().strip(),
-                    'tolerance': entries['tolerance'].get().strip()
+                    'range_input': values['range'].strip(),
+                    'reference': values['reference'].strip(),
+                    'tolerance': values['tolerance'].strip()
                 }
                 config_data['configurations'].append(config_entry)
             
@@ -325,10 +497,30 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config_data, f, indent=2)
-                status_var.set(f"✓ Configuration saved to {Path(file_path).name}")
-                root.after(5000, lambda: status_var.set(""))  # Clear after 5 seconds
+                # Serialize and write on a worker thread (Tk calls stay on this one); the
+                # thread is not a daemon, so exiting the program still lets the write finish
+                outcome = {}
+                
+                def write():
+                    try:
+                        _write_config_json(file_path, config_data)
+                    except Exception as e:
+                        outcome['error'] = e
+                
+                worker = threading.Thread(target=write)
+                worker.start()
+                
+                def check_saved():
+                    if worker.is_alive():
+                        root.after(50, check_saved)
+                    elif 'error' in outcome:
+                        messagebox.showerror("Save Error", f"Failed to save configuration:\n{str(outcome['error'])}")
+                    else:
+                        status_var.set(f"✓ Configuration saved to {Path(file_path).name}")
+                        root.after(5000, lambda: status_var.set(""))  # Clear after 5 seconds
+                
+                status_var.set(f"Saving configuration to {Path(file_path).name}...")
+                root.after(50, check_saved)
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save configuration:\n{str(e)}")
     
@@ -348,10 +540,10 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
             messagebox.showerror("Load Error", f"Failed to load configuration:\n{str(e)}")
     
     def apply_config_file(file_path):
-        """Apply configuration from a file to the entry widgets"""
+        """Apply configuration from a file to the table"""
+        cancel_edit()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = _load_config_json(file_path)
             
             # Check unit compatibility
             if config_data.get('unit') != unit:
@@ -371,20 +563,16 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
                     config_entry['io_type']
                 )
                 
-                if key in entry_widgets:
-                    entries = entry_widgets[key]
-                    
-                    # Clear and set range
-                    entries['range'].delete(0, tk.END)
-                    entries['range'].insert(0, config_entry.get('range_input', 'N/A'))
-                    
-                    # Clear and set reference
-                    entries['reference'].delete(0, tk.END)
-                    entries['reference'].insert(0, config_entry.get('reference', str(key[0])))
+                if key in row_values:
+                    # Hand-edited files may hold numbers or null here; the table keeps text
+                    row_values[key] = {
+                        'range': str(config_entry.get('range_input') or 'N/A'),
+                        'reference': str(config_entry.get('reference', key[0])),
+                        'tolerance': str(config_entry.get('tolerance', '0.015'))
+                    }
                     
-                    # Clear and set tolerance
-                    entries['tolerance'].delete(0, tk.END)
-                    entries['tolerance'].insert(0, config_entry.get('tolerance', '0.015'))
+                    tree.item(row_iids[key], values=row_display(key))
+                    validate_entry(key)
                     
                     loaded_count += 1
             
@@ -394,12 +582,12 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
             messagebox.showerror("Load Error", f"Failed to apply configuration:\n{str(e)}")
     
     save_btn = tk.Button(config_row, text="💾 Save Config", command=save_config,
-                        font=('Segoe UI', 10), bg='#5B9BD5', fg='white',
+                        font=FONT_10, bg='#5B9BD5', fg='white',
                         width=14, height=1, cursor='hand2', relief='raised', bd=2)
     save_btn.pack(side='right', padx=5)
     
     load_btn = tk.Button(config_row, text="📂 Load Config", command=load_config,
-                        font=('Segoe UI', 10), bg='#5B9BD5', fg='white',
+                        font=FONT_10, bg='#5B9BD5', fg='white',
                         width=14, height=1, cursor='hand2', relief='raised', bd=2)
     load_btn.pack(side='right', padx=5)
     
@@ -410,58 +598,39 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
     result = {'cancelled': False}
     
     def on_submit():
+        # Clicking Submit does not move focus, so a cell still being edited has not been committed
+        commit_edit()
+        
         try:
-            for (test_value, range_setting, io_type), entries in entry_widgets.items():
-                range_str = entries['range'].get().strip()
-                final_range = None if range_str.upper() == 'N/A' or range_str == '' else range_str
-                
-                ref_str = entries['reference'].get().strip().replace(',', '.')
-                reference = float(ref_str)
+            for key in sorted_tuples:
+                config = parsed_inputs.get(key) or parse_row(key)
                 
-                tol_str = entries['tolerance'].get().strip().replace(',', '.')
-                tolerance = float(tol_str)
-                
-                if tolerance < 0:
+                if config['tolerance'] < 0:
+                    test_value, _, io_type = key
                     messagebox.showerror("Error", f"Tolerance for {test_value} {unit} ({io_type}) must be positive!")
                     return
                 
-                user_inputs[(test_value, range_setting, io_type)] = {
-                    'range': final_range,
-                    'reference': reference,
-                    'tolerance': tolerance
-                }
+                user_inputs[key] = config
             
             result['cancelled'] = False
-            root.quit()
             root.destroy()
         except ValueError as e:
             messagebox.showerror("Error", f"Please enter valid numbers!\n{str(e)}")
     
     def on_cancel():
         result['cancelled'] = True
-        root.quit()
         root.destroy()
     
     submit_btn = tk.Button(action_row, text="Submit", command=on_submit,
-                          font=('Segoe UI', 11, 'bold'), bg='#0070C0', fg='white',
+                          font=FONT_11B, bg='#0070C0', fg='white',
                           width=12, height=2, cursor='hand2', relief='raised', bd=2)
     submit_btn.pack(side='right', padx=20)
     
     cancel_btn = tk.Button(action_row, text="Cancel", command=on_cancel,
-                          font=('Segoe UI', 11), bg='#E0E0E0', fg='black',
+                          font=FONT_11, bg='#E0E0E0', fg='black',
                           width=12, height=2, cursor='hand2', relief='raised', bd=2)
     cancel_btn.pack(side='right', padx=5)
     
-    # Center window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f'+{x}+{y}')
-    
-    def on_mousewheel(event):
-        canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-    
-    canvas.bind_all("<MouseWheel>", on_mousewheel)
     
     # Auto-load config if exists in input directory
     if input_dir:
@@ -469,7 +638,8 @@ def get_user_inputs(test_value_range_io_tuples, unit, input_dir=None):
         if os.path.exists(default_config_path):
             root.after(100, lambda: apply_config_file(default_config_path))
     
-    root.mainloop()
+    _show_centered(root, 950, 750)
+    root.wait_window()
     
     if result['cancelled']:
         return None
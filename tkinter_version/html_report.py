@@ -1,12 +1,24 @@
+import gzip
+import json
+import string
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from utils import PLOTLY_AVAILABLE, CHANNEL_COLORS_HEX
 
 if PLOTLY_AVAILABLE:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
 
+# Optional fast JSON encoder for the report's data islands
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 '''
 def create_tolerance_charts(excel_file, df_results, unit):
     """
@@ -263,347 +275,89 @@ def create_tolerance_charts(excel_file, df_results, unit):
     
     return color_assignments
 '''
-def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
-    """
-    Create an interactive HTML report using Plotly with tolerance charts and data tables.
-    
-    Parameters:
-    - output_file: Path to the output Excel file
-    - df_results: DataFrame with results
-    - unit: Measurement unit
-    - data_file_timestamp: Optional datetime of the first data file (for "Data collected on")
-    """
-    if not PLOTLY_AVAILABLE:
-        print("Warning: Plotly not available. Skipping HTML report generation.")
-        print("  Install with: pip install plotly")
-        return None
-    
-    print("\nCreating interactive HTML report...")
-    
-    # Generate HTML filename
-    html_file = output_file.replace('.xlsx', '_report.html')
-    
-    # Pleasant, muted color palette for channels (matching Excel charts)
-    channel_colors = [
-        '#4472C4',  # Muted blue
-        '#C45B5B',  # Muted red
-        '#70AD47',  # Muted green
-        '#ED7D31',  # Muted orange
-        '#7B7B7B',  # Gray
-        '#9E5ECE',  # Muted purple
-        '#43A6A2',  # Muted teal
-        '#C4A24E',  # Muted gold
-        '#5B9BC4',  # Steel blue
-        '#A85B5B',  # Dusty rose
-        '#5BAF7B',  # Sea green
-        '#C47B4E',  # Terracotta
-        '#6B6BAF',  # Muted indigo
-        '#8B6BAF',  # Muted violet
-        '#4EAFAF',  # Turquoise
-        '#AF8B4E',  # Bronze
-    ]
-    
-    # Get unique combinations for charts
-    unique_combinations = df_results.groupby([f'Test Value [{unit}]', 'Range Setting', 'I/O Type']).size().reset_index()
-    unique_combinations = unique_combinations.sort_values([f'Test Value [{unit}]', 'Range Setting', 'I/O Type'])
-    
-    num_charts = len(unique_combinations)
-    
-    # Create figures list
-    figures_html = []
-    
-    for _, combo_row in unique_combinations.iterrows():
-        test_value = combo_row[f'Test Value [{unit}]']
-        range_setting = combo_row['Range Setting']
-        io_type = combo_row['I/O Type']
-        
-        mask = (
-            (df_results[f'Test Value [{unit}]'] == test_value) &
-            (df_results['Range Setting'] == range_setting) &
-            (df_results['I/O Type'] == io_type)
-        )
-        test_data = df_results[mask].copy()
-        test_data = test_data.sort_values('Channel')
-        
-        if len(test_data) == 0:
-            continue
-        
-        channels = test_data['Channel'].tolist()
-        lower_limits = test_data[f'Lower Limit [{unit}]'].tolist()
-        upper_limits = test_data[f'Upper Limit [{unit}]'].tolist()
-        reference_values = test_data[f'Reference Value [{unit}]'].tolist()
-        means = test_data[f'Mean [{unit}]'].tolist()
-        stddevs = test_data[f'StdDev [{unit}]'].tolist()
-        lower_2sigma = [m - 2*s for m, s in zip(means, stddevs)]
-        upper_2sigma = [m + 2*s for m, s in zip(means, stddevs)]
-        mean_checks = test_data['Mean Check'].tolist()
-        mean_2sigma_checks = test_data['Mean±2σ Check'].tolist()
-        
-        # Get limit values (same for all channels)
-        ref_val = reference_values[0]
-        ll_val = lower_limits[0]
-        ul_val = upper_limits[0]
-        
-        range_display = f", Range: {range_setting}" if range_setting != 'N/A' else ""
-        chart_title = f"Test: {test_value} {unit}{range_display} ({io_type})"
-        
-        # Create figure
-        fig = go.Figure()
-        
-        # Add limit lines (horizontal lines across all channels)
-        x_range = [min(channels) - 0.5, max(channels) + 0.5]
-        
-        # Lower limit line (dashed red)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ll_val, ll_val],
-            mode='lines',
-            name=f'Lower Limit ({ll_val:.6f})',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hoverinfo='name+y'
-        ))
-        
-        # Reference line (solid green)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ref_val, ref_val],
-            mode='lines',
-            name=f'Reference ({ref_val:.6f})',
-            line=dict(color='#2E7D32', width=2),
-            hoverinfo='name+y'
-        ))
-        
-        # Upper limit line (dashed red)
-        fig.add_trace(go.Scatter(
-            x=x_range,
-            y=[ul_val, ul_val],
-            mode='lines',
-            name=f'Upper Limit ({ul_val:.6f})',
-            line=dict(color='#8B0000', width=2, dash='dash'),
-            hoverinfo='name+y'
-        ))
-        
-        # Add data points for each channel
-        for i, channel in enumerate(channels):
-            color = channel_colors[i % len(channel_colors)]
-            
-            # Mean point (diamond)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[means[i]],
-                mode='markers',
-                name=f'CH{channel} Mean',
-                marker=dict(
-                    symbol='diamond',
-                    size=12,
-                    color=color,
-                    line=dict(color=color, width=1)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean: %{{y:.6f}}<br>Check: {mean_checks[i]}<extra></extra>'
-            ))
-            
-            # Mean-2σ point (line marker)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[lower_2sigma[i]],
-                mode='markers',
-                name=f'CH{channel} -2σ',
-                marker=dict(
-                    symbol='line-ew',
-                    size=10,
-                    color=color,
-                    line=dict(color=color, width=3)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean-2σ: %{{y:.6f}}<extra></extra>',
-                showlegend=False
-            ))
-            
-            # Mean+2σ point (line marker)
-            fig.add_trace(go.Scatter(
-                x=[channel],
-                y=[upper_2sigma[i]],
-                mode='markers',
-                name=f'CH{channel} +2σ',
-                marker=dict(
-                    symbol='line-ew',
-                    size=10,
-                    color=color,
-                    line=dict(color=color, width=3)
-                ),
-                hovertemplate=f'CH{channel}<br>Mean+2σ: %{{y:.6f}}<br>±2σ Check: {mean_2sigma_checks[i]}<extra></extra>',
-                showlegend=False
-            ))
-            
-            # Add vertical line connecting -2σ to +2σ
-            fig.add_trace(go.Scatter(
-                x=[channel, channel],
-                y=[lower_2sigma[i], upper_2sigma[i]],
-                mode='lines',
-                line=dict(color=color, width=1),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
-        
-        # Calculate Y-axis range
-        all_values = lower_limits + upper_limits + reference_values + means + lower_2sigma + upper_2sigma
-        y_min = min(all_values)
-        y_max = max(all_values)
-        y_range_val = y_max - y_min if y_max != y_min else abs(y_max) * 0.1 or 0.1
-        y_padding = y_range_val * 0.20
-        
-        # Update layout - title moved outside chart, legends hidden by default
-        fig.update_layout(
-            title=None,  # Title will be added as external HTML element
-            xaxis=dict(
-                title='Channel',
-                tickmode='linear',
-                tick0=min(channels),
-                dtick=1,
-                autorange=True  # Enable autoscale
-            ),
-            yaxis=dict(
-                title=f'Measurement [{unit}]',
-                autorange=True  # Enable autoscale
-            ),
-            legend=dict(
-                orientation='h',
-                yanchor='bottom',
-                y=1.0,
-                xanchor='center',
-                x=0.5,
-                font=dict(size=10),
-                bgcolor='rgba(255,255,255,0.9)',
-                bordercolor='#e9ecef',
-                borderwidth=1
-            ),
-            showlegend=False,  # Legends hidden by default
-            hovermode='closest',
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            margin=dict(l=60, r=20, t=30, b=50),
-            autosize=True
-        )
-        
-        # Add gridlines
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
-        
-        # Store chart with its title and io_type
-        figures_html.append({
-            'title': chart_title,
-            'io_type': io_type,
-            'html': fig.to_html(full_html=False, include_plotlyjs=False, config={'responsive': True})
-        })
-    
-    # Create summary statistics table
-    summary_pass = (df_results['Mean Check'] == 'PASS').sum()
-    summary_fail = (df_results['Mean Check'] == 'FAIL').sum()
-    summary_2s_pass = (df_results['Mean±2σ Check'] == 'PASS').sum()
-    summary_2s_fail = (df_results['Mean±2σ Check'] == 'FAIL').sum()
-    
-    # Get unique values for filters
-    unique_channels = sorted(df_results['Channel'].unique())
-    unique_ranges = sorted(df_results['Range Setting'].unique())
-    unique_test_values = sorted(df_results[f'Test Value [{unit}]'].unique())
-    unique_io_types = sorted(df_results['I/O Type'].unique())
-    
-    # Generate timestamp information
-    report_generated_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    if data_file_timestamp:
-        data_collected_str = data_file_timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    else:
-        data_collected_str = "Unknown"
-    
-    # Build HTML document
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Measurement Report - {Path(output_file).stem}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        * {{
+# Static stylesheet and script of the report, kept out of the per-call f-strings
+_STATIC_CSS = '''
+        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
-        body {{
+        }
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background-color: #f5f7fa;
             color: #333;
             line-height: 1.6;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #5C2D91 0%, #9B59B6 50%, #E8E0F0 100%);
             color: white;
             padding: 30px 40px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             font-size: 28px;
             margin-bottom: 10px;
             text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-        }}
-        .header p {{
+        }
+        .header p {
             opacity: 0.9;
             font-size: 14px;
-        }}
-        .container {{
+        }
+        .container {
             width: 100%;
             padding: 20px 30px;
-        }}
-        .summary-cards {{
+        }
+        .summary-cards {
             display: grid;
             grid-template-columns: repeat(5, 1fr);
             gap: 20px;
             margin: 20px 0;
-        }}
-        @media (max-width: 1200px) {{
-            .summary-cards {{
+        }
+        @media (max-width: 1200px) {
+            .summary-cards {
                 grid-template-columns: repeat(3, 1fr);
-            }}
-        }}
-        @media (max-width: 768px) {{
-            .summary-cards {{
+            }
+        }
+        @media (max-width: 768px) {
+            .summary-cards {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
-        .card {{
+            }
+        }
+        .card {
             background: white;
             border-radius: 8px;
             padding: 12px 15px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.08);
             text-align: center;
-        }}
-        .card h3 {{
+        }
+        .card h3 {
             font-size: 11px;
             color: #666;
             margin-bottom: 6px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
-        .card .value {{
+        }
+        .card .value {
             font-size: 24px;
             font-weight: bold;
-        }}
-        .card.pass .value {{
+        }
+        .card.pass .value {
             color: #2E7D32;
-        }}
-        .card.fail .value {{
+        }
+        .card.fail .value {
             color: #C00000;
-        }}
-        .card.neutral .value {{
+        }
+        .card.neutral .value {
             color: #1F4E78;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             border-radius: 10px;
             margin: 20px 0;
             box-shadow: 0 2px 8px rgba(0,0,0,0.08);
             overflow: hidden;
-        }}
-        .section-header {{
+        }
+        .section-header {
             background: #f8f9fa;
             padding: 15px 20px;
             border-bottom: 1px solid #e9ecef;
@@ -611,112 +365,115 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .section-header:hover {{
+        }
+        .section-header:hover {
             background: #e9ecef;
-        }}
-        .section-header h2 {{
+        }
+        .section-header h2 {
             font-size: 18px;
             color: #1F4E78;
-        }}
-        .section-header .toggle {{
+        }
+        .section-header .toggle {
             font-size: 20px;
             color: #666;
-        }}
-        .section-content {{
+        }
+        .section-content {
             padding: 20px;
-        }}
-        .chart-grid {{
+        }
+        .chart-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 25px;
-        }}
-        @media (max-width: 1400px) {{
-            .chart-grid {{
+        }
+        @media (max-width: 1400px) {
+            .chart-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
-        .chart-container {{
+            }
+        }
+        .chart-container {
             background: #fafafa;
             border-radius: 8px;
             padding: 15px;
             border: 1px solid #e9ecef;
             min-height: 400px;
-        }}
-        .chart-title {{
+        }
+        .chart-title {
             font-size: 16px;
             font-weight: 600;
             margin-bottom: 10px;
             padding: 8px 12px;
             border-radius: 0 4px 4px 0;
-        }}
-        .chart-title.input {{
+        }
+        .chart-title.input {
             color: #2E7D32;
             background: linear-gradient(90deg, #e8f5e9 0%, transparent 100%);
             border-left: 4px solid #2E7D32;
-        }}
-        .chart-title.output {{
+        }
+        .chart-title.output {
             color: #1F4E78;
             background: linear-gradient(90deg, #e0f0ff 0%, transparent 100%);
             border-left: 4px solid #1F4E78;
-        }}
-        .chart-wrapper {{
+        }
+        .chart-wrapper {
             width: 100%;
             height: 380px;
-        }}
-        .chart-wrapper > div {{
+        }
+        .chart-wrapper > div {
             width: 100% !important;
             height: 100% !important;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             font-size: 13px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 10px 12px;
             text-align: left;
             border-bottom: 1px solid #e9ecef;
-        }}
-        th {{
+        }
+        th {
             background: #f8f9fa;
             font-weight: 600;
             color: #1F4E78;
             position: sticky;
             top: 0;
             white-space: nowrap;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background: #f8f9fa;
-        }}
-        .pass {{
+        }
+        tr.filtered-out {
+            display: none;
+        }
+        .pass {
             background-color: #C6EFCE;
             color: #006100;
             font-weight: bold;
             text-align: center;
             border-radius: 4px;
-        }}
-        .fail {{
+        }
+        .fail {
             background-color: #FFC7CE;
             color: #9C0006;
             font-weight: bold;
             text-align: center;
             border-radius: 4px;
-        }}
-        .table-wrapper {{
+        }
+        .table-wrapper {
             max-height: 500px;
             overflow-y: auto;
             border: 1px solid #e9ecef;
             border-radius: 8px;
-        }}
-        .chart-controls {{
+        }
+        .chart-controls {
             display: flex;
             align-items: center;
             gap: 20px;
             margin-bottom: 15px;
             flex-wrap: wrap;
-        }}
-        .toggle-legend-btn {{
+        }
+        .toggle-legend-btn {
             padding: 8px 16px;
             background: #1F4E78;
             color: white;
@@ -729,49 +486,49 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
-        .toggle-legend-btn:hover {{
+        }
+        .toggle-legend-btn:hover {
             background: #2E7D32;
-        }}
-        .toggle-legend-btn.legends-hidden {{
+        }
+        .toggle-legend-btn.legends-hidden {
             background: #666;
-        }}
-        .filter-bar {{
+        }
+        .filter-bar {
             display: flex;
             gap: 10px;
             margin-bottom: 15px;
             flex-wrap: wrap;
             align-items: center;
-        }}
-        .filter-group {{
+        }
+        .filter-group {
             display: flex;
             align-items: center;
             gap: 6px;
             background: #f8f9fa;
             padding: 6px 10px;
             border-radius: 6px;
-        }}
-        .filter-bar label {{
+        }
+        .filter-bar label {
             font-weight: 500;
             color: #666;
             font-size: 13px;
             white-space: nowrap;
-        }}
-        .filter-bar select, .filter-bar input {{
+        }
+        .filter-bar select, .filter-bar input {
             padding: 6px 10px;
             border: 1px solid #ddd;
             border-radius: 4px;
             font-size: 13px;
             min-width: 100px;
-        }}
-        .filter-bar input {{
+        }
+        .filter-bar input {
             min-width: 150px;
-        }}
-        .filter-bar select:focus, .filter-bar input:focus {{
+        }
+        .filter-bar select:focus, .filter-bar input:focus {
             outline: none;
             border-color: #1F4E78;
-        }}
-        .clear-filters-btn {{
+        }
+        .clear-filters-btn {
             padding: 6px 12px;
             background: #e9ecef;
             color: #666;
@@ -780,19 +537,19 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             cursor: pointer;
             font-size: 13px;
             transition: all 0.2s;
-        }}
-        .clear-filters-btn:hover {{
+        }
+        .clear-filters-btn:hover {
             background: #ddd;
             color: #333;
-        }}
-        .filter-count {{
+        }
+        .filter-count {
             font-size: 12px;
             color: #666;
             padding: 4px 8px;
             background: #e9ecef;
             border-radius: 4px;
-        }}
-        .legend-info {{
+        }
+        .legend-info {
             display: flex;
             gap: 20px;
             flex-wrap: wrap;
@@ -800,256 +557,43 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             background: #f8f9fa;
             border-radius: 8px;
             font-size: 13px;
-        }}
-        .legend-item {{
+        }
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
-        .legend-line {{
+        }
+        .legend-line {
             width: 30px;
             height: 3px;
-        }}
-        .legend-marker {{
+        }
+        .legend-marker {
             width: 12px;
             height: 12px;
-        }}
-        .collapsible {{
+        }
+        .collapsible {
             max-height: 0;
             overflow: hidden;
             transition: max-height 0.5s ease-out;
-        }}
-        .collapsible.active {{
+        }
+        .collapsible.active {
             max-height: none;
             overflow: visible;
-        }}
-        @media (max-width: 768px) {{
-            .chart-grid {{
+        }
+        @media (max-width: 768px) {
+            .chart-grid {
                 grid-template-columns: 1fr;
-            }}
-            .header {{
+            }
+            .header {
                 padding: 20px;
-            }}
-            .header h1 {{
+            }
+            .header h1 {
                 font-size: 22px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📊 Measurement Analysis Report</h1>
-        <p>Generated from: {Path(output_file).stem} | Report generated on: {report_generated_str} | Data collected on: {data_collected_str}</p>
-    </div>
-    
-    <div class="container">
-        <!-- Summary Cards -->
-        <div class="summary-cards">
-            <div class="card neutral">
-                <h3>Total Tests</h3>
-                <div class="value">{len(df_results)}</div>
-            </div>
-            <div class="card pass">
-                <h3>Mean Check Pass</h3>
-                <div class="value">{summary_pass}</div>
-            </div>
-            <div class="card fail">
-                <h3>Mean Check Fail</h3>
-                <div class="value">{summary_fail}</div>
-            </div>
-            <div class="card pass">
-                <h3>±2σ Check Pass</h3>
-                <div class="value">{summary_2s_pass}</div>
-            </div>
-            <div class="card fail">
-                <h3>±2σ Check Fail</h3>
-                <div class="value">{summary_2s_fail}</div>
-            </div>
-        </div>
-        
-        <!-- Charts Section -->
-        <div class="section">
-            <div class="section-header" onclick="toggleSection('charts-section')">
-                <h2>📈 Tolerance Charts</h2>
-                <span class="toggle" id="charts-section-toggle">▼</span>
-            </div>
-            <div class="section-content collapsible active" id="charts-section">
-                <div class="chart-controls">
-                    <button class="toggle-legend-btn legends-hidden" onclick="toggleAllLegends()">
-                        <span id="legend-btn-icon">👁️‍🗨️</span> Toggle Legends
-                    </button>
-                    <div class="legend-info">
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #8B0000; border-style: dashed;"></div>
-                            <span>Upper/Lower Limits</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #2E7D32;"></div>
-                            <span>Reference Value</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-marker" style="background: #4472C4; transform: rotate(45deg);"></div>
-                            <span>Mean</span>
-                        </div>
-                        <div class="legend-item">
-                            <div class="legend-line" style="background: #4472C4; height: 2px;"></div>
-                            <span>Mean ± 2σ</span>
-                        </div>
-                    </div>
-                </div>
-                <div class="chart-grid">
-'''
-    
-    # Add each chart with external title (color based on I/O type)
-    for i, chart_data in enumerate(figures_html):
-        io_class = 'input' if chart_data['io_type'] == 'Input' else 'output'
-        html_content += f'''
-                    <div class="chart-container">
-                        <div class="chart-title {io_class}">{chart_data['title']}</div>
-                        <div class="chart-wrapper">
-                            {chart_data['html']}
-                        </div>
-                    </div>
-'''
-    
-    html_content += '''
-                </div>
-            </div>
-        </div>
-        
-        <!-- Data Table Section -->
-        <div class="section">
-            <div class="section-header" onclick="toggleSection('data-section')">
-                <h2>📋 Detailed Results</h2>
-                <span class="toggle" id="data-section-toggle">▼</span>
-            </div>
-            <div class="section-content collapsible active" id="data-section">
-                <div class="filter-bar">
-                    <div class="filter-group">
-                        <label>Channel:</label>
-                        <select id="channel-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add channel options
-    for ch in unique_channels:
-        html_content += f'                            <option value="{ch}">{ch}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>I/O Type:</label>
-                        <select id="io-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add I/O type options
-    for io in unique_io_types:
-        html_content += f'                            <option value="{io}">{io}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Range:</label>
-                        <select id="range-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add range options
-    for rng in unique_ranges:
-        html_content += f'                            <option value="{rng}">{rng}</option>\n'
-    
-    html_content += f'''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Test Value:</label>
-                        <select id="testvalue-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-'''
-    
-    # Add test value options
-    for tv in unique_test_values:
-        html_content += f'                            <option value="{tv}">{tv} {unit}</option>\n'
-    
-    html_content += '''                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Status:</label>
-                        <select id="status-filter" onchange="filterTable()">
-                            <option value="all">All</option>
-                            <option value="pass">Pass Only</option>
-                            <option value="fail">Fail Only</option>
-                        </select>
-                    </div>
-                    <div class="filter-group">
-                        <label>Search:</label>
-                        <input type="text" id="search-input" placeholder="Search..." onkeyup="filterTable()">
-                    </div>
-                    <button class="clear-filters-btn" onclick="clearFilters()">Clear All</button>
-                    <span class="filter-count" id="filter-count"></span>
-                </div>
-                <div class="table-wrapper">
-                    <table id="results-table">
-                        <thead>
-                            <tr>
-                                <th>Channel</th>
-                                <th>I/O Type</th>
-                                <th>Range</th>
-'''
-    
-    html_content += f'''
-                                <th>Test Value [{unit}]</th>
-                                <th>Reference [{unit}]</th>
-                                <th>Tolerance [{unit}]</th>
-                                <th>Lower Limit [{unit}]</th>
-                                <th>Upper Limit [{unit}]</th>
-                                <th>Mean [{unit}]</th>
-                                <th>StdDev [{unit}]</th>
-                                <th>Min [{unit}]</th>
-                                <th>Max [{unit}]</th>
-                                <th>Samples</th>
-                                <th>Mean Check</th>
-                                <th>Mean±2σ Check</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-'''
-    
-    # Add table rows
-    for _, row in df_results.iterrows():
-        mean_class = 'pass' if row['Mean Check'] == 'PASS' else 'fail'
-        sigma_class = 'pass' if row['Mean±2σ Check'] == 'PASS' else 'fail'
-        
-        html_content += f'''
-                            <tr>
-                                <td>{row['Channel']}</td>
-                                <td>{row['I/O Type']}</td>
-                                <td>{row['Range Setting']}</td>
-                                <td>{row[f'Test Value [{unit}]']:.6f}</td>
-                                <td>{row[f'Reference Value [{unit}]']:.6f}</td>
-                                <td>{row[f'Tolerance [{unit}]']:.6f}</td>
-                                <td>{row[f'Lower Limit [{unit}]']:.6f}</td>
-                                <td>{row[f'Upper Limit [{unit}]']:.6f}</td>
-                                <td>{row[f'Mean [{unit}]']:.6f}</td>
-                                <td>{row[f'StdDev [{unit}]']:.6f}</td>
-                                <td>{row[f'Min [{unit}]']:.6f}</td>
-                                <td>{row[f'Max [{unit}]']:.6f}</td>
-                                <td>{row['Samples']}</td>
-                                <td class="{mean_class}">{row['Mean Check']}</td>
-                                <td class="{sigma_class}">{row['Mean±2σ Check']}</td>
-                            </tr>
+            }
+        }
 '''
-    
-    html_content += '''
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let legendsVisible = false;
+
+_STATIC_SCRIPT = '''        let legendsVisible = false;
         
         function toggleSection(sectionId) {
             const section = document.getElementById(sectionId);
@@ -1077,6 +621,42 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             }
         }
         
+        // The filter dropdowns are filled from one JSON island rather than server-rendered <option> lists
+        const filterOptions = JSON.parse(document.getElementById('filter-options').textContent);
+        for (const [key, values] of Object.entries(filterOptions)) {
+            const select = document.getElementById(key + '-filter');
+            const unit = select.dataset.unit;
+            const fragment = document.createDocumentFragment();
+            for (const value of values) {
+                const option = document.createElement('option');
+                option.value = value;
+                option.textContent = unit ? value + ' ' + unit : value;
+                fragment.appendChild(option);
+            }
+            select.appendChild(fragment);
+        }
+        
+        // Large tables arrive with only their first page as rows; later pages wait in a JSON island
+        // and are appended as the table is scrolled, or all at once when a filter is applied
+        const deferredPagesEl = document.getElementById('deferred-rows');
+        const deferredPages = deferredPagesEl ? JSON.parse(deferredPagesEl.textContent) : [];
+        let nextPage = 0;
+        
+        function appendDeferredPages(count) {
+            const end = Math.min(nextPage + count, deferredPages.length);
+            if (end <= nextPage) return;
+            document.getElementById('results-table').tBodies[0]
+                .insertAdjacentHTML('beforeend', deferredPages.slice(nextPage, end).join(''));
+            nextPage = end;
+        }
+        
+        if (deferredPages.length) {
+            const sentinel = document.getElementById('table-sentinel');
+            new IntersectionObserver(function(entries) {
+                if (entries[0].isIntersecting) appendDeferredPages(1);
+            }, { root: sentinel.parentElement, rootMargin: '200px' }).observe(sentinel);
+        }
+        
         function filterTable() {
             const channelFilter = document.getElementById('channel-filter').value;
             const ioFilter = document.getElementById('io-filter').value;
@@ -1084,79 +664,53 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             const testValueFilter = document.getElementById('testvalue-filter').value;
             const statusFilter = document.getElementById('status-filter').value;
             const searchInput = document.getElementById('search-input').value.toLowerCase();
+            const filterValue = testValueFilter === 'all' ? null : parseFloat(testValueFilter);
+            const filtering = channelFilter !== 'all' || ioFilter !== 'all' || rangeFilter !== 'all' ||
+                              testValueFilter !== 'all' || statusFilter !== 'all' || searchInput !== '';
             const table = document.getElementById('results-table');
-            const rows = table.getElementsByTagName('tr');
+            
+            // Filters have to see every row, so append any table pages still held back
+            if (filtering) appendDeferredPages(deferredPages.length);
+            const rows = table.tBodies[0].rows;
             
             let visibleCount = 0;
-            let totalCount = rows.length - 1; // Exclude header
+            const totalCount = parseInt(table.dataset.totalRows, 10);
             
-            for (let i = 1; i < rows.length; i++) {
-                const row = rows[i];
-                const cells = row.getElementsByTagName('td');
-                
-                let showRow = true;
-                
-                // Channel filter (column 0)
-                if (channelFilter !== 'all' && showRow) {
-                    const channel = cells[0].textContent;
-                    if (channel !== channelFilter) showRow = false;
-                }
-                
-                // I/O Type filter (column 1)
-                if (ioFilter !== 'all' && showRow) {
-                    const ioType = cells[1].textContent;
-                    if (ioType !== ioFilter) showRow = false;
-                }
-                
-                // Range filter (column 2)
-                if (rangeFilter !== 'all' && showRow) {
-                    const range = cells[2].textContent;
-                    if (range !== rangeFilter) showRow = false;
-                }
-                
-                // Test Value filter (column 3)
-                if (testValueFilter !== 'all' && showRow) {
-                    const testValue = parseFloat(cells[3].textContent);
-                    const filterValue = parseFloat(testValueFilter);
-                    if (Math.abs(testValue - filterValue) > 0.000001) showRow = false;
-                }
+            // Each row carries its filter values as data-* attributes, so no cell text is read here
+            for (const row of rows) {
+                const d = row.dataset;
+                const showRow =
+                    (channelFilter === 'all' || d.channel === channelFilter) &&
+                    (ioFilter === 'all' || d.io === ioFilter) &&
+                    (rangeFilter === 'all' || d.range === rangeFilter) &&
+                    (filterValue === null || Math.abs(parseFloat(d.tv) - filterValue) <= 0.000001) &&
+                    (statusFilter === 'all' ||
+                        (statusFilter === 'pass' ? d.mean === 'PASS' && d.sigma === 'PASS'
+                                                 : d.mean === 'FAIL' || d.sigma === 'FAIL')) &&
+                    (!searchInput || d.search.includes(searchInput));
                 
-                // Status filter (columns 13 and 14)
-                if (statusFilter !== 'all' && showRow) {
-                    const meanCheck = cells[13].textContent;
-                    const sigmaCheck = cells[14].textContent;
-                    if (statusFilter === 'pass') {
-                        if (meanCheck !== 'PASS' || sigmaCheck !== 'PASS') showRow = false;
-                    } else if (statusFilter === 'fail') {
-                        if (meanCheck !== 'FAIL' && sigmaCheck !== 'FAIL') showRow = false;
-                    }
-                }
-                
-                // Search filter
-                if (searchInput && showRow) {
-                    let found = false;
-                    for (let j = 0; j < cells.length; j++) {
-                        if (cells[j].textContent.toLowerCase().includes(searchInput)) {
-                            found = true;
-                            break;
-                        }
-                    }
-                    if (!found) showRow = false;
-                }
-                
-                row.style.display = showRow ? '' : 'none';
+                // A class flip instead of an inline style write; unchanged rows are not touched
+                row.classList.toggle('filtered-out', !showRow);
                 if (showRow) visibleCount++;
             }
             
             // Update filter count
             const countEl = document.getElementById('filter-count');
-            if (visibleCount === totalCount) {
+            // Unfiltered, every row counts as shown, including pages not appended yet
+            if (!filtering || visibleCount === totalCount) {
                 countEl.textContent = `Showing all ${totalCount} rows`;
             } else {
                 countEl.textContent = `Showing ${visibleCount} of ${totalCount} rows`;
             }
         }
         
+        // Search re-filters once typing pauses rather than on every keystroke
+        let filterTimer = null;
+        function scheduleFilterTable() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(filterTable, 50);
+        }
+        
         function clearFilters() {
             document.getElementById('channel-filter').value = 'all';
             document.getElementById('io-filter').value = 'all';
@@ -1167,6 +721,12 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
             filterTable();
         }
         
+        // Draw every chart from its JSON island in one pass
+        document.querySelectorAll('script.chart-data').forEach(function(island) {
+            const fig = JSON.parse(island.textContent);
+            Plotly.react(island.dataset.target, fig.data, fig.layout, { responsive: true });
+        });
+        
         // Resize all Plotly charts when window resizes
         window.addEventListener('resize', function() {
             const charts = document.querySelectorAll('.chart-wrapper .plotly-graph-div');
@@ -1186,14 +746,603 @@ def create_html_report(output_file, df_results, unit, data_file_timestamp=None):
                 filterTable();
             }, 100);
         });
-    </script>
-</body>
-</html>
 '''
+
+# Tables longer than this many rows are sent to the browser a page at a time
+TABLE_PAGE_ROWS = 1000
+
+# One data-table row; its str.format fields are filled column-wise by _table_rows_html
+_ROW_TEMPLATE = '''
+                            <tr data-channel="{channel}" data-io="{io_type}" data-range="{range_setting}" data-tv="{test_value:.6f}" data-mean="{mean_check}" data-sigma="{sigma_check}" data-search="{search}">
+                                <td>{channel}</td>
+                                <td>{io_type}</td>
+                                <td>{range_setting}</td>
+                                <td>{test_value:.6f}</td>
+                                <td>{reference:.6f}</td>
+                                <td>{tolerance:.6f}</td>
+                                <td>{lower_limit:.6f}</td>
+                                <td>{upper_limit:.6f}</td>
+                                <td>{mean:.6f}</td>
+                                <td>{stddev:.6f}</td>
+                                <td>{min:.6f}</td>
+                                <td>{max:.6f}</td>
+                                <td>{samples}</td>
+                                <td class="{mean_class}">{mean_check}</td>
+                                <td class="{sigma_class}">{sigma_check}</td>
+                            </tr>
+'''
+
+_ROW_TEMPLATE_PIECES = list(string.Formatter().parse(_ROW_TEMPLATE))
+
+# Table cells the search box matches against, as (field, format spec) pairs of _ROW_TEMPLATE
+_SEARCH_CELLS = (
+    ('channel', ''), ('io_type', ''), ('range_setting', ''), ('test_value', '.6f'), ('reference', '.6f'),
+    ('tolerance', '.6f'), ('lower_limit', '.6f'), ('upper_limit', '.6f'), ('mean', '.6f'), ('stddev', '.6f'),
+    ('min', '.6f'), ('max', '.6f'), ('samples', ''), ('mean_check', ''), ('sigma_check', ''),
+)
+
+
+def _escape_html(values):
+    """HTML-escape a string array in a few whole-array passes (safe inside double-quoted attributes too)."""
+    for char, entity in (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;')):
+        values = np.char.replace(values, char, entity)
+    return values
+
+
+def _table_rows_html(fields):
+    """
+    Render every data-table row at once. `fields` maps each _ROW_TEMPLATE field (bar the derived
+    `search` text) to a column array; each column is formatted in one vectorized pass and the rows
+    are concatenated column by column.
+    Returns the markup of the first TABLE_PAGE_ROWS rows and a list of page markups for the rest.
+    """
+    # Format each (field, spec) column once, even where the template uses it twice
+    cells = {}
+    for _, field, spec, _ in _ROW_TEMPLATE_PIECES:
+        if field is not None and field != 'search' and (field, spec) not in cells:
+            values = np.asarray(fields[field])
+            formatted = np.char.mod(f'%{spec}', values.astype(float)) if spec else _escape_html(values.astype(str))
+            cells[field, spec] = formatted.astype(object)
+    
+    # Lower-cased text of the visible cells, tab-separated so a search cannot match across cells
+    search = cells[_SEARCH_CELLS[0]]
+    for key in _SEARCH_CELLS[1:]:
+        search = search + '\t' + cells[key]
+    cells['search', ''] = np.char.lower(search.astype(str)).astype(object)
+    
+    rows = None
+    for literal, field, spec, _ in _ROW_TEMPLATE_PIECES:
+        rows = literal if rows is None else rows + literal
+        if field is not None:
+            rows = rows + cells[field, spec]
+    rows = rows.tolist()
+    
+    # The first page goes straight into the table; the rest become pages of markup for the JSON island
+    first_page = ''.join(rows[:TABLE_PAGE_ROWS])
+    deferred_pages = [''.join(rows[start:start + TABLE_PAGE_ROWS])
+                      for start in range(TABLE_PAGE_ROWS, len(rows), TABLE_PAGE_ROWS)]
+    return first_page, deferred_pages
+
+
+def _dumps(obj):
+    """Compact JSON text for the report's data islands, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _figure_html(fig, div_id):
+    """
+    Inline markup for one chart: an empty plotly-graph-div and the figure as a JSON island.
+    The report script draws every island with Plotly.react in one pass; plotly.js is loaded
+    once by the report head, never per figure.
+    """
+    # The figures are built from validated trace objects already, so to_json skips re-validating them.
+    # Escape "</" so tags inside hover templates cannot close the <script> element
+    fig_json = fig.to_json(validate=False).replace('</', '<\\/')
+    return (
+        f'<div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+        f'<script type="application/json" class="chart-data" data-target="{div_id}">{fig_json}</script>'
+    )
+
+
+GZIP_COMPRESSLEVEL = 5  # Report markup is highly repetitive; level 5 gets most of the gain cheaply
+
+
+def _open_report(html_file):
+    """Open the report for writing, gzip-compressed when the filename ends in .gz."""
+    if html_file.endswith('.gz'):
+        return gzip.open(html_file, 'wt', encoding='utf-8', compresslevel=GZIP_COMPRESSLEVEL)
+    return open(html_file, 'w', encoding='utf-8', buffering=1 << 20)
+
+
+def create_html_report(output_file, df_results, unit, data_file_timestamp=None, compress=False):
+    """
+    Create an interactive HTML report using Plotly with tolerance charts and data tables.
+    
+    Parameters:
+    - output_file: Path to the output Excel file
+    - df_results: DataFrame with results
+    - unit: Measurement unit
+    - data_file_timestamp: Optional datetime of the first data file (for "Data collected on")
+    - compress: Write the report gzip-compressed as *_report.html.gz
+    """
+    if not PLOTLY_AVAILABLE:
+        print("Warning: Plotly not available. Skipping HTML report generation.")
+        print("  Install with: pip install plotly")
+        return None
+    
+    if df_results.empty:
+        print("No results to report. Skipping HTML report generation.")
+        return None
+    
+    print("\nCreating interactive HTML report...")
+    
+    # Column names, formatted once
+    test_value_col = f'Test Value [{unit}]'
+    ref_col = f'Reference Value [{unit}]'
+    tol_col = f'Tolerance [{unit}]'
+    lower_col = f'Lower Limit [{unit}]'
+    upper_col = f'Upper Limit [{unit}]'
+    mean_col = f'Mean [{unit}]'
+    std_col = f'StdDev [{unit}]'
+    min_col = f'Min [{unit}]'
+    max_col = f'Max [{unit}]'
+    
+    # Generate HTML filename
+    html_file = output_file.replace('.xlsx', '_report.html')
+    if compress:
+        html_file += '.gz'
+    
+    # Pleasant, muted color palette for channels (matching Excel charts)
+    channel_colors = [
+        '#4472C4',  # Muted blue
+        '#C45B5B',  # Muted red
+        '#70AD47',  # Muted green
+        '#ED7D31',  # Muted orange
+        '#7B7B7B',  # Gray
+        '#9E5ECE',  # Muted purple
+        '#43A6A2',  # Muted teal
+        '#C4A24E',  # Muted gold
+        '#5B9BC4',  # Steel blue
+        '#A85B5B',  # Dusty rose
+        '#5BAF7B',  # Sea green
+        '#C47B4E',  # Terracotta
+        '#6B6BAF',  # Muted indigo
+        '#8B6BAF',  # Muted violet
+        '#4EAFAF',  # Turquoise
+        '#AF8B4E',  # Bronze
+    ]
+    
+    # One chart per test value + range + I/O type combination (single groupby pass, sorted by key)
+    combination_groups = df_results.groupby([test_value_col, 'Range Setting', 'I/O Type'], sort=True, observed=True)
+    
+    # Create figures list
+    figures_html = []
+    
+    for (test_value, range_setting, io_type), test_data in combination_groups:
+        test_data = test_data.sort_values('Channel')
+        
+        channels = test_data['Channel'].tolist()
+        lower_limits = test_data[lower_col].tolist()
+        upper_limits = test_data[upper_col].tolist()
+        reference_values = test_data[ref_col].tolist()
+        means = test_data[mean_col].tolist()
+        mean_arr = test_data[mean_col].to_numpy()
+        two_sigma = 2 * test_data[std_col].to_numpy()
+        lower_2sigma_arr = mean_arr - two_sigma
+        upper_2sigma_arr = mean_arr + two_sigma
+        lower_2sigma = lower_2sigma_arr.tolist()
+        upper_2sigma = upper_2sigma_arr.tolist()
+        mean_checks = test_data['Mean Check'].tolist()
+        mean_2sigma_checks = test_data['Mean±2σ Check'].tolist()
+        
+        # Get limit values (same for all channels)
+        ref_val = reference_values[0]
+        ll_val = lower_limits[0]
+        ul_val = upper_limits[0]
+        
+        range_display = f", Range: {range_setting}" if range_setting != 'N/A' else ""
+        chart_title = f"Test: {test_value} {unit}{range_display} ({io_type})"
+        
+        # Create figure
+        fig = go.Figure()
+        
+        # Add limit lines (horizontal lines across all channels)
+        x_range = [min(channels) - 0.5, max(channels) + 0.5]
+        
+        # Lower limit line (dashed red)
+        fig.add_trace(go.Scatter(
+            x=x_range,
+            y=[ll_val, ll_val],
+            mode='lines',
+            name=f'Lower Limit ({ll_val:.6f})',
+            line=dict(color='#8B0000', width=2, dash='dash'),
+            hoverinfo='name+y'
+        ))
+        
+        # Reference line (solid green)
+        fig.add_trace(go.Scatter(
+            x=x_range,
+            y=[ref_val, ref_val],
+            mode='lines',
+            name=f'Reference ({ref_val:.6f})',
+            line=dict(color='#2E7D32', width=2),
+            hoverinfo='name+y'
+        ))
+        
+        # Upper limit line (dashed red)
+        fig.add_trace(go.Scatter(
+            x=x_range,
+            y=[ul_val, ul_val],
+            mode='lines',
+            name=f'Upper Limit ({ul_val:.6f})',
+            line=dict(color='#8B0000', width=2, dash='dash'),
+            hoverinfo='name+y'
+        ))
+        
+        # Add data points for each channel
+        for i, channel in enumerate(channels):
+            color = channel_colors[i % len(channel_colors)]
+            
+            # Mean point (diamond)
+            fig.add_trace(go.Scatter(
+                x=[channel],
+                y=[means[i]],
+                mode='markers',
+                name=f'CH{channel} Mean',
+                marker=dict(
+                    symbol='diamond',
+                    size=12,
+                    color=color,
+                    line=dict(color=color, width=1)
+                ),
+                hovertemplate=f'CH{channel}<br>Mean: %{{y:.6f}}<br>Check: {mean_checks[i]}<extra></extra>'
+            ))
+            
+            # Mean-2σ point (line marker)
+            fig.add_trace(go.Scatter(
+                x=[channel],
+                y=[lower_2sigma[i]],
+                mode='markers',
+                name=f'CH{channel} -2σ',
+                marker=dict(
+                    symbol='line-ew',
+                    size=10,
+                    color=color,
+                    line=dict(color=color, width=3)
+                ),
+                hovertemplate=f'CH{channel}<br>Mean-2σ: %{{y:.6f}}<extra></extra>',
+                showlegend=False
+            ))
+            
+            # Mean+2σ point (line marker)
+            fig.add_trace(go.Scatter(
+                x=[channel],
+                y=[upper_2sigma[i]],
+                mode='markers',
+                name=f'CH{channel} +2σ',
+                marker=dict(
+                    symbol='line-ew',
+                    size=10,
+                    color=color,
+                    line=dict(color=color, width=3)
+                ),
+                hovertemplate=f'CH{channel}<br>Mean+2σ: %{{y:.6f}}<br>±2σ Check: {mean_2sigma_checks[i]}<extra></extra>',
+                showlegend=False
+            ))
+            
+            # Add vertical line connecting -2σ to +2σ
+            fig.add_trace(go.Scatter(
+                x=[channel, channel],
+                y=[lower_2sigma[i], upper_2sigma[i]],
+                mode='lines',
+                line=dict(color=color, width=1),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+        
+        # Calculate Y-axis range
+        limit_values = test_data[[lower_col, upper_col,
+                                  ref_col, mean_col]].to_numpy()
+        # A single-sample channel has a NaN StdDev; only its own ±2σ bounds drop out of the extent
+        y_values = np.concatenate([limit_values.ravel(), lower_2sigma_arr, upper_2sigma_arr])
+        y_min = float(np.nanmin(y_values))
+        y_max = float(np.nanmax(y_values))
+        y_range_val = y_max - y_min if y_max != y_min else abs(y_max) * 0.1 or 0.1
+        y_padding = y_range_val * 0.20
+        
+        # Update layout - title moved outside chart, legends hidden by default
+        fig.update_layout(
+            title=None,  # Title will be added as external HTML element
+            xaxis=dict(
+                title='Channel',
+                tickmode='linear',
+                tick0=min(channels),
+                dtick=1,
+                autorange=True  # Enable autoscale
+            ),
+            yaxis=dict(
+                title=f'Measurement [{unit}]',
+                autorange=True  # Enable autoscale
+            ),
+            legend=dict(
+                orientation='h',
+                yanchor='bottom',
+                y=1.0,
+                xanchor='center',
+                x=0.5,
+                font=dict(size=10),
+                bgcolor='rgba(255,255,255,0.9)',
+                bordercolor='#e9ecef',
+                borderwidth=1
+            ),
+            showlegend=False,  # Legends hidden by default
+            hovermode='closest',
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            margin=dict(l=60, r=20, t=30, b=50),
+            autosize=True
+        )
+        
+        # Add gridlines
+        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
+        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#E0E0E0')
+        
+        # Store chart with its title and io_type
+        figures_html.append({
+            'title': chart_title,
+            'io_type': io_type,
+            'html': _figure_html(fig, f'chart-{len(figures_html)}')
+        })
+    
+    # Create summary statistics table
+    mean_check_counts = df_results['Mean Check'].value_counts()
+    sigma_check_counts = df_results['Mean±2σ Check'].value_counts()
+    summary_pass = int(mean_check_counts.get('PASS', 0))
+    summary_fail = int(mean_check_counts.get('FAIL', 0))
+    summary_2s_pass = int(sigma_check_counts.get('PASS', 0))
+    summary_2s_fail = int(sigma_check_counts.get('FAIL', 0))
+    
+    # Get unique values for filters
+    unique_channels = sorted(df_results['Channel'].unique())
+    unique_ranges = sorted(df_results['Range Setting'].unique())
+    unique_test_values = sorted(df_results[test_value_col].unique())
+    unique_io_types = sorted(df_results['I/O Type'].unique())
+    # The page fills the dropdowns from this one JSON blob; values are sent as the same text
+    # the table rows carry, and "</" is escaped so no value can close the <script> element
+    filter_options = _dumps({
+        'channel': [str(ch) for ch in unique_channels],
+        'io': [str(io) for io in unique_io_types],
+        'range': [str(rng) for rng in unique_ranges],
+        'testvalue': [str(tv) for tv in unique_test_values],
+    }).replace('</', '<\\/')
+    
+    # Generate timestamp information
+    report_generated_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if data_file_timestamp:
+        data_collected_str = data_file_timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        data_collected_str = "Unknown"
+    
+    # Build HTML document; static blocks are separate parts, so the f-strings only carry the dynamic bits
+    html_parts = [f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Measurement Report - {Path(output_file).stem}</title>
+    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <style>''', _STATIC_CSS, f'''    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>📊 Measurement Analysis Report</h1>
+        <p>Generated from: {Path(output_file).stem} | Report generated on: {report_generated_str} | Data collected on: {data_collected_str}</p>
+    </div>
+    
+    <div class="container">
+        <!-- Summary Cards -->
+        <div class="summary-cards">
+            <div class="card neutral">
+                <h3>Total Tests</h3>
+                <div class="value">{len(df_results)}</div>
+            </div>
+            <div class="card pass">
+                <h3>Mean Check Pass</h3>
+                <div class="value">{summary_pass}</div>
+            </div>
+            <div class="card fail">
+                <h3>Mean Check Fail</h3>
+                <div class="value">{summary_fail}</div>
+            </div>
+            <div class="card pass">
+                <h3>±2σ Check Pass</h3>
+                <div class="value">{summary_2s_pass}</div>
+            </div>
+            <div class="card fail">
+                <h3>±2σ Check Fail</h3>
+                <div class="value">{summary_2s_fail}</div>
+            </div>
+        </div>
+        
+        <!-- Charts Section -->
+        <div class="section">
+            <div class="section-header" onclick="toggleSection('charts-section')">
+                <h2>📈 Tolerance Charts</h2>
+                <span class="toggle" id="charts-section-toggle">▼</span>
+            </div>
+            <div class="section-content collapsible active" id="charts-section">
+                <div class="chart-controls">
+                    <button class="toggle-legend-btn legends-hidden" onclick="toggleAllLegends()">
+                        <span id="legend-btn-icon">👁️‍🗨️</span> Toggle Legends
+                    </button>
+                    <div class="legend-info">
+                        <div class="legend-item">
+                            <div class="legend-line" style="background: #8B0000; border-style: dashed;"></div>
+                            <span>Upper/Lower Limits</span>
+                        </div>
+                        <div class="legend-item">
+                            <div class="legend-line" style="background: #2E7D32;"></div>
+                            <span>Reference Value</span>
+                        </div>
+                        <div class="legend-item">
+                            <div class="legend-marker" style="background: #4472C4; transform: rotate(45deg);"></div>
+                            <span>Mean</span>
+                        </div>
+                        <div class="legend-item">
+                            <div class="legend-line" style="background: #4472C4; height: 2px;"></div>
+                            <span>Mean ± 2σ</span>
+                        </div>
+                    </div>
+                </div>
+                <div class="chart-grid">
+''']
+    
+    # Add each chart with external title (color based on I/O type)
+    for i, chart_data in enumerate(figures_html):
+        io_class = 'input' if chart_data['io_type'] == 'Input' else 'output'
+        html_parts.append(f'''
+                    <div class="chart-container">
+                        <div class="chart-title {io_class}">{chart_data['title']}</div>
+                        <div class="chart-wrapper">
+                            {chart_data['html']}
+                        </div>
+                    </div>
+''')
+    
+    html_parts.append(f'''
+                </div>
+            </div>
+        </div>
+        
+        <!-- Data Table Section -->
+        <div class="section">
+            <div class="section-header" onclick="toggleSection('data-section')">
+                <h2>📋 Detailed Results</h2>
+                <span class="toggle" id="data-section-toggle">▼</span>
+            </div>
+            <div class="section-content collapsible active" id="data-section">
+                <div class="filter-bar">
+                    <div class="filter-group">
+                        <label>Channel:</label>
+                        <select id="channel-filter" onchange="filterTable()">
+                            <option value="all">All</option>
+                        </select>
+                    </div>
+                    <div class="filter-group">
+                        <label>I/O Type:</label>
+                        <select id="io-filter" onchange="filterTable()">
+                            <option value="all">All</option>
+                        </select>
+                    </div>
+                    <div class="filter-group">
+                        <label>Range:</label>
+                        <select id="range-filter" onchange="filterTable()">
+                            <option value="all">All</option>
+                        </select>
+                    </div>
+                    <div class="filter-group">
+                        <label>Test Value:</label>
+                        <select id="testvalue-filter" data-unit="{unit}" onchange="filterTable()">
+                            <option value="all">All</option>
+                        </select>
+                    </div>
+                    <div class="filter-group">
+                        <label>Status:</label>
+                        <select id="status-filter" onchange="filterTable()">
+                            <option value="all">All</option>
+                            <option value="pass">Pass Only</option>
+                            <option value="fail">Fail Only</option>
+                        </select>
+                    </div>
+                    <div class="filter-group">
+                        <label>Search:</label>
+                        <input type="text" id="search-input" placeholder="Search..." onkeyup="scheduleFilterTable()">
+                    </div>
+                    <button class="clear-filters-btn" onclick="clearFilters()">Clear All</button>
+                    <span class="filter-count" id="filter-count"></span>
+                </div>
+                <script type="application/json" id="filter-options">{filter_options}</script>
+                <div class="table-wrapper">
+                    <table id="results-table" data-total-rows="{len(df_results)}">
+                        <thead>
+                            <tr>
+                                <th>Channel</th>
+                                <th>I/O Type</th>
+                                <th>Range</th>
+''')
+    
+    html_parts.append(f'''
+                                <th>Test Value [{unit}]</th>
+                                <th>Reference [{unit}]</th>
+                                <th>Tolerance [{unit}]</th>
+                                <th>Lower Limit [{unit}]</th>
+                                <th>Upper Limit [{unit}]</th>
+                                <th>Mean [{unit}]</th>
+                                <th>StdDev [{unit}]</th>
+                                <th>Min [{unit}]</th>
+                                <th>Max [{unit}]</th>
+                                <th>Samples</th>
+                                <th>Mean Check</th>
+                                <th>Mean±2σ Check</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+''')
+    
+    # Add table rows
+    mean_checks = df_results['Mean Check'].to_numpy()
+    sigma_checks = df_results['Mean±2σ Check'].to_numpy()
+    first_page, deferred_pages = _table_rows_html({
+        'channel': df_results['Channel'].to_numpy(),
+        'io_type': df_results['I/O Type'].to_numpy(),
+        'range_setting': df_results['Range Setting'].to_numpy(),
+        'test_value': df_results[test_value_col].to_numpy(),
+        'reference': df_results[ref_col].to_numpy(),
+        'tolerance': df_results[tol_col].to_numpy(),
+        'lower_limit': df_results[lower_col].to_numpy(),
+        'upper_limit': df_results[upper_col].to_numpy(),
+        'mean': df_results[mean_col].to_numpy(),
+        'stddev': df_results[std_col].to_numpy(),
+        'min': df_results[min_col].to_numpy(),
+        'max': df_results[max_col].to_numpy(),
+        'samples': df_results['Samples'].to_numpy(),
+        'mean_class': np.where(mean_checks == 'PASS', 'pass', 'fail'),
+        'mean_check': mean_checks,
+        'sigma_class': np.where(sigma_checks == 'PASS', 'pass', 'fail'),
+        'sigma_check': sigma_checks,
+    })
+    html_parts.append(first_page)
+    
+    html_parts.append('''
+                        </tbody>
+                    </table>
+''')
+    
+    if deferred_pages:
+        # Escape "</" so row markup cannot close the JSON <script> element
+        deferred_json = _dumps(deferred_pages).replace('</', '<\\/')
+        html_parts.append(f'''                    <div id="table-sentinel"></div>
+                    <script type="application/json" id="deferred-rows">{deferred_json}</script>
+''')
+    
+    html_parts.append('''                </div>
+            </div>
+        </div>
+    </div>
+    
+    <script>
+''')
+    html_parts.append(_STATIC_SCRIPT)
+    html_parts.append('''    </script>
+</body>
+</html>
+''')
     
-    # Write HTML file
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Write HTML file: stream the parts through a large buffer (or the gzip stream) rather than joining them into one document string
+    with _open_report(html_file) as f:
+        f.writelines(html_parts)
     
     print(f"✓ Interactive HTML report saved to {html_file}")
     return html_file
\ No newline at end of file
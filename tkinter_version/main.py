@@ -1,30 +1,113 @@
 import os
 import webbrowser
-import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor
 from tkinter import filedialog
 from pathlib import Path
 from datetime import datetime
 
 import pandas as pd
 import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font
+from openpyxl.utils import get_column_letter
 
 # Import from local modules
 from parsers import (
-    parse_filename,
+    scan_data_files,
     get_unit_from_files,
     scan_text_file_for_measurement_types,
     parse_text_file
 )
-from gui import select_measurement_type, get_user_inputs
+from gui import get_root, select_measurement_type, get_user_inputs
 from excel_charts import create_tolerance_charts, apply_channel_colors_to_results
 from html_report import create_html_report
 from utils import get_versioned_filename
 
+# Test Results header and PASS/FAIL cell styles, shared by every cell that uses them
+_HEADER_FONT = Font(bold=True)
+_PASS_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+_PASS_FONT = Font(color='006100', bold=True)
+_FAIL_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+_FAIL_FONT = Font(color='9C0006', bold=True)
 
-def process_files(input_dir='.', user_inputs=None, unit='V', measurement_type_selections=None):
+
+# Substrings that identify the measurement column in a CSV export's header
+_MEAS_KEYWORDS = ('voltage', 'vdc', 'resistance', 'ohm', 'current', 'adc', 'measurement')
+
+# Files per run before reading moves to worker processes. Measured on the bundled samples:
+# a file takes ~10 ms to read in-process, and a 2-worker pool costs ~0.86 s to start and
+# stop under the 'spawn' start method (the default on Windows and macOS), since each worker
+# re-imports pandas. Two workers save half the per-file time, so they pay off from ~170 files.
+PARALLEL_FILE_THRESHOLD = 170
+
+
+def _read_csv_measurements(csv_file):
+    """
+    Read one CSV export and return (measurements, warning): the measurement column's samples
+    as an array, or None and the reason the file has no usable measurements.
+    """
+    # Pick the measurement column from the header alone, so only that column is parsed
+    measurement_col = None
+    for col in pd.read_csv(csv_file, nrows=0).columns:
+        col_lower = col.lower().strip()
+        if any(keyword in col_lower for keyword in _MEAS_KEYWORDS):
+            measurement_col = col
+            break
+    
+    if measurement_col is None:
+        # Without a named column the last numeric one is used, which needs the data
+        df = pd.read_csv(csv_file)
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) == 0:
+            return None, f"Warning: No numeric columns found in {csv_file.name}"
+        measurement_col = numeric_cols[-1]
+    else:
+        df = pd.read_csv(csv_file, usecols=[measurement_col])
+    
+    measurements = df[measurement_col].dropna()
+    
+    if len(measurements) == 0:
+        return None, f"Warning: No valid measurements in {csv_file.name}"
+    
+    if not pd.api.types.is_numeric_dtype(measurements):
+        raise TypeError(f"column '{measurement_col}' is not numeric")
+    
+    return measurements.to_numpy(), None
+
+
+def _run_file_jobs(jobs):
+    """
+    Run (function, args) file-reading jobs and return their outcomes in job order; a job that
+    raised gives its exception. Large directories fan out to worker processes; small ones, and
+    machines with a single CPU, stay in-process, where a pool would cost more than it saves.
+    """
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if len(jobs) < PARALLEL_FILE_THRESHOLD or max_workers < 2:
+        outcomes = []
+        for func, args in jobs:
+            try:
+                outcomes.append(func(*args))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args) for func, args in jobs]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+
+def process_files(input_dir='.', user_inputs=None, unit='V', measurement_type_selections=None, file_meta=None):
     """
     Process all CSV and TXT files in the input directory and compile results into Excel.
+    file_meta is an already computed scan_data_files() result for input_dir; without it
+    the directory is scanned here.
     """
     dir_name = Path(input_dir).name
     if not dir_name:
@@ -34,10 +117,11 @@ def process_files(input_dir='.', user_inputs=None, unit='V', measurement_type_se
     base_output_file = os.path.join(input_dir, f'{dir_name}.xlsx')
     output_file = get_versioned_filename(base_output_file)
     
-    results = []
-    
-    csv_files = list(Path(input_dir).glob('*.csv'))
-    txt_files = list(Path(input_dir).glob('*.txt'))
+    if file_meta is None:
+        file_meta = scan_data_files(input_dir)
+    csv_meta, txt_meta = file_meta
+    csv_files = list(csv_meta)
+    txt_files = list(txt_meta)
     
     total_files = len(csv_files) + len(txt_files)
     if total_files == 0:
@@ -54,161 +138,172 @@ def process_files(input_dir='.', user_inputs=None, unit='V', measurement_type_se
     else:
         data_file_timestamp = None
     
-    # Process CSV files (output data)
-    for csv_file in csv_files:
-        value, file_unit, channel, range_setting = parse_filename(csv_file.name)
-        
+    # Read every file first (in worker processes for large directories), then build the
+    # results from the outcomes in file order
+    csv_jobs = []
+    for csv_file, (value, file_unit, channel, range_setting) in csv_meta.items():
         if value is None or channel is None:
             print(f"Skipping {csv_file.name} - could not parse filename (value or channel missing)")
             continue
+        csv_jobs.append((csv_file, value, channel, range_setting))
+    
+    txt_jobs = []
+    for txt_file, (value, file_unit, channel_from_name, range_setting) in txt_meta.items():
+        if value is None:
+            print(f"Skipping {txt_file.name} - could not parse test value from filename")
+            continue
         
-        try:
-            df = pd.read_csv(csv_file)
-            
-            measurement_col = None
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                if any(keyword in col_lower for keyword in ['voltage', 'vdc', 'resistance', 'ohm', 'current', 'adc', 'measurement']):
-                    measurement_col = col
-                    break
-            
-            if measurement_col is None:
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) == 0:
-                    print(f"Warning: No numeric columns found in {csv_file.name}")
-                    continue
-                measurement_col = numeric_cols[-1]
-            
-            measurements = df[measurement_col].dropna()
-            
-            if len(measurements) == 0:
-                print(f"Warning: No valid measurements in {csv_file.name}")
-                continue
-            
-            result = {
-                'Channel': channel,
-                'I/O Type': 'Output',
-                'Range Setting': range_setting if range_setting else 'N/A',
-                f'Test Value [{unit}]': value,
-                f'Mean [{unit}]': measurements.mean(),
-                f'StdDev [{unit}]': measurements.std(),
-                f'Min [{unit}]': measurements.min(),
-                f'Max [{unit}]': measurements.max(),
-                'Samples': len(measurements),
-                '_range_key': range_setting
-            }
-            
-            results.append(result)
-            print(f"Processed: {csv_file.name} - CH{channel}, {value}{unit}, Range:{range_setting or 'N/A'}, {len(measurements)} samples (Output)")
-            
-        except Exception as e:
-            print(f"Error processing {csv_file.name}: {str(e)}")
+        # Get selected measurement type for this file
+        selected_type = None
+        if measurement_type_selections and str(txt_file) in measurement_type_selections:
+            selected_type = measurement_type_selections[str(txt_file)]
+        txt_jobs.append((txt_file, value, channel_from_name, range_setting, selected_type))
+    
+    # Text files are parsed with the channel from the filename, if available, and reduced
+    # to per-channel statistics (aggregate=True)
+    outcomes = _run_file_jobs(
+        [(_read_csv_measurements, (csv_file,)) for csv_file, *_ in csv_jobs] +
+        [(parse_text_file, (txt_file, selected_type, channel_from_name, True))
+         for txt_file, _, channel_from_name, _, selected_type in txt_jobs]
+    )
+    
+    # Results are filled column by column into arrays sized up front: at most one row per
+    # CSV file and one per channel of each parsed text file
+    csv_outcomes = outcomes[:len(csv_jobs)]
+    txt_outcomes = outcomes[len(csv_jobs):]
+    capacity = len(csv_jobs) + sum(len(channel_data) for channel_data in txt_outcomes if isinstance(channel_data, dict))
+    channels = np.empty(capacity, dtype=np.int64)
+    io_types = np.empty(capacity, dtype=object)
+    range_settings = np.empty(capacity, dtype=object)
+    range_keys = np.empty(capacity, dtype=object)
+    test_values = np.empty(capacity, dtype=np.float64)
+    stats = np.empty((capacity, 5), dtype=np.float64)  # Mean, StdDev, Min, Max, Samples
+    n_results = 0
+    
+    def add_result(channel, io_type, value, range_setting):
+        """Fill the next result row's identifying columns and return its index."""
+        nonlocal n_results
+        row = n_results
+        channels[row] = channel
+        io_types[row] = io_type
+        range_settings[row] = range_setting if range_setting else 'N/A'
+        range_keys[row] = range_setting
+        test_values[row] = value
+        n_results += 1
+        return row
+    
+    # Samples of every CSV result, tagged with the result's row; their statistics are computed
+    # in one groupby once every file is read. TXT results come with their statistics already
+    # computed by the parser.
+    sample_values = []
+    sample_owners = []
+    
+    # Process CSV files (output data)
+    for (csv_file, value, channel, range_setting), outcome in zip(csv_jobs, csv_outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error processing {csv_file.name}: {str(outcome)}")
             continue
+        
+        measurements, warning = outcome
+        if warning:
+            print(warning)
+            continue
+        
+        row = add_result(channel, 'Output', value, range_setting)
+        sample_values.append(measurements)
+        sample_owners.append(np.full(len(measurements), row))
+        print(f"Processed: {csv_file.name} - CH{channel}, {value}{unit}, Range:{range_setting or 'N/A'}, {len(measurements)} samples (Output)")
     
     # Process TXT files (input data)
-    for txt_file in txt_files:
-        value, file_unit, channel_from_name, range_setting = parse_filename(txt_file.name)
+    for (txt_file, value, _, range_setting, selected_type), channel_data in zip(txt_jobs, txt_outcomes):
+        if isinstance(channel_data, Exception):
+            print(f"Error processing {txt_file.name}: {str(channel_data)}")
+            continue
         
-        if value is None:
-            print(f"Skipping {txt_file.name} - could not parse test value from filename")
+        if not channel_data:
+            print(f"Warning: No valid measurements parsed from {txt_file.name}")
             continue
         
-        try:
-            # Get selected measurement type for this file
-            selected_type = None
-            if measurement_type_selections and str(txt_file) in measurement_type_selections:
-                selected_type = measurement_type_selections[str(txt_file)]
-            
-            # Parse the text file, passing channel from filename if available
-            channel_data = parse_text_file(txt_file, selected_measurement_type=selected_type, 
-                                          channel_from_filename=channel_from_name)
-            
-            if not channel_data:
-                print(f"Warning: No valid measurements parsed from {txt_file.name}")
+        # Process each channel found in the file
+        for channel, summary in channel_data.items():
+            if summary['n'] == 0:
                 continue
             
-            # Process each channel found in the file
-            for channel, measurements in channel_data.items():
-                if len(measurements) == 0:
-                    continue
-                
-                measurements = pd.Series(measurements).dropna()
-                
-                if len(measurements) == 0:
-                    continue
-                
-                result = {
-                    'Channel': channel,
-                    'I/O Type': 'Input',
-                    'Range Setting': range_setting if range_setting else 'N/A',
-                    f'Test Value [{unit}]': value,
-                    f'Mean [{unit}]': measurements.mean(),
-                    f'StdDev [{unit}]': measurements.std(),
-                    f'Min [{unit}]': measurements.min(),
-                    f'Max [{unit}]': measurements.max(),
-                    'Samples': len(measurements),
-                    '_range_key': range_setting
-                }
-                
-                results.append(result)
-                type_info = f" ({selected_type})" if selected_type else ""
-                print(f"Processed: {txt_file.name} - CH{channel}, {value}{unit}, Range:{range_setting or 'N/A'}, {len(measurements)} samples (Input){type_info}")
-            
-        except Exception as e:
-            print(f"Error processing {txt_file.name}: {str(e)}")
-            continue
+            row = add_result(channel, 'Input', value, range_setting)
+            stats[row] = (summary['mean'], summary['std'], summary['min'], summary['max'], summary['n'])
+            type_info = f" ({selected_type})" if selected_type else ""
+            print(f"Processed: {txt_file.name} - CH{channel}, {value}{unit}, Range:{range_setting or 'N/A'}, {summary['n']} samples (Input){type_info}")
     
-    if not results:
+    if n_results == 0:
         print("No valid results to save")
         return
     
-    # Create DataFrame and sort
-    df_results = pd.DataFrame(results)
-    df_results = df_results.sort_values(['Channel', 'I/O Type', 'Range Setting', f'Test Value [{unit}]'])
+    if sample_values:
+        samples = pd.Series(np.concatenate(sample_values), index=np.concatenate(sample_owners))
+        csv_stats = samples.groupby(level=0).agg(['mean', 'std', 'min', 'max', 'count'])
+        stats[csv_stats.index] = csv_stats.to_numpy(dtype=np.float64)
+    
+    # Create DataFrame from the filled rows, and sort
+    stats = stats[:n_results]
+    df_results = pd.DataFrame({
+        'Channel': channels[:n_results],
+        'I/O Type': io_types[:n_results],
+        'Range Setting': range_settings[:n_results],
+        f'Test Value [{unit}]': test_values[:n_results],
+        f'Mean [{unit}]': stats[:, 0],
+        f'StdDev [{unit}]': stats[:, 1],
+        f'Min [{unit}]': stats[:, 2],
+        f'Max [{unit}]': stats[:, 3],
+        'Samples': stats[:, 4].astype(np.int64),
+        '_range_key': range_keys[:n_results]
+    })
+    # The text columns sort on categorical codes; categories are sorted, so the order is the
+    # same as sorting the strings, and the columns themselves stay plain strings for the
+    # groupbys in excel_charts and html_report
+    df_results = df_results.sort_values(
+        ['Channel', 'I/O Type', 'Range Setting', f'Test Value [{unit}]'],
+        key=lambda col: col if pd.api.types.is_numeric_dtype(col) else pd.Series(pd.Categorical(col).codes, index=col.index)
+    )
     
     # Add reference value, tolerance, and limits columns
     if user_inputs:
-        def get_user_config(row):
-            test_val = row[f'Test Value [{unit}]']
-            range_key = row['_range_key']
-            io_type = row['I/O Type']
-            key = (test_val, range_key, io_type)
-            return user_inputs.get(key, {})
+        # Look up every row's user config in one pass into plain arrays, then work on whole columns.
+        # Missing range keys come back from the DataFrame as NaN and are turned back into None
+        # for the lookup.
+        n_rows = len(df_results)
+        reference = np.full(n_rows, np.nan)
+        tolerance = np.full(n_rows, np.nan)
+        range_override = np.full(n_rows, None, dtype=object)
+        range_keys = df_results['_range_key'].astype(object)
+        range_keys = range_keys.where(range_keys.notna(), None)
+        keys = zip(df_results[f'Test Value [{unit}]'], range_keys, df_results['I/O Type'])
+        for row, key in enumerate(keys):
+            cfg = user_inputs.get(key)
+            if cfg:
+                reference[row] = cfg.get('reference', np.nan)
+                tolerance[row] = cfg.get('tolerance', np.nan)
+                range_override[row] = cfg.get('range')
         
-        df_results['_config'] = df_results.apply(get_user_config, axis=1)
-        
-        df_results[f'Reference Value [{unit}]'] = df_results['_config'].apply(
-            lambda x: x.get('reference', np.nan) if x else np.nan
-        )
-        df_results[f'Tolerance [{unit}]'] = df_results['_config'].apply(
-            lambda x: x.get('tolerance', np.nan) if x else np.nan
-        )
-        
-        df_results['Range Setting'] = df_results.apply(
-            lambda row: row['_config'].get('range', row['Range Setting']) 
-                        if row['_config'] and row['_config'].get('range') is not None 
-                        else row['Range Setting'] if row['Range Setting'] != 'N/A' else 'N/A',
-            axis=1
+        df_results[f'Reference Value [{unit}]'] = reference
+        df_results[f'Tolerance [{unit}]'] = tolerance
+        df_results['Range Setting'] = np.where(
+            np.equal(range_override, None), df_results['Range Setting'], range_override
         )
         
         # Calculate limits using reference value
-        df_results[f'Lower Limit [{unit}]'] = df_results[f'Reference Value [{unit}]'] - df_results[f'Tolerance [{unit}]']
-        df_results[f'Upper Limit [{unit}]'] = df_results[f'Reference Value [{unit}]'] + df_results[f'Tolerance [{unit}]']
+        lower = df_results[f'Reference Value [{unit}]'] - df_results[f'Tolerance [{unit}]']
+        upper = df_results[f'Reference Value [{unit}]'] + df_results[f'Tolerance [{unit}]']
+        df_results[f'Lower Limit [{unit}]'] = lower
+        df_results[f'Upper Limit [{unit}]'] = upper
         
-        df_results['Mean Check'] = df_results.apply(
-            lambda row: 'PASS' if row[f'Lower Limit [{unit}]'] <= row[f'Mean [{unit}]'] <= row[f'Upper Limit [{unit}]'] else 'FAIL',
-            axis=1
+        mean = df_results[f'Mean [{unit}]']
+        two_sigma = 2*df_results[f'StdDev [{unit}]']
+        df_results['Mean Check'] = np.where((lower <= mean) & (mean <= upper), 'PASS', 'FAIL')
+        df_results['Mean±2σ Check'] = np.where(
+            (lower <= mean - two_sigma) & (mean + two_sigma <= upper), 'PASS', 'FAIL'
         )
         
-        df_results['Mean±2σ Check'] = df_results.apply(
-            lambda row: 'PASS' if (
-                row[f'Lower Limit [{unit}]'] <= (row[f'Mean [{unit}]'] - 2*row[f'StdDev [{unit}]']) and
-                (row[f'Mean [{unit}]'] + 2*row[f'StdDev [{unit}]']) <= row[f'Upper Limit [{unit}]']
-            ) else 'FAIL',
-            axis=1
-        )
-        
-        df_results = df_results.drop(columns=['_config', '_range_key'])
+        df_results = df_results.drop(columns=['_range_key'])
         
         column_order = [
             'Channel', 'I/O Type', 'Range Setting', f'Test Value [{unit}]', 
@@ -221,49 +316,57 @@ def process_files(input_dir='.', user_inputs=None, unit='V', measurement_type_se
     else:
         df_results = df_results.drop(columns=['_range_key'])
     
-    # Save to Excel
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        df_results.to_excel(writer, sheet_name='Test Results', index=False)
-        
-        worksheet = writer.sheets['Test Results']
-        worksheet.auto_filter.ref = worksheet.dimensions
-        
-        from openpyxl.styles import PatternFill, Font
-        
-        if user_inputs:
-            numeric_cols = [4, 5, 6, 7, 8, 9, 10, 11, 12]
-            samples_col = 13
-            pass_fail_cols = [14, 15]
-        else:
-            numeric_cols = [4, 5, 6, 7, 8]
-            samples_col = 9
-            pass_fail_cols = []
-        
-        for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-            for cell in row:
-                if cell.column in numeric_cols:
-                    cell.number_format = '0.000000'
-                elif cell.column == samples_col:
-                    cell.number_format = '0'
-                elif cell.column in pass_fail_cols:
-                    if cell.value == 'PASS':
-                        cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                        cell.font = Font(color='006100', bold=True)
-                    elif cell.value == 'FAIL':
-                        cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                        cell.font = Font(color='9C0006', bold=True)
-        
-        for column in worksheet.columns:
-            max_length = 0
-            column = list(column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
+    # Save to Excel, streaming the rows through a write-only workbook; number formats and
+    # PASS/FAIL styles are set on each cell as it is created
+    if user_inputs:
+        numeric_cols = [4, 5, 6, 7, 8, 9, 10, 11, 12]
+        samples_col = 13
+        pass_fail_cols = [14, 15]
+    else:
+        numeric_cols = [4, 5, 6, 7, 8]
+        samples_col = 9
+        pass_fail_cols = []
+    
+    columns = list(df_results.columns)
+    wb = Workbook(write_only=True)
+    worksheet = wb.create_sheet('Test Results')
+    
+    # Column widths come from the longest text in each column, header included
+    text_lengths = df_results.astype(str).apply(lambda col: col.str.len().max()).to_numpy()
+    widths = np.minimum(np.maximum(text_lengths, [len(str(c)) for c in columns]) + 2, 50)
+    for col_idx, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = int(width)
+    
+    worksheet.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{len(df_results) + 1}"
+    
+    header_cells = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = _HEADER_FONT
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    
+    for values in df_results.itertuples(index=False, name=None):
+        row_cells = []
+        for col_idx, value in enumerate(values, start=1):
+            if value != value:  # NaN is written as an empty cell
+                value = None
+            cell = WriteOnlyCell(worksheet, value=value)
+            if col_idx in numeric_cols:
+                cell.number_format = '0.000000'
+            elif col_idx == samples_col:
+                cell.number_format = '0'
+            elif col_idx in pass_fail_cols:
+                if value == 'PASS':
+                    cell.fill = _PASS_FILL
+                    cell.font = _PASS_FONT
+                elif value == 'FAIL':
+                    cell.fill = _FAIL_FILL
+                    cell.font = _FAIL_FONT
+            row_cells.append(cell)
+        worksheet.append(row_cells)
+    
+    wb.save(output_file)
     
     if user_inputs:
         color_assignments = create_tolerance_charts(output_file, df_results, unit)
@@ -293,16 +396,17 @@ if __name__ == "__main__":
     print("=" * 70)
     print("\nPlease select the directory containing data files...")
     
-    root = tk.Tk()
-    root.withdraw()
+    # The hidden root is shared with the configuration dialogs that follow
+    root = get_root()
     root.attributes('-topmost', True)
     
     input_dir = filedialog.askdirectory(
+        parent=root,
         title="Select Directory with CSV/TXT Files",
         initialdir=os.getcwd()
     )
     
-    root.destroy()
+    root.attributes('-topmost', False)
     
     if not input_dir:
         print("\nNo directory selected. Exiting...")
@@ -310,14 +414,19 @@ if __name__ == "__main__":
     
     print(f"\nSelected directory: {input_dir}")
     
+    # Scan the directory once; the filename metadata is reused for the unit, the
+    # configuration combinations and process_files
+    file_meta = scan_data_files(input_dir)
+    csv_meta, txt_meta = file_meta
+    
     # Determine unit from files
-    unit = get_unit_from_files(input_dir)
+    unit = get_unit_from_files(input_dir, file_meta=file_meta)
     print(f"Detected unit: {unit}")
     
     # Scan files
     print("\nScanning data files...")
-    csv_files = list(Path(input_dir).glob('*.csv'))
-    txt_files = list(Path(input_dir).glob('*.txt'))
+    csv_files = list(csv_meta)
+    txt_files = list(txt_meta)
     all_files = csv_files + txt_files
     
     if not all_files:
@@ -334,7 +443,7 @@ if __name__ == "__main__":
             if len(types) > 1:
                 print(f"  {txt_file.name}: Found multiple measurement types: {', '.join(sorted(types))}")
             else:
-                print(f"  {txt_file.name}: Found measurement type: {list(types)[0]}")
+                print(f"  {txt_file.name}: Found measurement type: {next(iter(types))}")
     
     # If any file has multiple measurement types, ask user to select
     measurement_type_selections = None
@@ -348,14 +457,12 @@ if __name__ == "__main__":
     test_value_range_io_tuples = set()
     
     # CSV files are Output devices
-    for csv_file in csv_files:
-        value, _, channel, range_setting = parse_filename(csv_file.name)
+    for value, _, channel, range_setting in csv_meta.values():
         if value is not None and channel is not None:
             test_value_range_io_tuples.add((value, range_setting, 'Output'))
     
     # TXT files are Input devices
-    for txt_file in txt_files:
-        value, _, _, range_setting = parse_filename(txt_file.name)
+    for value, _, _, range_setting in txt_meta.values():
         if value is not None:
             test_value_range_io_tuples.add((value, range_setting, 'Input'))
     
@@ -379,7 +486,8 @@ if __name__ == "__main__":
         input_dir=input_dir, 
         user_inputs=user_inputs, 
         unit=unit,
-        measurement_type_selections=measurement_type_selections
+        measurement_type_selections=measurement_type_selections,
+        file_meta=file_meta
     )
     
     print("\n" + "=" * 70)
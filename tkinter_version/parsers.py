@@ -1,6 +1,41 @@
+import io
+import math
+import mmap
+import os
 import re
+from contextlib import contextmanager
+from itertools import dropwhile, islice
 from pathlib import Path
 
+import numpy as np
+
+# Filename patterns (see parse_filename)
+_CHANNEL_RE = re.compile(r'_CH(\d+)', re.IGNORECASE)
+_RANGE_RE = re.compile(r'_R(\d+(?:\.\d+)?)(V|mV|mA|uA|A|ohm|Ohm|kOhm|MOhm)(?:_|$)', re.IGNORECASE)
+_VOLTAGE_RE = re.compile(r'(?<!R)_([mp]?\d+V\d*)(?:_|$)', re.IGNORECASE)
+_MA_RE = re.compile(r'(?<!R)_([mp]?\d+(?:\.\d+)?)\s*mA(?:_|$)', re.IGNORECASE)
+_UA_RE = re.compile(r'(?<!R)_([mp]?\d+(?:\.\d+)?)\s*uA(?:_|$)', re.IGNORECASE)
+_A_RE = re.compile(r'(?<!R|m|u)_([mp]?\d+(?:\.\d+)?)\s*A(?:_|$)', re.IGNORECASE)
+_OHMS_RE = re.compile(r'_(\d+(?:\.\d+)?)[_\s]?ohms?(?:_|$)', re.IGNORECASE)
+_GENERIC_RE = re.compile(r'_([mp]?\d+(?:\.\d+)?)_')
+
+# Text file line patterns (see scan_text_file_for_measurement_types and parse_text_file)
+_HIER_SCAN_RE = re.compile(r'\|\s+(\w+)_Ch\d+')
+_FLAT_SCAN_RE = re.compile(r'_Ch\d+::(\w+)', re.IGNORECASE)
+_SIMPLE_FLAT_RE = re.compile(r'^\s*[\d.]+\s+\S+\s+(-?\d+\.?\d*)\s*$')
+
+# Whole-file patterns; field gaps are [ \t] so a match never spans lines
+_HIER_FILE_RE = re.compile(r'\|[ \t]+(\w+)_Ch(\d+)[ \t]+(-?\d+\.?\d*)[ \t]+(\w+)')
+_HIER_DTYPE = [('type', 'O'), ('channel', 'i8'), ('value', 'f8'), ('unit', 'O')]
+_FLAT_FILE_RE = re.compile(r'^[ \t]*[\d.]+[ \t]+\S+_Ch(\d+)::(\w+)[ \t]+(-?\d+\.?\d*)', re.MULTILINE)
+_FLAT_DTYPE = [('channel', 'i8'), ('type', 'O'), ('value', 'f8')]
+# Byte-string forms, matched directly against memory-mapped files
+_HIER_FILE_RE_BYTES = re.compile(_HIER_FILE_RE.pattern.encode())
+_FLAT_FILE_RE_BYTES = re.compile(_FLAT_FILE_RE.pattern.encode(), re.MULTILINE)
+
+# Text files at least this large are memory-mapped rather than read into memory for matching
+MMAP_SIZE_THRESHOLD = 10 * 1024 * 1024
+
 def parse_filename(filename):
     """
     Extract test value, unit, channel number (if present), and range setting from filename.
@@ -13,13 +48,11 @@ def parse_filename(filename):
     name = Path(filename).stem
     
     # Extract channel pattern (e.g., CH1, CH2, CH3, CH4) - may not be present
-    channel_pattern = r'_CH(\d+)'
-    channel_match = re.search(channel_pattern, name, re.IGNORECASE)
+    channel_match = _CHANNEL_RE.search(name)
     channel_num = int(channel_match.group(1)) if channel_match else None
     
     # Extract range setting pattern (e.g., R10V, R10mA, R100ohm)
-    range_pattern = r'_R(\d+(?:\.\d+)?)(V|mV|mA|uA|A|ohm|Ohm|kOhm|MOhm)(?:_|$)'
-    range_match = re.search(range_pattern, name, re.IGNORECASE)
+    range_match = _RANGE_RE.search(name)
     
     range_setting = None
     if range_match:
@@ -28,8 +61,7 @@ def parse_filename(filename):
         range_setting = f"{range_value}{range_unit}"
     
     # Try voltage pattern first (m2V5, p7V5, 0V, 10V, 25V) - but not matching the R prefix range
-    voltage_pattern = r'(?<!R)_([mp]?\d+V\d*)(?:_|$)'
-    voltage_match = re.search(voltage_pattern, name, re.IGNORECASE)
+    voltage_match = _VOLTAGE_RE.search(name)
     
     if voltage_match:
         voltage_str = voltage_match.group(1).lower()
@@ -45,8 +77,7 @@ def parse_filename(filename):
             pass
     
     # Try milliampere pattern (e.g., 3mA, m5mA, p10mA)
-    ma_pattern = r'(?<!R)_([mp]?\d+(?:\.\d+)?)\s*mA(?:_|$)'
-    ma_match = re.search(ma_pattern, name, re.IGNORECASE)
+    ma_match = _MA_RE.search(name)
     
     if ma_match:
         value_str = ma_match.group(1)
@@ -59,8 +90,7 @@ def parse_filename(filename):
             pass
     
     # Try microampere pattern (e.g., 100uA, m50uA)
-    ua_pattern = r'(?<!R)_([mp]?\d+(?:\.\d+)?)\s*uA(?:_|$)'
-    ua_match = re.search(ua_pattern, name, re.IGNORECASE)
+    ua_match = _UA_RE.search(name)
     
     if ua_match:
         value_str = ua_match.group(1)
@@ -73,8 +103,7 @@ def parse_filename(filename):
             pass
     
     # Try ampere pattern (e.g., 1A, 2A)
-    a_pattern = r'(?<!R|m|u)_([mp]?\d+(?:\.\d+)?)\s*A(?:_|$)'
-    a_match = re.search(a_pattern, name, re.IGNORECASE)
+    a_match = _A_RE.search(name)
     
     if a_match:
         value_str = a_match.group(1)
@@ -87,8 +116,7 @@ def parse_filename(filename):
             pass
     
     # Try ohms pattern (10_ohms, 100ohms, etc.)
-    ohms_pattern = r'_(\d+(?:\.\d+)?)[_\s]?ohms?(?:_|$)'
-    ohms_match = re.search(ohms_pattern, name, re.IGNORECASE)
+    ohms_match = _OHMS_RE.search(name)
     
     if ohms_match:
         try:
@@ -98,8 +126,7 @@ def parse_filename(filename):
             pass
     
     # Try generic numeric pattern with underscore
-    generic_pattern = r'_([mp]?\d+(?:\.\d+)?)_'
-    generic_match = re.search(generic_pattern, name)
+    generic_match = _GENERIC_RE.search(name)
     
     if generic_match:
         value_str = generic_match.group(1)
@@ -113,14 +140,32 @@ def parse_filename(filename):
     
     return None, None, channel_num, range_setting
 
-def get_unit_from_files(input_dir):
+def scan_data_files(input_dir):
+    """
+    Find the CSV and TXT files in a directory and parse each filename once.
+    Returns (csv_meta, txt_meta): dicts mapping each file's Path to its parse_filename() result.
+    """
+    csv_meta = {}
+    txt_meta = {}
+    # One directory scan, bucketed by extension. Like Path.glob('*.csv'), dotfiles are included
+    # and the suffix is compared case-insensitively only where the filesystem is (os.path.normcase)
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            name = os.path.normcase(entry.name)
+            if name.endswith('.csv'):
+                csv_meta[Path(entry.path)] = parse_filename(entry.name)
+            elif name.endswith('.txt'):
+                txt_meta[Path(entry.path)] = parse_filename(entry.name)
+    return csv_meta, txt_meta
+
+def get_unit_from_files(input_dir, file_meta=None):
     """
     Determine the measurement unit from filenames.
+    file_meta is an already computed scan_data_files() result for input_dir, if any.
     """
-    all_files = list(Path(input_dir).glob('*.csv')) + list(Path(input_dir).glob('*.txt'))
+    csv_meta, txt_meta = file_meta if file_meta is not None else scan_data_files(input_dir)
     
-    for file in all_files:
-        _, unit, _, _ = parse_filename(file.name)
+    for _, unit, _, _ in [*csv_meta.values(), *txt_meta.values()]:
         if unit and unit != 'unknown':
             return unit
     
@@ -131,38 +176,109 @@ def scan_text_file_for_measurement_types(file_path):
     Scan a text file to find all unique measurement types per channel.
     Returns a set of measurement type names found (e.g., {'Voltage', 'MeanVoltage'} or {'CurVoltage'} or {'Avg'})
     """
-    measurement_types = set()
+    hierarchical_types = set()
+    flat_types = set()
     
+    # One pass over the first 500 lines, read lazily; the hierarchical format wins if present
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            for line in islice(dropwhile(str.isspace, f), 500):
+                # Hierarchical format (VIO1008 style)
+                # Pattern: |  MeasurementType_Chxx   value   unit   ...
+                match = _HIER_SCAN_RE.search(line)
+                if match:
+                    hierarchical_types.add(match.group(1))
+                    continue
+                
+                # Flat format (VT2816A/VT2516A style)
+                # Pattern: Time  Name::MeasurementType  Data
+                match = _FLAT_SCAN_RE.search(line)
+                if match:
+                    flat_types.add(match.group(1))
     except Exception:
-        return measurement_types
-    
-    lines = content.strip().split('\n')
-    
-    # Check for hierarchical format (VIO1008 style)
-    # Pattern: |  MeasurementType_Chxx   value   unit   ...
-    hierarchical_pattern = r'\|\s+(\w+)_Ch\d+'
-    for line in lines[:500]:  # Check first 500 lines
-        match = re.search(hierarchical_pattern, line)
-        if match:
-            measurement_types.add(match.group(1))
-    
-    if measurement_types:
-        return measurement_types
-    
-    # Check for flat format (VT2816A/VT2516A style)
-    # Pattern: Time  Name::MeasurementType  Data
-    flat_pattern = r'_Ch\d+::(\w+)'
-    for line in lines[:500]:
-        match = re.search(flat_pattern, line, re.IGNORECASE)
-        if match:
-            measurement_types.add(match.group(1))
-    
-    return measurement_types
+        return set()
+    
+    return hierarchical_types or flat_types
+
+def _summarize(values):
+    """Sample statistics of a float64 array, in the form parse_text_file(aggregate=True) returns."""
+    n = values.size
+    return {
+        'n': n,
+        'mean': values.mean(),
+        'std': values.std(ddof=1) if n > 1 else float('nan'),
+        'min': values.min(),
+        'max': values.max()
+    }
+
+class _RunningStats:
+    """Welford's online mean/variance with min and max, for values that arrive one at a time."""
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def summary(self):
+        return {
+            'n': self.n,
+            'mean': self.mean,
+            'std': math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else float('nan'),
+            'min': self.min,
+            'max': self.max
+        }
+
+def _values_by_channel(matches, aggregate=False):
+    """
+    Group whole-file matches into {channel: [values]}, channels in order of first appearance.
+    With aggregate, each channel maps to its _summarize() statistics instead.
+    """
+    channels = matches['channel']
+    unique, first_index = np.unique(channels, return_index=True)
+    by_channel = {}
+    for ch in unique[np.argsort(first_index)]:
+        values = matches['value'][channels == ch]
+        by_channel[int(ch)] = _summarize(values) if aggregate else values.tolist()
+    return by_channel
+
+@contextmanager
+def _map_if_large(f):
+    """Yield a read-only memory map of the open file f if it is large, otherwise None."""
+    if os.fstat(f.fileno()).st_size < MMAP_SIZE_THRESHOLD:
+        yield None
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+def _match_content(content, regexp, bytes_regexp, dtype, selected_measurement_type=None):
+    """
+    Match a whole-file pattern against the file's content (a string, or a memory map) into a
+    structured array, keeping only selected_measurement_type if given. Over a memory map the
+    bytes pattern is used and the 'type' field holds bytes.
+    """
+    if isinstance(content, str):
+        matches = np.array(regexp.findall(content), dtype=dtype)
+    else:
+        matches = np.array(bytes_regexp.findall(content), dtype=dtype)
+        if selected_measurement_type:
+            selected_measurement_type = selected_measurement_type.encode()
+    if selected_measurement_type:
+        matches = matches[matches['type'] == selected_measurement_type]
+    return matches
 
-def parse_text_file(file_path, selected_measurement_type=None, channel_from_filename=None):
+def parse_text_file(file_path, selected_measurement_type=None, channel_from_filename=None, aggregate=False):
     """
     Parse text files containing measurement data from multiple channels.
     
@@ -190,93 +306,63 @@ def parse_text_file(file_path, selected_measurement_type=None, channel_from_file
     - selected_measurement_type: If file has multiple measurement types per channel,
                                  use this one (e.g., 'Voltage' or 'MeanVoltage')
     - channel_from_filename: Channel number parsed from filename (used for format 4)
+    - aggregate: Return each channel's statistics instead of its measurements
     
-    Returns: Dictionary mapping channel numbers to lists of measurements
+    Returns: Dictionary mapping channel numbers to lists of measurements, or with aggregate
+             to dicts of 'n', 'mean', 'std' (sample, ddof=1), 'min' and 'max'
     """
-    channel_data = {}
+    values_found = []
+    running = _RunningStats()
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return channel_data
-    
-    lines = content.strip().split('\n')
-    if not lines:
-        return channel_data
-    
-    # Try hierarchical format first (VIO1008 style)
-    # Pattern: |  MeasurementType_Chxx   value   unit   value   description
-    hierarchical_pattern = r'\|\s+(\w+)_Ch(\d+)\s+(-?\d+\.?\d*)\s+(\w+)'
-    
-    hierarchical_matches = []
-    for line in lines:
-        match = re.search(hierarchical_pattern, line)
-        if match:
-            hierarchical_matches.append({
-                'type': match.group(1),
-                'channel': int(match.group(2)),
-                'value': float(match.group(3))
-            })
-    
-    if hierarchical_matches:
-        # Filter by selected measurement type if specified
-        for match in hierarchical_matches:
-            if selected_measurement_type and match['type'] != selected_measurement_type:
-                continue
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f, _map_if_large(f) as mm:
+            # The file is read once, into a string or through its memory map, and every
+            # format is tried against that same content
+            content = f.read() if mm is None else mm
             
-            channel = match['channel']
-            value = match['value']
+            # Hierarchical format (VIO1008 style), matched over the whole file at once
+            # Pattern: |  MeasurementType_Chxx   value   unit   value   description
+            matches = _match_content(content, _HIER_FILE_RE, _HIER_FILE_RE_BYTES, _HIER_DTYPE,
+                                     selected_measurement_type)
+            if len(matches):
+                return _values_by_channel(matches, aggregate)
             
-            if channel not in channel_data:
-                channel_data[channel] = []
-            channel_data[channel].append(value)
-        
-        if channel_data:
-            return channel_data
-    
-    # Try flat format with channel in name (VT2816A/VT2516A style)
-    # Pattern: Time  DeviceName_Chxx::MeasurementType  Data
-    flat_pattern = r'^\s*[\d.]+\s+\S+_Ch(\d+)::(\w+)\s+(-?\d+\.?\d*)'
-    
-    for line in lines:
-        match = re.search(flat_pattern, line)
-        if match:
-            channel = int(match.group(1))
-            meas_type = match.group(2)
-            value = float(match.group(3))
+            # Flat format with channel in name (VT2816A/VT2516A style)
+            # Pattern: Time  DeviceName_Chxx::MeasurementType  Data
+            matches = _match_content(content, _FLAT_FILE_RE, _FLAT_FILE_RE_BYTES, _FLAT_DTYPE,
+                                     selected_measurement_type)
+            if len(matches):
+                return _values_by_channel(matches, aggregate)
             
-            # Filter by selected measurement type if specified
-            if selected_measurement_type and meas_type != selected_measurement_type:
-                continue
-            
-            if channel not in channel_data:
-                channel_data[channel] = []
-            channel_data[channel].append(value)
-    
-    if channel_data:
-        return channel_data
-    
-    # Try simple flat format without channel in data (VN1630A style)
-    # Pattern: Time  Name::Type  Data  OR  Time  Name  Data
-    # Channel must come from filename
-    simple_flat_pattern = r'^\s*[\d.]+\s+\S+\s+(-?\d+\.?\d*)\s*$'
+            # Simple flat format without channel in data (VN1630A style)
+            # Pattern: Time  Name::Type  Data  OR  Time  Name  Data
+            # Channel must come from filename; a mapped file is streamed line by line instead
+            if mm is None:
+                lines = io.StringIO(content)
+            else:
+                f.seek(0)
+                lines = f
+            for line in lines:
+                match = _SIMPLE_FLAT_RE.search(line)
+                if match:
+                    try:
+                        value = float(match.group(1))
+                    except ValueError:
+                        continue
+                    # Aggregated statistics are kept up to date as values arrive, without a list
+                    if aggregate:
+                        running.add(value)
+                    else:
+                        values_found.append(value)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return {}
     
-    values_found = []
-    for line in lines:
-        match = re.search(simple_flat_pattern, line)
-        if match:
-            try:
-                value = float(match.group(1))
-                values_found.append(value)
-            except ValueError:
-                continue
-    
-    if values_found:
+    channel_data = {}
+    if values_found or running.n:
         # Use channel from filename if provided, otherwise default to channel 1
         channel = channel_from_filename if channel_from_filename is not None else 1
-        channel_data[channel] = values_found
+        channel_data[channel] = running.summary() if aggregate else values_found
         return channel_data
     
     return channel_data
@@ -33,10 +33,13 @@ CHANNEL_COLORS = [
 # HTML version with # prefix
 CHANNEL_COLORS_HEX = [f'#{c}' for c in CHANNEL_COLORS]
 
+# Version suffix of a filename stem, e.g. Report_v3
+_VERSION_SUFFIX_RE = re.compile(r'^(.+)_v(\d+)$')
+
 def get_versioned_filename(base_path):
     """
     Generate a versioned filename if the file already exists.
-    Returns the next available filename with _v2, _v3, etc.
+    Returns the filename one version past the highest existing _v2, _v3, etc.
     """
     if not os.path.exists(base_path):
         return base_path
@@ -47,8 +50,7 @@ def get_versioned_filename(base_path):
     name, ext = os.path.splitext(filename)
     
     # Check if filename already has a version suffix
-    import re
-    version_match = re.match(r'^(.+)_v(\d+)$', name)
+    version_match = _VERSION_SUFFIX_RE.match(name)
     if version_match:
         base_name = version_match.group(1)
         current_version = int(version_match.group(2))
@@ -56,11 +58,15 @@ def get_versioned_filename(base_path):
         base_name = name
         current_version = 1
     
-    # Find the next available version
-    version = current_version + 1 if current_version > 1 else 2
-    while True:
-        new_filename = f"{base_name}_v{version}{ext}"
-        new_path = os.path.join(directory, new_filename)
-        if not os.path.exists(new_path):
-            return new_path
-        version += 1
\ No newline at end of file
+    # Find the highest existing version with one directory listing; names are compared
+    # with os.path.normcase so case-insensitive filesystems are handled
+    version_pattern = re.compile(
+        rf'{re.escape(os.path.normcase(base_name))}_v(\d+){re.escape(os.path.normcase(ext))}')
+    version = current_version
+    with os.scandir(directory or '.') as entries:
+        for entry in entries:
+            match = version_pattern.fullmatch(os.path.normcase(entry.name))
+            if match:
+                version = max(version, int(match.group(1)))
+    
+    return os.path.join(directory, f"{base_name}_v{version + 1}{ext}")